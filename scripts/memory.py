@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+"""
+This is the script you can use to profile memory usage of our checker.
+
+It runs ``Checker`` over the given modules and directories
+under ``tracemalloc`` and reports:
+
+- peak and retained memory for each file
+- peak and retained memory for each visitor class
+- memory allocated by the most expensive parts of our code
+
+Usage:
+
+.. code:: python
+
+    python ./scripts/memory.py my_project/ my_test_module.py
+
+"""
+
+import ast
+import gc
+import io
+import sys
+import tokenize
+import tracemalloc
+from collections import Counter, namedtuple
+from pathlib import Path
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.options.config import Configuration
+
+#: Parts of our code we track, the first matching frame path wins.
+ALLOCATION_SITES = (
+    ('transform() metadata', 'wemake_python_styleguide/transformations/'),
+    ('violation objects', 'wemake_python_styleguide/violations/'),
+    ('scope stores', 'wemake_python_styleguide/logic/scopes.py'),
+    ('overuse dictionaries', 'visitors/ast/complexity/overuses.py'),
+)
+
+#: How many frames we store for each allocation.
+TRACEBACK_LIMIT = 25
+
+#: How many visitors we show in the report.
+TOP_VISITORS = 15
+
+
+def _default_options():
+    all_options = (*Configuration.options, *Configuration.run_options)
+    defaults = {
+        option.long_option_name[2:].replace('-', '_'): option.default
+        for option in all_options
+    }
+    return namedtuple('options', defaults.keys())(**defaults)
+
+
+class _Report(object):
+    """Collects all measurements, all values are in bytes."""
+
+    def __init__(self) -> None:
+        self.files = []
+        self.visitor_peaks = Counter()
+        self.visitor_retained = Counter()
+        self.sites = Counter()
+
+    def add_file(self, filename: str) -> None:
+        """Everything that is still allocated after a run is retained."""
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+        self.files.append((filename, peak, retained))
+
+    def add_visitor(self, visitor_name: str) -> None:
+        """Visitors are reported by their worst peak and total retained."""
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+        self.visitor_peaks[visitor_name] = max(
+            self.visitor_peaks[visitor_name], peak,
+        )
+        self.visitor_retained[visitor_name] += retained
+
+    def add_sites(self, snapshot) -> None:
+        """Groups memory that is still allocated by the parts of our code."""
+        snapshot = snapshot.filter_traces((
+            tracemalloc.Filter(
+                inclusive=False,
+                filename_pattern='*/tracemalloc.py',
+            ),
+        ))
+        for stat in snapshot.statistics('traceback'):
+            self.sites[self._allocation_site(stat.traceback)] += stat.size
+
+    def show(self) -> None:
+        """Prints the report."""
+        self._show_section('Files (peak / retained):', self.files)
+        self._show_section(
+            'Visitors (max peak / total retained):',
+            [
+                (visitor_name, peak, self.visitor_retained[visitor_name])
+                for visitor_name, peak in self.visitor_peaks.most_common(
+                    TOP_VISITORS,
+                )
+            ],
+        )
+        self._show_section(
+            'Allocation sites (allocated while alive):',
+            self.sites.most_common(),
+        )
+
+    def _allocation_site(self, traceback) -> str:
+        for site_name, path_part in ALLOCATION_SITES:
+            if any(path_part in frame.filename for frame in traceback):
+                return site_name
+        return 'other code'
+
+    def _show_section(self, title: str, rows) -> None:
+        print(title)  # noqa: T001
+        for row_title, *sizes in rows:
+            print('  {0}: {1}'.format(row_title, ' / '.join(  # noqa: T001
+                '{0:.1f} KiB'.format(size / 1024) for size in sizes
+            )))
+        print()  # noqa: T001
+
+
+def _read(filename: str):
+    with open(filename) as file_to_read:
+        file_contents = file_to_read.read()
+
+    lines = io.StringIO(file_contents)
+    return (
+        ast.parse(file_contents),
+        list(tokenize.generate_tokens(lines.readline)),
+    )
+
+
+def _run_checker(filename: str) -> None:
+    """Runs all visitors at once, just like ``flake8`` does."""
+    tree, file_tokens = _read(filename)
+    tracemalloc.clear_traces()
+    checker = Checker(tree=tree, file_tokens=file_tokens, filename=filename)
+    list(checker.run())
+
+
+def _profile_visitors(filename: str, report: _Report) -> None:
+    """Runs all visitors one by one to get their own numbers."""
+    tree, file_tokens = _read(filename)
+    tracemalloc.clear_traces()
+    checker = Checker(tree=tree, file_tokens=file_tokens, filename=filename)
+    report.add_sites(tracemalloc.take_snapshot())
+
+    for visitor_class in checker._visitors:  # noqa: WPS437
+        tracemalloc.clear_traces()
+        _run_visitor(visitor_class, checker, report)
+        report.add_visitor(visitor_class.__qualname__)
+
+
+def _run_visitor(visitor_class, checker: Checker, report: _Report) -> None:
+    visitor = visitor_class.from_checker(checker)
+    visitor.run()
+    report.add_sites(tracemalloc.take_snapshot())
+
+
+def _main(paths) -> None:
+    Checker.parse_options(_default_options())
+    tracemalloc.start(TRACEBACK_LIMIT)
+    report = _Report()
+
+    for path in map(Path, paths):
+        filenames = sorted(path.rglob('*.py')) if path.is_dir() else [path]
+        for filename in map(str, filenames):
+            _run_checker(filename)
+            report.add_file(filename)
+            _profile_visitors(filename, report)
+
+    report.show()
+
+
+if __name__ == '__main__':
+    _main(sys.argv[1:])
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+"""
+This is the script you can use to measure cost tiers of our visitors.
+
+It runs each visitor over the given modules and directories
+and compares its time with a traversal that does nothing.
+``cheap`` visitors should stay close to a single traversal.
+Run it on a huge module to find visitors that grow faster than it does.
+
+Usage:
+
+.. code:: python
+
+    python ./scripts/visitors.py my_project/ my_test_module.py
+
+"""
+
+import sys
+import time
+from pathlib import Path
+
+from wemake_python_styleguide import api
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.visitors import base
+
+#: Each visitor is timed several times, the best time is used.
+REPEATS = 3
+
+
+class _EmptyNodeVisitor(base.BaseNodeVisitor):
+    """Only traverses ``ast`` nodes."""
+
+
+class _EmptyTokenVisitor(base.BaseTokenVisitor):
+    """Only iterates over tokens."""
+
+    def visit_comment(self, token) -> None:
+        """Makes sure that tokens are visited."""
+
+
+def _time_visitor(visitor_class, checkers) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        for checker in checkers:
+            visitor_class.from_checker(checker).run()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def _report_visitor(visitor_class, checkers, empty_timing: float) -> None:
+    timing = _time_visitor(visitor_class, checkers)
+    print('{0:6.2f}x {1:8.3f}s {2:9} {3}'.format(  # noqa: T001
+        timing / empty_timing,
+        timing,
+        visitor_class.cost_tier,
+        visitor_class.__qualname__,
+    ))
+
+
+def _load_checkers(paths):
+    return [
+        api.create_checker(module_path.read_bytes(), str(module_path))
+        for path in map(Path, paths)
+        for module_path in ([path] if path.is_file() else path.rglob('*.py'))
+    ]
+
+
+def _main(paths) -> None:
+    checkers = _load_checkers(paths)
+    nodes_timing = _time_visitor(_EmptyNodeVisitor, checkers)
+    tokens_timing = _time_visitor(_EmptyTokenVisitor, checkers)
+
+    for visitor_class in Checker._visitors:  # noqa: WPS437
+        if issubclass(visitor_class, base.BaseFilenameVisitor):
+            continue  # filenames are checked only once
+
+        is_tokens = issubclass(visitor_class, base.BaseTokenVisitor)
+        _report_visitor(
+            visitor_class,
+            checkers,
+            tokens_timing if is_tokens else nodes_timing,
+        )
+
+
+if __name__ == '__main__':
+    _main(sys.argv[1:])
@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-  # noqa: WPS230
+
+"""
+This file is reported as a huge module.
+
+It is used for e2e tests with a low ``--max-module-lines``.
+"""
+
+huge_module = True
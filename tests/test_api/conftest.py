@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture()
+def event_loop():
+    """Returns a new event loop and closes it after the test."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+from functools import partial
+
+import pytest
+
+from wemake_python_styleguide import api
+from wemake_python_styleguide.checker import Checker
+
+module_code = """
+x = 1
+
+def some_function():
+    vars()
+"""
+
+
+def test_check_source():
+    """Ensures that violations are returned as records."""
+    violations = api.check_source(module_code, 'some_module.py')
+
+    assert violations == [
+        api.Violation(
+            filename='some_module.py',
+            line_number=2,
+            column_number=1,
+            code='WPS111',
+            text='Found too short name: x',
+        ),
+        api.Violation(
+            filename='some_module.py',
+            line_number=5,
+            column_number=5,
+            code='WPS421',
+            text='Found wrong function call: vars',
+        ),
+    ]
+
+
+def test_check_source_options():
+    """Ensures that options are parsed once and are not shared."""
+    Checker.parse_options(api.make_options())
+    parsed_options = Checker.options
+    options = api.make_options(min_name_length=1)
+
+    violations = api.check_source(module_code, options=options)
+    checker_class = api.get_checker_class(options)
+
+    assert api.get_checker_class(
+        api.make_options(min_name_length=1),
+    ) is checker_class
+    assert api.get_checker_class(parsed_options) is Checker
+    assert Checker.options is parsed_options
+    assert [violation.code for violation in violations] == ['WPS421']
+
+
+def test_default_options(monkeypatch):
+    """Ensures that default options are used when none were parsed."""
+    monkeypatch.setattr(Checker, 'options', None, raising=False)
+
+    violations = api.check_source(module_code)
+
+    assert Checker.options is None
+    assert api.get_checker_class().options == api.make_options()
+    assert len(violations) == 2
+
+
+def test_unknown_options():
+    """Ensures that unknown options are not ignored."""
+    with pytest.raises(TypeError, match='max_lines, unknown'):
+        api.make_options(unknown=1, max_lines=2)
+
+
+@pytest.mark.parametrize('invalid_call', [
+    partial(api.make_options, max_returns=0),
+    partial(api.check_files, ['module.py'], jobs=0),
+    partial(api.check_files, ['module.py'], jobs=-1),
+])
+def test_invalid_options(invalid_call):
+    """Ensures that option values and number of jobs are validated."""
+    with pytest.raises(ValueError):
+        invalid_call()
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_check_files(tmp_path, jobs):
+    """Ensures that files are checked, broken ones are reported."""
+    correct_module = tmp_path / 'correct.py'
+    correct_module.write_text(module_code)
+    broken_module = tmp_path / 'broken.py'
+    broken_module.write_text('\n1 +\n')
+
+    violations = api.check_files(
+        [str(tmp_path / 'missing.py'), str(correct_module), str(broken_module)],
+        jobs=jobs,
+    )
+
+    assert [violation.code for violation in violations] == [
+        'E902', 'WPS111', 'WPS421', 'E999',
+    ]
+    assert violations[0].text.startswith('FileNotFoundError: ')
+    assert violations[3].filename == str(broken_module)
+    assert violations[3].line_number == 2
+
+
+def test_check_files_scheduling(tmp_path, default_options):
+    """Ensures that scheduled files are reported in the given order."""
+    costs_file = tmp_path / 'costs.jsonl'
+    costs_file.write_text('{"filename": "unknown.py", "cost": 1}\n')
+    filenames = []
+    for lines in range(1, 6):
+        module = tmp_path / 'module{0}.py'.format(lines)
+        module.write_text('x = 1\n' * lines)
+        filenames.append(str(module))
+
+    violations = api.check_files(
+        filenames,
+        options=api.make_options(shard_costs=str(costs_file)),
+        jobs=2,
+    )
+    Checker.parse_options(default_options)
+
+    assert [violation.filename for violation in violations] == [
+        filename
+        for filename in filenames
+        for _ in range(filenames.index(filename) + 1)
+    ]
+    assert len(costs_file.read_text().splitlines()) == 6
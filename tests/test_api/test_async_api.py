@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from wemake_python_styleguide import api, async_api
+from wemake_python_styleguide.checker import Checker
+
+module_code = """
+x = 1
+
+def some_function():
+    vars()
+"""
+
+
+class _RecordingExecutor(ThreadPoolExecutor):
+    """Records filenames of all submitted calls, cancels a task if asked."""
+
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.submitted = []
+        self.task_to_cancel = None
+
+    def submit(self, function, *args, **kwargs):
+        self.submitted.append(args[1])
+        if self.task_to_cancel and len(self.submitted) == 3:
+            self.task_to_cancel.cancel()
+        return super().submit(function, *args, **kwargs)
+
+
+async def _check_concurrently(executor):
+    return await asyncio.gather(
+        async_api.check_source(
+            module_code,
+            'first_module.py',
+            options=api.make_options(min_name_length=1),
+            executor=executor,
+        ),
+        async_api.check_source(
+            module_code,
+            'second_module.py',
+            options=api.make_options(),
+            executor=executor,
+        ),
+    )
+
+
+def test_check_source(event_loop):
+    """Ensures that violations are returned as records."""
+    violations = event_loop.run_until_complete(
+        async_api.check_source(module_code, 'some_module.py'),
+    )
+
+    assert [violation.code for violation in violations] == [
+        'WPS111', 'WPS421',
+    ]
+    assert violations[0] == api.Violation(
+        filename='some_module.py',
+        line_number=2,
+        column_number=1,
+        code='WPS111',
+        text='Found too short name: x',
+    )
+    assert event_loop.run_until_complete(async_api.run_checker(
+        api.create_checker(module_code, 'some_module.py'),
+    )) == violations
+
+
+def test_check_source_cancelled(event_loop):
+    """Ensures that cancelled checks do not run the rest of visitors."""
+    executor = _RecordingExecutor()
+    task = event_loop.create_task(
+        async_api.check_source(module_code, executor=executor),
+    )
+    executor.task_to_cancel = task
+
+    with pytest.raises(asyncio.CancelledError):
+        event_loop.run_until_complete(task)
+
+    assert len(executor.submitted) == 3
+
+
+@pytest.mark.parametrize(('max_checks', 'is_sequential'), [
+    (1, True),
+    (4, False),
+])
+def test_concurrent_checks(
+    event_loop,
+    monkeypatch,
+    max_checks,
+    is_sequential,
+):
+    """Ensures that concurrent checks are limited and keep their options."""
+    monkeypatch.setattr(async_api, 'MAX_CONCURRENT_CHECKS', max_checks)
+    executor = _RecordingExecutor()
+
+    first_violations, second_violations = event_loop.run_until_complete(
+        _check_concurrently(executor),
+    )
+
+    assert is_sequential == (executor.submitted == sorted(executor.submitted))
+    assert [violation.code for violation in first_violations] == ['WPS421']
+    assert [violation.code for violation in second_violations] == [
+        'WPS111', 'WPS421',
+    ]
+
+
+def test_syntax_error(event_loop):
+    """Ensures that syntax errors are raised."""
+    with pytest.raises(SyntaxError):
+        event_loop.run_until_complete(async_api.check_source('1 +'))
+
+
+def test_default_options(event_loop, monkeypatch):
+    """Ensures that default options are used when none were parsed."""
+    monkeypatch.setattr(Checker, 'options', None, raising=False)
+
+    violations = event_loop.run_until_complete(
+        async_api.check_source(module_code),
+    )
+
+    assert Checker.options is None
+    assert len(violations) == 2
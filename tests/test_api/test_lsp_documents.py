@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from wemake_python_styleguide import api
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.constants import STDIN
+from wemake_python_styleguide.lsp.documents import Document
+
+module_code = """
+x = 1
+
+def some_function():
+    vars()
+
+
+@decorator
+def other_function():
+    return 1
+"""
+
+added_lines = """
+import os
+x = 1
+
+def some_function():
+    vars()
+
+
+@decorator
+def other_function():
+    y = 2
+    return y
+"""
+
+removed_lines = """
+def some_function():
+    vars()
+@decorator
+def other_function():
+    return 1
+"""
+
+moved_lines = """
+@decorator
+def other_function():
+    return 1
+
+x = 1
+
+def some_function():
+    vars()
+"""
+
+generated_code = """# Generated by some tool.
+x = 1
+"""
+
+module_level_code = """
+def some_function():
+    print()
+
+def other_function():
+    print()
+"""
+
+
+async def _check_all(document, sources):
+    return [await document.check(source) for source in sources]
+
+
+@pytest.mark.parametrize('sources', [
+    (module_code, module_code),
+    (module_code, added_lines, module_code),
+    (module_code, removed_lines, added_lines),
+    (module_code, moved_lines, module_code),
+    (module_code, '', module_code),
+])
+def test_incremental_checks(event_loop, default_options, sources):
+    """Ensures that incremental checks find the same violations."""
+    Checker.parse_options(default_options)
+    document = Document('file:///some/some_module.py')
+
+    all_violations = event_loop.run_until_complete(
+        _check_all(document, sources),
+    )
+
+    assert all_violations == [
+        api.check_source(source, '/some/some_module.py')
+        for source in sources
+    ]
+
+
+@pytest.mark.parametrize('invalid_source', [
+    'def',
+    'x = 1\x00',
+])
+def test_syntax_error(event_loop, default_options, invalid_source):
+    """Ensures that failed checks do not change the document."""
+    Checker.parse_options(default_options)
+    document = Document('untitled:Untitled-1')
+    violations = event_loop.run_until_complete(document.check(module_code))
+
+    with pytest.raises((SyntaxError, ValueError)):
+        event_loop.run_until_complete(document.check(invalid_source))
+
+    assert document.filename == STDIN
+    assert document.violations == violations
+    assert event_loop.run_until_complete(
+        document.check(added_lines),
+    ) == api.check_source(added_lines)
+
+
+@pytest.mark.parametrize('module_checks', ['always', 'never'])
+def test_module_checks_are_replaced(event_loop, options, module_checks):
+    """Ensures that module-level violations are checked on each change."""
+    checked_options = options(
+        diff_module_checks=module_checks,
+        max_module_members=1,
+    )
+    document = Document('file:///some/some_module.py', options=checked_options)
+    sources = (
+        module_level_code,
+        module_level_code.replace('print', 'input'),
+        module_level_code.replace('print', 'input').split('\n\n')[0],
+    )
+
+    all_violations = event_loop.run_until_complete(
+        _check_all(document, sources),
+    )
+
+    assert [
+        [violation.code for violation in violations]
+        for violations in all_violations
+    ] == [
+        ['WPS202'],
+        ['WPS202', 'WPS421', 'WPS421'],
+        ['WPS421'],
+    ]
+    assert all_violations == [
+        api.check_source(
+            source, '/some/some_module.py', options=checked_options,
+        )
+        for source in sources
+    ]
+
+
+def test_skipped_module(event_loop):
+    """Ensures that skipped modules only report that they are huge."""
+    checked_options = api.make_options(huge_module_policy='skip')
+    document = Document('untitled:Untitled-1', options=checked_options)
+
+    all_violations = event_loop.run_until_complete(_check_all(document, (
+        generated_code, generated_code.replace('x', 'y'),
+    )))
+
+    assert [
+        [violation.code for violation in violations]
+        for violations in all_violations
+    ] == [['WPS230'], ['WPS230']]
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import io
+import json
+import subprocess
+import sys
+
+import pytest
+
+from wemake_python_styleguide.formatter import DOCS_URL_TEMPLATE
+from wemake_python_styleguide.lsp import server
+from wemake_python_styleguide.lsp.protocol import read_message
+from wemake_python_styleguide.version import pkg_version
+
+uri = 'file:///some/some_module.py'
+did_open = 'textDocument/didOpen'
+did_change = 'textDocument/didChange'
+did_close = 'textDocument/didClose'
+
+
+def _message(method, **fields):
+    fields.update(jsonrpc='2.0', method=method)
+    body = json.dumps(fields).encode()
+    return 'Content-Length: {0}\r\n\r\n'.format(len(body)).encode() + body
+
+
+async def _serve(*messages):
+    output = io.BytesIO()
+    reader = asyncio.StreamReader()
+    reader.feed_data(b''.join(messages))
+    reader.feed_eof()
+    await server.LanguageServer(output).serve(reader)
+
+    reader = asyncio.StreamReader()
+    reader.feed_data(output.getvalue())
+    reader.feed_eof()
+    written = []
+    message = await read_message(reader)
+    while message is not None:
+        written.append(message)
+        message = await read_message(reader)
+    return written
+
+
+def test_requests(event_loop):
+    """Ensures that requests are answered, unknown notifications ignored."""
+    written = event_loop.run_until_complete(_serve(
+        _message('initialize', id=1, params={}),
+        _message('initialized', params={}),
+        _message('textDocument/hover', id=2, params={}),
+        _message('shutdown', id=3),
+        _message('exit'),
+        _message('shutdown', id=4),
+    ))
+
+    assert [message['id'] for message in written] == [1, 2, 3]
+    assert written[0]['result']['capabilities'] == {'textDocumentSync': 1}
+    assert written[1]['error']['message'] == (
+        'Unknown method: textDocument/hover'
+    )
+    assert written[2]['result'] is None
+
+
+@pytest.mark.parametrize(('text', 'diagnostic'), [
+    ('\nx = 1\n', {
+        'range': {
+            'start': {'line': 1, 'character': 0},
+            'end': {'line': 1, 'character': 0},
+        },
+        'severity': 2,
+        'code': 'WPS111',
+        'codeDescription': {
+            'href': DOCS_URL_TEMPLATE.format(pkg_version) +
+            'naming.html#wemake_python_styleguide.violations.naming.' +
+            'TooShortNameViolation',
+        },
+        'source': 'wemake-python-styleguide',
+        'message': 'Found too short name: x',
+    }),
+    ('def', {
+        'range': {
+            'start': {'line': 0, 'character': 3},
+            'end': {'line': 0, 'character': 3},
+        },
+        'severity': 2,
+        'code': 'E999',
+        'source': 'wemake-python-styleguide',
+        'message': 'SyntaxError: invalid syntax',
+    }),
+    ('x = 1\x00', {
+        'range': {
+            'start': {'line': 0, 'character': 0},
+            'end': {'line': 0, 'character': 0},
+        },
+        'severity': 2,
+        'code': 'E999',
+        'source': 'wemake-python-styleguide',
+        'message': 'ValueError: source code string cannot contain null bytes',
+    }),
+])
+def test_diagnostics(event_loop, text, diagnostic):
+    """Ensures that diagnostics are published with links to the docs."""
+    written = event_loop.run_until_complete(_serve(
+        _message(did_open, params={
+            'textDocument': {'uri': uri, 'version': 1, 'text': text},
+        }),
+        _message('shutdown', id=1),
+        b'Content-Length: 10\r\n\r\nnull',
+    ))
+
+    assert len(written) == 2
+    assert written[0]['params'] == {'uri': uri, 'diagnostics': [diagnostic]}
+
+
+def test_debounced_changes(event_loop):
+    """Ensures that only the last change is checked."""
+    written = event_loop.run_until_complete(_serve(
+        _message(did_open, params={
+            'textDocument': {'uri': uri, 'version': 1, 'text': 'name = 1\n'},
+        }),
+        _message(did_change, params={
+            'textDocument': {'uri': uri, 'version': 2},
+            'contentChanges': [{'text': 'x = 1\n'}],
+        }),
+        _message(did_change, params={
+            'textDocument': {'uri': uri, 'version': 3},
+            'contentChanges': [{'text': 'name = 1\nvars()\n'}],
+        }),
+        _message('shutdown', id=1),
+    ))
+
+    assert len(written) == 2
+    assert [
+        diagnostic['code']
+        for diagnostic in written[0]['params']['diagnostics']
+    ] == ['WPS421']
+
+
+def test_closed_documents(event_loop):
+    """Ensures that closed documents are not checked."""
+    written = event_loop.run_until_complete(_serve(
+        _message(did_open, params={
+            'textDocument': {'uri': uri, 'version': 1, 'text': 'x = 1\n'},
+        }),
+        _message(did_close, params={'textDocument': {'uri': uri}}),
+        _message(did_close, params={'textDocument': {'uri': uri}}),
+        _message('shutdown', id=1),
+        _message(did_open, params={
+            'textDocument': {'uri': uri, 'version': 1, 'text': 'x = 1\n'},
+        }),
+    ))
+
+    assert [message.get('params') for message in written] == [
+        {'uri': uri, 'diagnostics': []},
+        {'uri': uri, 'diagnostics': []},
+        None,
+    ]
+    assert written[-1] == {'jsonrpc': '2.0', 'id': 1, 'result': None}
+
+
+def test_main():
+    """Ensures that the server speaks over stdio."""
+    process = subprocess.run(
+        [
+            sys.executable,
+            '-c',
+            'from wemake_python_styleguide.lsp.server import main; main()',
+        ],
+        input=_message('shutdown', id=1),
+        stdout=subprocess.PIPE,
+        check=True,
+    )
+
+    assert process.stdout.endswith(b'"result": null}')
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+import gc
+
+import pytest
+
+from wemake_python_styleguide import api
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.logic import memory
+
+
+def _fail_initializer(options):
+    """Workers must not validate options again."""
+    raise AssertionError(options)
+
+
+def _get_options(_):
+    """Returns options that are used in a worker."""
+    return Checker.options.min_name_length
+
+
+def _get_young_threshold(_):
+    """Returns the threshold of young collections in a worker."""
+    return gc.get_threshold()[0]
+
+
+@pytest.mark.parametrize(('young_threshold', 'delayed_threshold'), [
+    (1, memory.CHECK_THRESHOLD),
+    (memory.CHECK_THRESHOLD + 1, memory.CHECK_THRESHOLD + 1),
+])
+def test_delayed_collections(
+    default_options,
+    young_threshold,
+    delayed_threshold,
+):
+    """Ensures that young collections are delayed only in workers."""
+    thresholds = gc.get_threshold()
+    gc.set_threshold(young_threshold, *thresholds[1:])
+
+    Checker.parse_options(default_options)
+    with memory.preloaded_pool(
+        2, _fail_initializer, Checker.options,
+    ) as pool:
+        worker_thresholds = pool.map(_get_young_threshold, range(2))
+    parent_thresholds = gc.get_threshold()
+    memory.delay_collections()
+    delayed_thresholds = gc.get_threshold()
+    gc.set_threshold(*thresholds)
+
+    assert parent_thresholds == (young_threshold, *thresholds[1:])
+    assert delayed_thresholds == (delayed_threshold, *thresholds[1:])
+    assert worker_thresholds == [delayed_threshold, delayed_threshold]
+
+
+def test_preloaded_pool(default_options):
+    """Ensures that forked workers share parsed options."""
+    Checker.parse_options(api.make_options(min_name_length=3))
+
+    with memory.preloaded_pool(
+        2, _fail_initializer, Checker.options,
+    ) as pool:
+        name_lengths = pool.map(_get_options, range(4))
+    Checker.parse_options(default_options)
+
+    assert name_lengths == [3, 3, 3, 3]
@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+
+
+@pytest.fixture()
+def parse_options(options, default_options):
+    """Parses custom checker options and then restores the default ones."""
+    yield lambda **kwargs: Checker.parse_options(options(**kwargs))
+    Checker.parse_options(default_options)
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+import ast
+import io
+import os
+import subprocess
+import tokenize
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+
+old_module = """
+def first():
+    vars(u'1')
+
+
+def second():
+    vars(3)
+"""
+
+new_module = """
+def first():
+    vars(u'1')
+
+
+def second():
+    vars(2)
+"""
+
+module_diff = """
+--- a/utils.py
++++ b/utils.py
+@@ -7 +7 @@ def second():
+-    vars(3)
++    vars(2)
+"""
+
+unparsed_options_script = """
+import ast
+from wemake_python_styleguide import api
+from wemake_python_styleguide.checker import Checker
+
+Checker.options = api.make_options()
+print(len(list(Checker(ast.parse('x = 1'), []).run())))
+"""
+
+
+def _run_checker(filename, source_code):
+    checker = Checker(
+        tree=ast.parse(source_code),
+        file_tokens=list(tokenize.generate_tokens(
+            io.StringIO(source_code).readline,
+        )),
+        filename=filename,
+    )
+    return sorted(
+        (line_number, message[:6])
+        for line_number, _, message, _ in checker.run()
+    )
+
+
+@pytest.fixture()
+def changes(tmp_path, monkeypatch, default_options):
+    """Creates a diff file in a temporary working directory."""
+    monkeypatch.chdir(tmp_path)
+    tmp_path.joinpath('changes.diff').write_text(module_diff)
+    yield 'changes.diff'
+    Checker.parse_options(default_options)
+
+
+@pytest.mark.parametrize(('module_checks', 'expected'), [
+    ('always', [(0, 'WPS100'), (7, 'WPS421')]),
+    ('skip', [(7, 'WPS421')]),
+])
+def test_changed_lines_from_file(
+    options,
+    changes,  # noqa: WPS442
+    module_checks,
+    expected,
+):
+    """Ensures that only changed lines are reported."""
+    Checker.parse_options(options(
+        diff_file=changes,
+        diff_module_checks=module_checks,
+    ))
+
+    assert _run_checker('utils.py', new_module) == expected
+
+
+def test_unchanged_file(options, changes):  # noqa: WPS442
+    """Ensures that files without changes are skipped completely."""
+    Checker.parse_options(options(diff_file=changes))
+
+    assert _run_checker('helpers.py', new_module) == []
+
+
+@pytest.mark.usefixtures('changes')
+def test_changed_lines_from_git(options):
+    """Ensures that changed lines are taken from ``git diff``."""
+    git = ['git', '-c', 'user.name=test', '-c', 'user.email=test@test.com']
+    with open('utils.py', 'w') as old_file:
+        old_file.write(old_module)
+    subprocess.run([*git, 'init', '-q'], check=True)
+    subprocess.run([*git, 'add', 'utils.py'], check=True)
+    subprocess.run([*git, 'commit', '-q', '-m', 'init'], check=True)
+    with open('utils.py', 'w') as new_file:
+        new_file.write(new_module)
+    with open('untracked.py', 'w') as untracked_file:
+        untracked_file.write(new_module)
+
+    Checker.parse_options(options(diff_revision='HEAD'))
+
+    assert _run_checker('utils.py', new_module) == [
+        (0, 'WPS100'),
+        (7, 'WPS421'),
+    ]
+    assert _run_checker('untracked.py', new_module) == [
+        (3, 'WPS302'),
+        (3, 'WPS421'),
+        (7, 'WPS421'),
+    ]
+
+
+@pytest.mark.usefixtures('changes')
+@pytest.mark.parametrize(('diff_options', 'path', 'message'), [
+    (
+        {'diff_file': 'changes.diff', 'diff_revision': 'HEAD'},
+        os.environ['PATH'],
+        'exclusive',
+    ),
+    ({'diff_revision': 'HEAD'}, os.environ['PATH'], 'git diff'),
+    ({'diff_revision': 'HEAD'}, '', 'run `git`'),
+])
+def test_invalid_sources(options, monkeypatch, diff_options, path, message):
+    """Ensures that invalid sources of changes are reported."""
+    monkeypatch.setenv('PATH', path)
+    with pytest.raises(ValueError, match=message):
+        Checker.parse_options(options(**diff_options))
+
+
+def test_options_without_parsing():
+    """Ensures that checker works when options are set directly."""
+    process = subprocess.run(
+        [
+            'python',
+            '-c',
+            unparsed_options_script,
+        ],
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+    assert process.stdout == '1\n'
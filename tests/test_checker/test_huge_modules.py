@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+import ast
+import io
+import tokenize
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+
+regular_module = """
+def some_function():
+    some_value = vars() * 1234
+    return some_value
+"""
+
+generated_module = """# -*- coding: utf-8 -*-
+# Generated by some tool. DO NOT EDIT!
+{0}""".format(regular_module)
+
+
+def _run_checker(source_code, filename='some_module.py'):
+    checker = Checker(
+        tree=ast.parse(source_code),
+        file_tokens=list(tokenize.generate_tokens(
+            io.StringIO(source_code).readline,
+        )),
+        filename=filename,
+    )
+    return sorted(violation[2] for violation in checker.run())
+
+
+@pytest.mark.parametrize(('option_values', 'reason'), [
+    ({}, 'header contains "Generated by"'),
+    ({'generated_markers': ['DO NOT EDIT']}, 'header contains "DO NOT EDIT"'),
+    ({'generated_markers': [], 'max_module_lines': 5}, '6 lines'),
+    ({'generated_markers': [], 'max_module_nodes': 5}, 'more than 5 ast'),
+])
+def test_reduced_module(parse_options, option_values, reason):
+    """Ensures that only cheap checks are run for huge modules."""
+    parse_options(**option_values)
+
+    messages = _run_checker(generated_module)
+
+    assert [message[:6] for message in messages] == [
+        'WPS230', 'WPS421', 'WPS432',
+    ]
+    assert reason in messages[0]
+
+
+def test_skipped_module(parse_options):
+    """Ensures that huge modules can be skipped completely."""
+    parse_options(huge_module_policy='skip')
+
+    messages = _run_checker(generated_module)
+
+    assert len(messages) == 1
+    assert messages[0].startswith('WPS230 ')
+
+
+def test_module_size_in_bytes(parse_options, tmp_path):
+    """Ensures that we find modules with too many bytes."""
+    parse_options(max_module_bytes=len(regular_module) - 1)
+    module_path = tmp_path.joinpath('some_module.py')
+    module_path.write_text(regular_module)
+
+    messages = _run_checker(regular_module, str(module_path))
+
+    assert messages[0].startswith('WPS230 ')
+    assert '{0} bytes'.format(len(regular_module)) in messages[0]
+
+
+@pytest.mark.parametrize(('source_code', 'option_values'), [
+    (regular_module, {}),
+    (generated_module, {'wps_mode': 'full'}),
+])
+def test_fully_checked_module(parse_options, source_code, option_values):
+    """Ensures that regular modules and ``full`` mode run all checks."""
+    parse_options(**option_values)
+
+    messages = _run_checker(source_code)
+
+    assert [message[:6] for message in messages] == [
+        'WPS331', 'WPS421', 'WPS432',
+    ]
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+import ast
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.compat.aliases import FunctionNodes
+
+regular_method = """
+class Test(object):
+    def method(self): ...
+"""
+
+async_method = """
+class Test(object):
+    async def method(self): ...
+"""
+
+decorated_classmethod = """
+class Test(object):
+    @classmethod
+    def method(cls): ...
+"""
+
+decorated_staticmethod = """
+class Test(object):
+    @property
+    @staticmethod
+    def method(): ...
+"""
+
+late_staticmethod = """
+class Test(object):
+    def method(): ...
+
+    method = staticmethod(method)
+    other = property(method)
+    value = staticmethod(other.method)
+    constant = 1
+"""
+
+implicit_classmethod = """
+class Test(object):
+    def __new__(cls): ...
+"""
+
+metaclass_method = """
+class Test(type):
+    def method(cls): ...
+"""
+
+conditional_method = """
+class Test(object):
+    if some_condition:
+        def method(self): ...
+"""
+
+custom_classmethod = """
+class Test(object):
+    @validator
+    def method(cls): ...
+"""
+
+custom_staticmethod = """
+class Test(object):
+    @helper
+    def method(): ...
+"""
+
+
+@pytest.mark.parametrize(('code', 'function_type'), [
+    (regular_method, 'method'),
+    (async_method, 'method'),
+    (decorated_classmethod, 'classmethod'),
+    (decorated_staticmethod, 'staticmethod'),
+    (late_staticmethod, 'staticmethod'),
+    (implicit_classmethod, 'classmethod'),
+    (metaclass_method, 'classmethod'),
+    (conditional_method, 'method'),
+    (custom_classmethod, 'classmethod'),
+    (custom_staticmethod, 'staticmethod'),
+])
+def test_method_types(parse_options, code, function_type):
+    """Ensures that methods are tagged with their types."""
+    parse_options(
+        wps_classmethod_decorators=('classmethod', 'validator'),
+        wps_staticmethod_decorators=('staticmethod', 'helper'),
+    )
+    checker = Checker(tree=ast.parse(code), file_tokens=[])
+
+    methods = [
+        node
+        for node in ast.walk(checker.tree)
+        if isinstance(node, FunctionNodes)
+    ]
+
+    assert len(methods) == 1
+    assert methods[0].wps_function_type == function_type
+
+
+def test_default_decorators(parse_options):
+    """Ensures that only builtin decorators are respected by default."""
+    parse_options()
+    checker = Checker(tree=ast.parse(custom_classmethod), file_tokens=[])
+
+    method = checker.tree.body[0].body[0]
+
+    assert method.wps_function_type == 'method'
+
+
+def test_functions_are_not_tagged(parse_options):
+    """Ensures that regular functions are not tagged."""
+    parse_options()
+    checker = Checker(tree=ast.parse('def function(): ...'), file_tokens=[])
+
+    assert getattr(checker.tree.body[0], 'wps_function_type', None) is None
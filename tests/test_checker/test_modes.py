@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+import ast
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+
+module_code = """
+def some_function():
+    some_value = vars() * 1234
+    return some_value
+"""
+
+
+@pytest.mark.parametrize(('wps_mode', 'expected'), [
+    ('fast', ['WPS421', 'WPS432']),
+    ('default', ['WPS331', 'WPS421', 'WPS432']),
+    ('full', ['WPS331', 'WPS421', 'WPS432']),
+])
+def test_wps_mode(parse_options, wps_mode, expected):
+    """Ensures that expensive checks are skipped in fast mode."""
+    parse_options(wps_mode=wps_mode)
+    checker = Checker(
+        tree=ast.parse(module_code),
+        file_tokens=[],
+        filename='some_module.py',
+    )
+
+    codes = [violation[2][:6] for violation in checker.run()]
+
+    assert sorted(codes) == expected
+
+
+def test_cost_tiers():
+    """Ensures that only quadratic visitors are skipped in fast mode."""
+    expensive_visitors = {
+        visitor_class.__qualname__
+        for visitor_class in Checker._visitors  # noqa: WPS437
+        if visitor_class.cost_tier == 'expensive'
+    }
+
+    assert expensive_visitors == {
+        'BlockVariableVisitor',
+        'ClassAttributeVisitor',
+        'ConsistentReturningVariableVisitor',
+        'ExpressionOveruseVisitor',
+    }
+    assert {
+        visitor_class.cost_tier
+        for visitor_class in Checker._visitors  # noqa: WPS437
+    } == {'cheap', 'expensive'}
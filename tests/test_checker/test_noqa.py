@@ -18,6 +18,8 @@ import subprocess
 import types
 from collections import Counter
 
+import pytest
+
 ERROR_PATTERN = re.compile(r'(WPS\d{3})')
 IGNORED_VIOLATIONS = (
     'WPS202',  # since our test case is complex, that's fine
@@ -70,6 +72,7 @@ SHOULD_BE_RAISED = types.MappingProxyType({
     'WPS227': 1,
     'WPS228': 1,
     'WPS229': 1,
+    'WPS230': 0,  # it is tested with a separate fixture, see below
 
     'WPS300': 1,
     'WPS301': 1,
@@ -260,6 +263,34 @@ def test_noqa_fixture(absolute_path):
     assert stdout.count('WPS') == 0
 
 
+@pytest.mark.parametrize(('noqa_options', 'huge_modules'), [
+    ([], 0),
+    (['--disable-noqa'], 1),
+])
+def test_noqa_huge_module(absolute_path, noqa_options, huge_modules):
+    """End-to-End test to check that `noqa` works for huge modules."""
+    process = subprocess.Popen(
+        [
+            'flake8',
+            '--isolated',
+            '--select',
+            'WPS',
+            '--max-module-lines',
+            '1',
+            *noqa_options,
+            absolute_path('fixtures', 'noqa_huge_module.py'),
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        encoding='utf8',
+    )
+    stdout, _ = process.communicate()
+
+    assert stdout.count('WPS') == huge_modules
+    assert stdout.count(':1:1: WPS230 ') == huge_modules
+
+
 def test_noqa_fixture_without_ignore(absolute_path):
     """End-to-End test to check that `noqa` works without ignores."""
     process = subprocess.Popen(
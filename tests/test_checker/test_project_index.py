@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+import ast
+import io
+import tokenize
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.logic.project.index import ProjectIndex
+
+package_init = """
+from .models import User
+
+__all__ = ('User',)
+"""
+
+models_module = """
+import os.path
+from typing import List
+
+
+class User(object):
+    def save(self):
+        return os.path.join('a', 'b')
+
+
+def _private():
+    ...
+"""
+
+views_module = """
+from ..app.models import User
+from . import forms
+
+title: str = 'Users'
+forms.register(User)
+"""
+
+
+@pytest.fixture()
+def project(tmp_path, monkeypatch, default_options):
+    """Creates a project with several modules and an index directory."""
+    monkeypatch.chdir(tmp_path)
+    for module_path, source_code in (
+        ('app/__init__.py', package_init),
+        ('app/models.py', models_module),
+        ('web/views.py', views_module),
+    ):
+        tmp_path.joinpath(module_path).parent.mkdir(exist_ok=True)
+        tmp_path.joinpath(module_path).write_text(source_code)
+    yield tmp_path
+    Checker.parse_options(default_options)
+
+
+@pytest.fixture()
+def project_index(project, parse_options):  # noqa: WPS442
+    """Checks all modules of a project and returns the created index."""
+    parse_options(project_index='index')
+    for module_path in ('app/__init__.py', 'app/models.py', 'web/views.py'):
+        source_code = project.joinpath(module_path).read_text()
+        checker = Checker(
+            tree=ast.parse(source_code),
+            file_tokens=list(tokenize.generate_tokens(
+                io.StringIO(source_code).readline,
+            )),
+            filename=module_path,
+        )
+        list(checker.run())
+    return ProjectIndex('index')
+
+
+@pytest.mark.parametrize('index_directory', [
+    None,
+    'index',
+])
+def test_project_index_visitors(
+    project,  # noqa: WPS442
+    parse_options,
+    index_directory,
+):
+    """Ensures that all visitors have access to the optional index."""
+    parse_options(project_index=index_directory)
+    checker = Checker(tree=ast.parse(''), file_tokens=[], filename='stdin')
+
+    for visitor_class in checker._visitors:  # noqa: WPS437
+        visitor = visitor_class.from_checker(checker)
+        assert visitor.project_index is Checker.project_index
+    assert project.joinpath('index').exists() == bool(index_directory)
+
+
+@pytest.mark.parametrize(('module_name', 'exports', 'imports'), [
+    ('app', 'User', 'app.models'),
+    ('app.models', 'List User os', 'os.path typing'),
+    ('web.views', 'User forms title', 'app.models web.forms'),
+])
+def test_project_index_modules(
+    project_index,  # noqa: WPS442
+    module_name,
+    exports,
+    imports,
+):
+    """Ensures that modules are indexed with their names and exports."""
+    module = project_index.get_module(module_name)
+
+    assert module.exports == tuple(exports.split())
+    assert module.imports == tuple(imports.split())
+
+
+def test_project_index_queries(project, project_index):  # noqa: WPS442
+    """Ensures that the index can be queried for modules and importers."""
+    project.joinpath('index', 'unfinished.tmp').write_text('')
+    project.joinpath('index', 'broken.json').write_text('{')
+    project.joinpath('index', 'old.json').write_text('{"name": "old"}')
+
+    assert project_index.get_module('web.forms') is None
+    assert [module.name for module in project_index.iter_modules()] == [
+        'app', 'app.models', 'web.views',
+    ]
+    assert [
+        module.name for module in project_index.get_importers('app.models')
+    ] == ['app', 'web.views']
+
+    project.joinpath('web/views.py').unlink()
+    assert [
+        module.name
+        for module in ProjectIndex('index').get_importers('app.models')
+    ] == ['app']
+
+
+def test_project_index_unchanged(project, project_index):  # noqa: WPS442
+    """Ensures that unchanged modules are not written again."""
+    index_file = project.joinpath('index', 'app.models.json')
+    index_file.write_text(index_file.read_text().replace('"User"', '"Old"'))
+
+    module = ProjectIndex('index').update(
+        ast.parse(models_module),
+        list(tokenize.generate_tokens(io.StringIO(models_module).readline)),
+        'app/models.py',
+    )
+    assert module.exports == ('List', 'Old', 'os')
+    assert (module.lines, module.classes, module.functions) == (12, 1, 2)
+
+    changed_module = '{0}\nx = 1\n'.format(models_module)
+    module = ProjectIndex('index').update(
+        ast.parse(models_module),
+        list(tokenize.generate_tokens(io.StringIO(changed_module).readline)),
+        'app/models.py',
+    )
+    assert module.exports == ('List', 'User', 'os')
+
+
+@pytest.mark.parametrize('filename', [
+    'stdin',
+    '-',
+    'app/missing.py',
+])
+def test_project_index_not_files(
+    project,  # noqa: WPS442
+    parse_options,
+    filename,
+):
+    """Ensures that sources without files are not indexed."""
+    parse_options(project_index='index')
+    project_index = ProjectIndex('index')  # noqa: WPS442
+
+    assert project_index.update(ast.parse(''), [], filename) is None
+    assert not list(project_index.iter_modules())
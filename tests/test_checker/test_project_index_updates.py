@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+import ast
+import io
+import os
+import tokenize
+from pathlib import Path
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.logic.project.index import ProjectIndex
+
+project_modules = (
+    ('app/__init__.py', 'from . import models'),
+    ('app/models.py', 'import typing'),
+    ('web.py', 'from app.models import typing'),
+)
+
+
+def _index_module(project_index, module_path, source_code):
+    """Writes a module and updates it in the index."""
+    Path(module_path).write_text(source_code)
+    return project_index.update(
+        ast.parse(source_code),
+        list(tokenize.generate_tokens(io.StringIO(source_code).readline)),
+        module_path,
+    )
+
+
+@pytest.fixture()
+def project_index(tmp_path, monkeypatch):
+    """Creates an index of a small project."""
+    monkeypatch.chdir(tmp_path)
+    tmp_path.joinpath('app').mkdir()
+    project_index = ProjectIndex('index')  # noqa: WPS442
+    for module_path, source_code in project_modules:
+        _index_module(project_index, module_path, source_code)
+    return project_index
+
+
+@pytest.mark.parametrize(('index_content', 'importers'), [
+    (None, ['app', 'web']),
+    ('', ['web']),
+    ('{"name": "app"', ['web']),
+    ('{"name": "app"}', ['web']),
+    ('[]', ['web']),
+    ('\udcff', ['web']),
+])
+def test_importers_updated(
+    tmp_path,
+    project_index,  # noqa: WPS442
+    index_content,
+    importers,
+):
+    """Ensures that importers are updated and unreadable modules reindexed."""
+    if index_content is not None:
+        tmp_path.joinpath('index', 'app.json').write_text(
+            index_content, errors='surrogateescape',
+        )
+    project_index = ProjectIndex('index')  # noqa: WPS442
+    assert importers == [
+        module.name for module in project_index.get_importers('app.models')
+    ]
+
+    module = _index_module(project_index, 'app/__init__.py', 'import typing')
+
+    assert [
+        module.name for module in project_index.get_importers('typing')
+    ] == ['app', 'app.models']
+    assert [
+        module.name for module in project_index.get_importers('app.models')
+    ] == ['web']
+    assert ProjectIndex('index').get_module('app') == module
+
+
+def test_skipped_modules(
+    project_index,  # noqa: WPS442
+    parse_options,
+    default_options,
+):
+    """Ensures that skipped modules are not indexed."""
+    parse_options(project_index='index')
+    Path('skipped.py').write_text('import typing')
+    checker = Checker(
+        tree=ast.parse('import typing'),
+        file_tokens=[],
+        filename='skipped.py',
+        changed_lines=set(),
+    )
+    list(checker.run())
+    Checker.parse_options(default_options)
+
+    assert [
+        module.name for module in project_index.get_importers('typing')
+    ] == ['app.models']
+
+
+@pytest.mark.parametrize(('age', 'is_removed'), [
+    (0, False),
+    (60 * 60, True),
+])
+def test_stale_files(tmp_path, project_index, age, is_removed):  # noqa: WPS442
+    """Ensures that temporary files left by crashes are removed."""
+    temp_file = tmp_path.joinpath('index', 'unfinished.tmp')
+    temp_file.write_text('')
+    temp_directory = tmp_path.joinpath('index', 'directory.tmp')
+    temp_directory.mkdir()
+    modified = temp_file.stat().st_mtime - age
+    for temp_path in (temp_file, temp_directory):
+        os.utime(str(temp_path), (modified, modified))
+
+    ProjectIndex('index')
+
+    assert temp_file.exists() != is_removed
+    assert temp_directory.exists()
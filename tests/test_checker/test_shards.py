@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+import ast
+import hashlib
+import json
+import multiprocessing
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+
+filenames = ['module{0}.py'.format(index) for index in range(10)]
+
+
+def _checked_modules(filenames):  # noqa: WPS442
+    """Returns modules that are checked in the current shard."""
+    return {
+        filename
+        for filename in filenames
+        if list(Checker(ast.parse('x = 1'), [], filename).run())
+    }
+
+
+def _read_costs(costs_file):
+    """Returns recorded costs lines."""
+    return [
+        json.loads(cost_line)
+        for cost_line in costs_file.read_text().splitlines()
+    ]
+
+
+def test_shards_are_disjoint(parse_options):
+    """Ensures that each module is checked in exactly one shard."""
+    shards = []
+    for index in range(1, 4):
+        parse_options(shard='{0}/3'.format(index))
+        shards.append(_checked_modules(filenames))
+
+    assert all(shards)
+    assert sorted(module for shard in shards for module in shard) == sorted(
+        filenames,
+    )
+
+
+def _write_costs(costs_file):
+    """Writes costs of the last run, each shard has its own copy."""
+    costs_file.write_text(''.join(
+        '{0}\n'.format(json.dumps({'filename': filename, 'cost': cost}))
+        for filename, cost in (('huge.py', 9.5), ('a.py', 4.5), ('b.py', 5))
+    ))
+    return str(costs_file)
+
+
+def test_shards_are_balanced(parse_options, tmp_path):
+    """Ensures that known costs are balanced between shards."""
+    first_costs = _write_costs(tmp_path / 'first')
+    costs_hash = hashlib.sha256(
+        tmp_path.joinpath('first').read_bytes(),
+    ).hexdigest()[:8]
+
+    parse_options(
+        shard='1/2@{0}'.format(costs_hash),
+        shard_costs=first_costs,
+    )
+    first_shard = _checked_modules(['huge.py', 'a.py', 'b.py'])
+    parse_options(
+        shard='2/2@{0}'.format(costs_hash),
+        shard_costs=_write_costs(tmp_path / 'second'),
+    )
+    second_shard = _checked_modules(['huge.py', 'a.py', 'b.py'])
+
+    assert first_shard == {'huge.py'}
+    assert second_shard == {'a.py', 'b.py'}
+    assert _read_costs(tmp_path / 'first')[-1]['filename'] == 'huge.py'
+    assert _read_costs(tmp_path / 'second')[-1]['filename'] == 'b.py'
+    with pytest.raises(ValueError, match='has sha256 hash'):
+        parse_options(
+            shard='1/2@{0}'.format(costs_hash),
+            shard_costs=first_costs,
+        )
+
+
+def test_costs_are_recorded(parse_options, tmp_path, monkeypatch):
+    """Ensures that costs are appended and compacted only by the parent."""
+    costs_file = tmp_path / 'costs.jsonl'
+    parse_options(shard_costs=str(costs_file))
+    _checked_modules(['./a.py', 'b.py'])
+    _checked_modules(['a.py'])
+
+    assert [cost['filename'] for cost in _read_costs(costs_file)] == [
+        'a.py', 'b.py', 'a.py',
+    ]
+
+    with costs_file.open('a') as broken_costs:
+        broken_costs.write('[]\n{"filename": "c.py", "cost": "1"}\n{"fi')
+    costs = costs_file.read_text()
+    with monkeypatch.context() as pool_worker:
+        pool_worker.setattr(
+            multiprocessing.current_process(), 'daemon', value=True,
+        )
+        parse_options(shard_costs=str(costs_file))
+    assert costs_file.read_text() == costs
+
+    parse_options(shard_costs=str(costs_file))
+
+    assert [cost['filename'] for cost in _read_costs(costs_file)] == [
+        'a.py', 'b.py',
+    ]
+
+
+@pytest.mark.parametrize('shard', [
+    '0/2',
+    '3/2',
+    '1',
+    '1/',
+    'a/b',
+    '-1/2',
+    '1/2@',
+    '1/2@XYZ',
+    '1/2@a/b',
+])
+def test_invalid_shard(parse_options, shard):
+    """Ensures that shards are validated."""
+    with pytest.raises(ValueError, match='shard'):
+        parse_options(shard=shard)
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+import ast
+import io
+import tokenize
+import types
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+
+module_with_noqa = """
+def first():
+    vars(1)  # noqa: WPS421
+
+
+def second():
+    vars(2)  # noqa:WPS4,Z
+
+
+def third():
+    vars(3)  # noqa: WPS100 and some text
+
+
+def fourth():
+    vars(4)  # NOQA
+
+
+def fifth():
+    vars('# noqa: WPS100')  # noqa: WPS421
+"""
+
+
+def _run_checker(source_code):
+    checker = Checker(
+        tree=ast.parse(source_code),
+        file_tokens=list(tokenize.generate_tokens(
+            io.StringIO(source_code).readline,
+        )),
+    )
+    return sorted(
+        (line_number, message[:6])
+        for line_number, _, message, _ in checker.run()
+    )
+
+
+@pytest.mark.parametrize(('disable_noqa', 'reported_lines'), [
+    (None, [11, 19]),
+    (False, [11, 19]),
+    (True, [3, 7, 11, 15, 19]),
+])
+def test_suppressed_codes(
+    default_options,
+    parse_options,
+    disable_noqa,
+    reported_lines,
+):
+    """Ensures that codes ignored with `noqa` are dropped by the checker."""
+    Checker.parse_options(types.SimpleNamespace(
+        **default_options._asdict(),  # noqa: WPS437
+        disable_noqa=disable_noqa,
+    ))
+
+    assert _run_checker(module_with_noqa) == [
+        (line_number, 'WPS421') for line_number in reported_lines
+    ]
@@ -257,3 +257,85 @@ https://wemake-python-stylegui.de/en/xx.xx/pages/usage/violations/
 '''
 
 snapshots['test_formatter_correct[cli_options2-with_source] formatter_correct_with_source'] = ''
+
+snapshots['test_formatter[cli_options5-statistic_by_count] formatter_statistic_by_count'] = '''
+\x1b[4m\x1b[1m./tests/fixtures/formatter1.py\x1b[0m\x1b[0m
+  1:1      WPS111 Found too short name: s
+  1:7      WPS110 Found wrong variable name: handle
+  2:21     WPS432 Found magic number: 200
+  2:21     WPS303 Found underscored number: 2_00
+
+\x1b[4m\x1b[1m./tests/fixtures/formatter2.py\x1b[0m\x1b[0m
+  1:1      WPS110 Found wrong variable name: data
+  1:10     WPS110 Found wrong variable name: param
+  2:12     WPS437 Found protected attribute usage: _protected
+  2:31     WPS303 Found underscored number: 10_00
+
+\x1b[1mWPS110\x1b[0m: Found wrong variable name: handle
+  2     ./tests/fixtures/formatter2.py
+  1     ./tests/fixtures/formatter1.py
+\x1b[4mTotal: 3\x1b[0m
+
+\x1b[1mWPS303\x1b[0m: Found underscored number: 2_00
+  1     ./tests/fixtures/formatter1.py
+  1     ./tests/fixtures/formatter2.py
+\x1b[4mTotal: 2\x1b[0m
+
+\x1b[1mWPS111\x1b[0m: Found too short name: s
+  1     ./tests/fixtures/formatter1.py
+\x1b[4mTotal: 1\x1b[0m
+
+\x1b[1mWPS432\x1b[0m: Found magic number: 200
+  1     ./tests/fixtures/formatter1.py
+\x1b[4mTotal: 1\x1b[0m
+
+\x1b[1mWPS437\x1b[0m: Found protected attribute usage: _protected
+  1     ./tests/fixtures/formatter2.py
+\x1b[4mTotal: 1\x1b[0m
+
+
+\x1b[4m\x1b[1mAll errors: 8\x1b[0m\x1b[0m
+
+Full list of violations and explanations:
+https://wemake-python-stylegui.de/en/xx.xx/pages/usage/violations/
+'''
+
+snapshots['test_formatter[cli_options6-statistic_with_limit] formatter_statistic_with_limit'] = '''
+\x1b[4m\x1b[1m./tests/fixtures/formatter1.py\x1b[0m\x1b[0m
+  1:1      WPS111 Found too short name: s
+  1:7      WPS110 Found wrong variable name: handle
+  2:21     WPS432 Found magic number: 200
+  2:21     WPS303 Found underscored number: 2_00
+
+\x1b[4m\x1b[1m./tests/fixtures/formatter2.py\x1b[0m\x1b[0m
+  1:1      WPS110 Found wrong variable name: data
+  1:10     WPS110 Found wrong variable name: param
+  2:12     WPS437 Found protected attribute usage: _protected
+  2:31     WPS303 Found underscored number: 10_00
+
+\x1b[1mWPS110\x1b[0m: Found wrong variable name: handle
+  1     ./tests/fixtures/formatter1.py
+\x1b[4mTotal: 3\x1b[0m
+
+\x1b[1mWPS111\x1b[0m: Found too short name: s
+  1     ./tests/fixtures/formatter1.py
+\x1b[4mTotal: 1\x1b[0m
+
+\x1b[1mWPS303\x1b[0m: Found underscored number: 2_00
+  1     ./tests/fixtures/formatter1.py
+\x1b[4mTotal: 2\x1b[0m
+
+\x1b[1mWPS432\x1b[0m: Found magic number: 200
+  1     ./tests/fixtures/formatter1.py
+\x1b[4mTotal: 1\x1b[0m
+
+\x1b[1mWPS437\x1b[0m: Found protected attribute usage: _protected
+  1     ./tests/fixtures/formatter2.py
+\x1b[4mTotal: 1\x1b[0m
+
+
+\x1b[4m\x1b[1mAll errors: 8\x1b[0m\x1b[0m
+
+Full list of violations and explanations:
+https://wemake-python-stylegui.de/en/xx.xx/pages/usage/violations/
+'''
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+
+import subprocess
+
+
+def test_invalid_formatter_options(absolute_path):
+    """End-to-End test to check formatter option validation works."""
+    process = subprocess.Popen(
+        [
+            'flake8',
+            '--isolated',
+            '--select',
+            'WPS',
+            '--format',
+            'wemake',
+            '--max-statistics-files',
+            '-1',  # should not be negative
+            absolute_path('fixtures', 'noqa.py'),
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        encoding='utf8',
+    )
+    _, stderr = process.communicate()
+
+    assert process.returncode == 1
+    assert 'ValueError' in stderr
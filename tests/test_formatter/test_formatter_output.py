@@ -43,6 +43,8 @@ def _safe_output(output: str) -> str:
     (['--show-source'], 'with_source'),
     (['--show-source', '--statistic'], 'with_source_statistic'),
     (['--statistic', '--show-source'], 'statistic_with_source'),
+    (['--statistic', '--sort-statistics', 'count'], 'statistic_by_count'),
+    (['--statistic', '--max-statistics-files', '1'], 'statistic_with_limit'),
 ])
 def test_formatter(snapshot, cli_options, output):
     """
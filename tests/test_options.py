@@ -2,17 +2,19 @@
 
 from wemake_python_styleguide.options.config import Configuration
 
+_all_options = (*Configuration.options, *Configuration.run_options)
+
 
 def test_option_docs():
     """Ensures that all options are documented."""
-    for option in Configuration.options:
+    for option in _all_options:
         option_name = '``{0}``'.format(option.long_option_name[2:])
         assert option_name in Configuration.__doc__
 
 
 def test_option_help():
     """Ensures that all options has help."""
-    for option in Configuration.options:
+    for option in _all_options:
         assert len(option.help) > 10
         assert '%default' in option.help
         assert option.help.split(' Defaults to:')[0].endswith('.')
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+import subprocess
+
+from wemake_python_styleguide import api, staged
+from wemake_python_styleguide.checker import Checker
+
+staged_sources = {
+    'package/module.py': b'x = 1\n',
+    'package/encoded.py': b'# -*- coding: latin-1 -*-\n\nname = "\xe9"\n',
+    'broken.py': b'def\n',
+    'readme.txt': b'x = 1\n',
+}
+
+missing_blob = '100644,1234567890123456789012345678901234567890,missing.py'
+
+
+def _git(*arguments):
+    subprocess.run(['git', *arguments], check=True)
+
+
+def _create_repository(directory):
+    _git('init', '--quiet')
+    (directory / 'package').mkdir()
+    (directory / 'link.py').symlink_to('package/module.py')
+    for filename, source in staged_sources.items():
+        (directory / filename).write_bytes(source)
+    _git('add', '.')
+
+    (directory / 'package' / 'module.py').write_text('some_name = 1\n')
+    (directory / 'unstaged.py').write_text('x = 1\n')
+
+
+def test_check_staged(tmp_path, monkeypatch):
+    """Ensures that staged contents are checked with original paths."""
+    monkeypatch.chdir(tmp_path)
+    _create_repository(tmp_path)
+    _git('update-index', '--add', '--cacheinfo', missing_blob)
+
+    assert staged.check_staged() == [
+        api.Violation(
+            filename='broken.py',
+            line_number=1,
+            column_number=4,
+            code='E999',
+            text='SyntaxError: invalid syntax',
+        ),
+        api.Violation(
+            filename='missing.py',
+            line_number=0,
+            column_number=1,
+            code='E902',
+            text='FileNotFoundError: Staged blob is missing',
+        ),
+        api.Violation(
+            filename='package/module.py',
+            line_number=1,
+            column_number=1,
+            code='WPS111',
+            text='Found too short name: x',
+        ),
+    ]
+
+
+def test_relative_paths(tmp_path, monkeypatch, capsys, default_options):
+    """Ensures that only files inside the current directory are checked."""
+    monkeypatch.chdir(tmp_path)
+    _create_repository(tmp_path)
+    monkeypatch.chdir(tmp_path / 'package')
+
+    assert staged.main([]) == 1
+    Checker.parse_options(default_options)
+    assert capsys.readouterr().out == (
+        'module.py:1:1: WPS111 Found too short name: x\n'
+    )
+
+
+def test_nothing_staged(tmp_path, monkeypatch, capsys, default_options):
+    """Ensures that nothing is reported without staged files."""
+    monkeypatch.chdir(tmp_path)
+    _create_repository(tmp_path)
+    _git('reset', '--quiet')
+
+    assert staged.main([]) == 0
+    Checker.parse_options(default_options)
+    assert capsys.readouterr().out == ''
+
+
+def test_configuration(tmp_path, monkeypatch, capsys, default_options):
+    """Ensures that options are read from the configuration and arguments."""
+    monkeypatch.chdir(tmp_path)
+    _create_repository(tmp_path)
+    tmp_path.joinpath('setup.cfg').write_text(
+        '[flake8]\nmin-name-length = 1\n',
+    )
+
+    assert staged.main(['--max-line-complexity', '1']) == 1
+    Checker.parse_options(default_options)
+    assert [
+        violation.split()[:2]
+        for violation in capsys.readouterr().out.splitlines()
+    ] == [
+        ['broken.py:1:4:', 'E999'],
+        ['package/encoded.py:3:1:', 'WPS221'],
+        ['package/module.py:1:1:', 'WPS221'],
+    ]
+
+
+def test_excluded_and_ignored(tmp_path, monkeypatch, capsys, default_options):
+    """Ensures that excluded files and ignored codes are not reported."""
+    monkeypatch.chdir(tmp_path)
+    _create_repository(tmp_path)
+    tmp_path.joinpath('setup.cfg').write_text(
+        '[flake8]\n' +
+        'exclude = broken.py\n' +
+        'extend-ignore = WPS111\n' +
+        'per-file-ignores = package/encoded.py: WPS221\n',
+    )
+
+    assert staged.main(['--max-line-complexity', '1']) == 1
+    Checker.parse_options(default_options)
+    assert capsys.readouterr().out.splitlines() == [
+        'package/module.py:1:1: WPS221 Found line with high Jones ' +
+        'Complexity: 3',
+    ]
@@ -17,6 +17,7 @@ if_with_chained_compares3 = 'if -1 > {0} > {1} > 0: ...'
     ('first_name', 'second_name'),
     ('first_name', 1),
     (1, 'first_name'),
+    ('{[1]: 2}', '{(1, [2])}'),
 ])
 def test_non_literal(
     assert_errors,
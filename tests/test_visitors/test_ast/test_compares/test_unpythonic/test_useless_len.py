@@ -54,6 +54,8 @@ def test_useless_len_call(
     'len(some) < 4',
     'len(some) == 10',
     'len(some) != 6',
+    'len(some) == -some_value',
+    'len(some) == ~0',
 ])
 def test_correct_len_call(
     assert_errors,
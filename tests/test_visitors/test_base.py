@@ -1,14 +1,32 @@
 # -*- coding: utf-8 -*-
 
+import ast
+import io
+import tokenize
 from unittest.mock import MagicMock
 
 import pytest
 
 from wemake_python_styleguide import constants
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.compat.nodes import Constant
+from wemake_python_styleguide.compat.routing import route_constant
 from wemake_python_styleguide.visitors.base import (
     BaseFilenameVisitor,
+    BaseNodeVisitor,
+    BaseTokenVisitor,
     BaseVisitor,
 )
+from wemake_python_styleguide.visitors.tokenize.comments import (
+    WrongCommentVisitor,
+)
+
+
+class _NamesVisitor(BaseTokenVisitor):
+    """Has a token handler."""
+
+    def visit_name(self, token: tokenize.TokenInfo) -> None:
+        """Does nothing."""
 
 
 def test_visitor_raises_not_implemented(default_options):
@@ -30,3 +48,63 @@ def test_base_filename_run_do_not_call_visit(default_options):
     instance.run()
 
     instance.visit_filename.assert_not_called()
+
+
+@pytest.mark.parametrize(('constant_value', 'handler_name'), [
+    ('string', 'visit_Str'),
+    (b'bytes', 'visit_Bytes'),
+    (1, 'visit_Num'),
+    (1.5, 'visit_Num'),
+    (1j, 'visit_Num'),
+    (True, 'visit_NameConstant'),
+    (None, 'visit_NameConstant'),
+    (..., 'visit_Ellipsis'),
+    (frozenset(), 'generic_visit'),
+])
+def test_base_node_visitor_constants(
+    default_options,
+    constant_value,
+    handler_name,
+):
+    """Ensures that python3.8+ constants are routed to their handlers."""
+    constant = Constant(value=constant_value)
+    instance = BaseNodeVisitor(default_options, tree=constant)
+    constant_handler = MagicMock()
+    setattr(instance, handler_name, constant_handler)  # noqa: B010
+    route_constant(instance, constant)
+
+    constant_handler.assert_called_once_with(constant)
+
+
+def test_base_token_visitor_comments(default_options):
+    """Ensures that token visitors reuse comments collected by the checker."""
+    Checker.parse_options(default_options)
+    file_tokens = list(tokenize.generate_tokens(
+        io.StringIO('x = 1  # noqa: WPS111\n').readline,
+    ))
+    checker = Checker(tree=ast.parse(''), file_tokens=file_tokens)
+    instance = BaseTokenVisitor.from_checker(checker)
+
+    assert instance.comments is checker.comments
+    assert [comment.kind for comment in instance.comments] == ['noqa']
+
+
+@pytest.mark.parametrize(('visitor_class', 'visited_tokens'), [
+    (BaseTokenVisitor, 0),
+    (WrongCommentVisitor, 0),
+    (_NamesVisitor, 5),
+])
+def test_base_token_visitor_handlers(
+    default_options,
+    visitor_class,
+    visited_tokens,
+):
+    """Ensures that tokens are not visited without token handlers."""
+    file_tokens = list(tokenize.generate_tokens(
+        io.StringIO('x = 1\n').readline,
+    ))
+    instance = visitor_class(default_options, file_tokens=file_tokens)
+    instance.visit = MagicMock()
+    instance.run()
+
+    assert instance.visit.call_count == visited_tokens
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+import sys
+from unittest.mock import Mock
+
+import pytest
+
+from wemake_python_styleguide import watch
+from wemake_python_styleguide.checker import Checker
+
+clear_screen = '\x1b[2J\x1b[H'
+
+
+def _create_files(directory):
+    (directory / 'first.py').write_text('x = 1\n')
+    (directory / 'second.py').write_text('def second():\n    vars()\n')
+    (directory / 'readme.txt').write_text('x = 1\n')
+    (directory / 'script').write_text('x = 1\n')
+    (directory / 'broken.py').symlink_to(directory / 'missing.py')
+    return watch.Watcher([
+        '--isolated',
+        '--select',
+        'WPS',
+        '--statistics',
+        str(directory),
+        str(directory / 'script'),
+    ])
+
+
+def test_watcher_check(tmp_path, default_options):
+    """Ensures that only changed, new, and removed files are returned."""
+    watcher = _create_files(tmp_path)
+    first_files = watcher.check()
+    same_files = watcher.check()
+
+    (tmp_path / 'first.py').write_text('first_name = 1\n')
+    (tmp_path / 'second.py').unlink()
+    (tmp_path / 'third.py').write_text('x = 1\n')
+    changed_files = watcher.check()
+    Checker.parse_options(default_options)
+
+    assert first_files == [
+        str(tmp_path / 'first.py'),
+        str(tmp_path / 'script'),
+        str(tmp_path / 'second.py'),
+    ]
+    assert same_files == []
+    assert changed_files == [
+        str(tmp_path / 'first.py'),
+        str(tmp_path / 'second.py'),
+        str(tmp_path / 'third.py'),
+    ]
+
+
+def test_watcher_report(tmp_path, default_options, capsys):
+    """Ensures that results of unchanged files are reported with stats."""
+    watcher = _create_files(tmp_path)
+    watcher.check()
+    (tmp_path / 'first.py').write_text('first_name = 1\n')
+    watcher.check()
+    watcher.report()
+    Checker.parse_options(default_options)
+
+    output = capsys.readouterr().out
+
+    assert 'first.py' not in output
+    assert output.index('script') < output.index('second.py')
+    assert output.count('Found too short name: x') == 2
+    assert output.count('Total: 1') == 2
+    assert 'All errors: 2' in output
+
+
+@pytest.mark.parametrize('is_terminal', [True, False])
+def test_main(tmp_path, default_options, capsys, monkeypatch, is_terminal):
+    """Ensures that the terminal is cleared before each new report."""
+    sleep = Mock(side_effect=[None, KeyboardInterrupt])
+    monkeypatch.setattr(sys.stdout, 'isatty', lambda: is_terminal)
+    monkeypatch.setattr(watch.time, 'sleep', sleep)
+    _create_files(tmp_path)
+
+    watch.main(['--isolated', '--select', 'WPS', str(tmp_path)])
+    Checker.parse_options(default_options)
+    output = capsys.readouterr().out
+
+    assert sleep.call_count == 2
+    assert output.count('Full list of violations') == 1
+    assert output.startswith(clear_screen) is is_terminal
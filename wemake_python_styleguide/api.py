@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+
+"""
+Programmatic API to check modules in the same process without ``flake8``.
+
+.. code:: python
+
+    from wemake_python_styleguide import api
+
+    options = api.make_options(max_line_complexity=20)
+    violations = api.check_files(['module.py'], options=options, jobs=4)
+
+Options parsed by ``flake8`` are used by default,
+then default options from :func:`make_options`.
+Each options are parsed once, into their own checker class.
+So, checks with different options can run at the same time.
+
+Each module is read, parsed, and tokenized exactly once.
+Only ``wemake-python-styleguide`` checks are run,
+other ``flake8`` plugins are not used.
+
+.. autofunction:: check_source
+
+.. autofunction:: check_files
+
+.. autofunction:: make_options
+
+.. autofunction:: create_checker
+
+.. autofunction:: get_checker_class
+
+.. autoclass:: Violation
+
+"""
+
+import ast
+import io
+import threading
+import tokenize
+import types
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Type, Union, cast
+
+import attr
+from typing_extensions import Final, final
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.constants import STDIN
+from wemake_python_styleguide.logic import memory, scheduling
+from wemake_python_styleguide.options.config import Configuration
+from wemake_python_styleguide.options.validation import validate_options
+from wemake_python_styleguide.types import CheckResult, ConfigurationOptions
+
+#: Values of options that can be passed to :func:`make_options`.
+_OptionValue = Optional[Union[int, str, Sequence[str]]]
+
+#: Source code of a module, bytes are decoded like ``python`` does.
+_Source = Union[str, bytes]
+
+#: Checker classes with their own options, see :func:`get_checker_class`.
+_checker_classes: List[Type[Checker]] = []
+_checker_classes_lock: Final = threading.Lock()
+
+
+@final
+@attr.dataclass(frozen=True, slots=True)
+class Violation(object):
+    """Represents a single violation found in a module."""
+
+    filename: str
+    line_number: int
+
+    #: Starts from ``1``, just like in ``flake8`` output.
+    column_number: int
+
+    code: str
+    text: str
+
+    @classmethod
+    def from_check_result(
+        cls,
+        check_result: CheckResult,
+        filename: str,
+    ) -> 'Violation':
+        """Creates violation from the result of a checker."""
+        line_number, column, message, _ = check_result
+        code, text = message.split(' ', 1)
+        return cls(
+            filename=filename,
+            line_number=line_number,
+            column_number=column + 1,
+            code=code,
+            text=text,
+        )
+
+    @classmethod
+    def from_syntax_error(
+        cls,
+        error: SyntaxError,
+        filename: str,
+    ) -> 'Violation':
+        """Reports the module that can not be parsed, like ``flake8`` does."""
+        return cls(
+            filename=filename,
+            line_number=error.lineno or 1,
+            column_number=error.offset or 1,
+            code='E999',
+            text='SyntaxError: {0}'.format(error.msg),
+        )
+
+    @classmethod
+    def from_os_error(
+        cls,
+        error: OSError,
+        filename: str,
+    ) -> 'Violation':
+        """Reports the module that can not be read, like ``flake8`` does."""
+        return cls(
+            filename=filename,
+            line_number=0,
+            column_number=1,
+            code='E902',
+            text='{0}: {1}'.format(type(error).__name__, error),
+        )
+
+
+def make_options(**option_values: _OptionValue) -> ConfigurationOptions:
+    """
+    Returns validated options, all other options have default values.
+
+    Option names are the same as in the configuration,
+    but with underscores: ``make_options(max_line_complexity=20)``.
+
+    Raises:
+        TypeError: when unknown options are passed.
+        ValueError: when option values are invalid.
+
+    """
+    default_values = {
+        option.long_option_name[2:].replace('-', '_'): option.default
+        for option in (*Configuration.options, *Configuration.run_options)
+    }
+    default_values['disable_noqa'] = False
+
+    unknown_options = set(option_values).difference(default_values)
+    if unknown_options:
+        raise TypeError('Unknown options: {0}'.format(
+            ', '.join(sorted(unknown_options)),
+        ))
+
+    default_values.update(option_values)
+    return validate_options(types.SimpleNamespace(**default_values))
+
+
+def create_checker(
+    source: _Source,
+    filename: str = STDIN,
+    options: Optional[ConfigurationOptions] = None,
+) -> Checker:
+    """
+    Parses and tokenizes the source code once, returns a ready checker.
+
+    It is useful for integrations that run checks themselves,
+    see :meth:`~.checker.Checker.iter_checks`.
+
+    Bytes are decoded with the encoding declared in the module,
+    just like ``python`` does.
+
+    Raises:
+        SyntaxError: when the source code can not be parsed.
+
+    """
+    checker_class = get_checker_class(options)
+    if isinstance(source, bytes):
+        encoding, _ = tokenize.detect_encoding(io.BytesIO(source).readline)
+        source = source.decode(encoding)
+    tree = ast.parse(source, filename)
+    file_tokens = list(tokenize.generate_tokens(io.StringIO(source).readline))
+    return checker_class(tree=tree, file_tokens=file_tokens, filename=filename)
+
+
+def get_checker_class(
+    options: Optional[ConfigurationOptions] = None,
+) -> Type[Checker]:
+    """
+    Returns the checker class with the given options parsed.
+
+    :class:`~.checker.Checker` itself is returned for options,
+    that were parsed by ``flake8``. Other options are parsed once
+    into a new checker class, which is reused for the same options.
+    So, checks never change options of other running checks.
+
+    Visitors take options from their checkers, not from the base class.
+    """
+    parsed_options = getattr(Checker, 'options', None)
+    if options is None:
+        options = parsed_options or make_options()
+    if options == parsed_options:
+        return Checker
+
+    with _checker_classes_lock:
+        for parsed_class in _checker_classes:
+            if parsed_class.options == options:
+                return parsed_class
+
+        checker_class = cast(
+            Type[Checker], type(Checker.__name__, (Checker,), {}),
+        )
+        checker_class.parse_options(options)
+        _checker_classes.append(checker_class)
+    return checker_class
+
+
+def check_source(
+    source: _Source,
+    filename: str = STDIN,
+    *,
+    options: Optional[ConfigurationOptions] = None,
+) -> List[Violation]:
+    """
+    Checks the source code of a single module.
+
+    Parameters:
+        source: module's source code, as a text or as raw bytes.
+        filename: module's file name, used in some checks and in results.
+        options: options from :func:`make_options`, parsed ones by default.
+
+    Raises:
+        SyntaxError: when the source code can not be parsed.
+
+    """
+    checker = create_checker(source, filename, options)
+    return sorted(
+        Violation.from_check_result(check_result, filename)
+        for check_result in checker.run()
+    )
+
+
+def check_files(
+    filenames: Iterable[str],
+    *,
+    options: Optional[ConfigurationOptions] = None,
+    jobs: int = 1,
+) -> List[Violation]:
+    """
+    Checks all given files, in parallel processes when ``jobs > 1``.
+
+    Files with syntax errors are reported with ``E999`` code,
+    files that can not be read are reported with ``E902`` code,
+    just like ``flake8`` does.
+
+    Parallel workers check the longest files first, so a huge file
+    does not keep one worker busy when others are done.
+    Costs recorded with ``--shard-costs`` are used when they are set,
+    file sizes are used for other files.
+
+    Workers are forked when possible, so they reuse
+    imported modules and validated options of the current process.
+
+    Parameters:
+        filenames: paths of modules to check.
+        options: options from :func:`make_options`, parsed ones by default.
+        jobs: number of processes to use.
+
+    Raises:
+        ValueError: when ``jobs`` is not positive.
+
+    """
+    if jobs < 1:
+        raise ValueError('jobs must be positive, got: {0}'.format(jobs))
+
+    options = get_checker_class(options).options
+    filenames = list(filenames)
+    checked_files: Dict[str, List[Violation]]
+    if jobs == 1:
+        checked_files = _check_files(filenames, options)
+    else:
+        checked_files = {}
+        with memory.preloaded_pool(jobs, get_checker_class, options) as pool:
+            for task_files in pool.starmap(
+                _check_files,
+                [
+                    (task, options)
+                    for task in scheduling.get_file_tasks(
+                        filenames, jobs, options.shard_costs,
+                    )
+                ],
+            ):
+                checked_files.update(task_files)
+
+    return [
+        violation
+        for filename in filenames
+        for violation in checked_files[filename]
+    ]
+
+
+def _check_files(
+    filenames: Iterable[str],
+    options: ConfigurationOptions,
+) -> Dict[str, List[Violation]]:
+    checked_files = {}
+    for filename in filenames:
+        try:
+            checked_files[filename] = check_source(
+                Path(filename).read_bytes(), filename, options=options,
+            )
+        except SyntaxError as syntax_error:
+            checked_files[filename] = [
+                Violation.from_syntax_error(syntax_error, filename),
+            ]
+        except OSError as os_error:
+            checked_files[filename] = [
+                Violation.from_os_error(os_error, filename),
+            ]
+    return checked_files
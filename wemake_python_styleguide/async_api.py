@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+"""
+Asynchronous API for editor integrations.
+
+Editors check modules on every pause in typing,
+so outdated checks must be cancelled as soon as a new one is requested.
+We run each visitor in an executor and return control to the event loop
+between visitors. So, a cancelled check stops after its current visitor.
+
+.. code:: python
+
+    import asyncio
+
+    from wemake_python_styleguide.async_api import check_source
+
+    violations = asyncio.get_event_loop().run_until_complete(
+        check_source('x = 1', 'example.py'),
+    )
+
+Options are shared with :mod:`wemake_python_styleguide.api`,
+see :func:`~.api.make_options`.
+
+.. autofunction:: check_source
+
+.. autofunction:: run_checker
+
+.. autofunction:: run_checks
+
+"""
+
+import asyncio
+import weakref
+from concurrent.futures import Executor
+from typing import Iterable, List, MutableMapping, Optional
+
+from typing_extensions import Final
+
+from wemake_python_styleguide import api
+from wemake_python_styleguide.checker import Check, Checker
+from wemake_python_styleguide.constants import STDIN
+from wemake_python_styleguide.types import ConfigurationOptions
+
+#: Maximum number of modules that are checked at the same time.
+MAX_CONCURRENT_CHECKS: Final = 4
+
+#: Semaphores must be created inside the loop they are used in.
+_semaphores: MutableMapping[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def check_source(
+    source: str,
+    filename: str = STDIN,
+    *,
+    options: Optional[ConfigurationOptions] = None,
+    executor: Optional[Executor] = None,
+) -> List[api.Violation]:
+    """
+    Checks the source code of a single module.
+
+    Only :data:`MAX_CONCURRENT_CHECKS` modules are checked at once.
+    Other checks wait for their turn.
+
+    Parameters:
+        source: module's source code, it does not have to be saved.
+        filename: module's file name, used in some checks and in results.
+        options: options from :func:`~.api.make_options`.
+        executor: runs all the work, the loop's default one is used.
+
+    Raises:
+        SyntaxError: when the source code can not be parsed.
+
+    """
+    loop = asyncio.get_event_loop()
+    async with _get_semaphore(loop):
+        checker = await loop.run_in_executor(
+            executor, api.create_checker, source, filename, options,
+        )
+        return await _run_checks(
+            checker.iter_checks(), checker.filename, executor,
+        )
+
+
+async def run_checker(
+    checker: Checker,
+    *,
+    executor: Optional[Executor] = None,
+) -> List[api.Violation]:
+    """
+    Runs all checks of a ready checker, see :func:`~.api.create_checker`.
+
+    It shares the limit of :data:`MAX_CONCURRENT_CHECKS` with other checks.
+    """
+    return await run_checks(
+        checker.iter_checks(), checker.filename, executor=executor,
+    )
+
+
+async def run_checks(
+    checks: Iterable[Check],
+    filename: str,
+    *,
+    executor: Optional[Executor] = None,
+) -> List[api.Violation]:
+    """
+    Runs some checks of a ready checker, for example, only module checks.
+
+    See :meth:`~.checker.Checker.iter_module_checks`.
+    It shares the limit of :data:`MAX_CONCURRENT_CHECKS` with other checks.
+    """
+    async with _get_semaphore(asyncio.get_event_loop()):
+        return await _run_checks(checks, filename, executor)
+
+
+def _get_semaphore(loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+    if loop not in _semaphores:
+        _semaphores[loop] = asyncio.Semaphore(MAX_CONCURRENT_CHECKS)
+    return _semaphores[loop]
+
+
+async def _run_checks(
+    checks: Iterable[Check],
+    filename: str,
+    executor: Optional[Executor],
+) -> List[api.Violation]:
+    loop = asyncio.get_event_loop()
+    violations: List[api.Violation] = []
+    for check in checks:
+        violations.extend(await loop.run_in_executor(
+            executor, _run_check, check, filename,
+        ))
+    return sorted(violations)
+
+
+def _run_check(check: Check, filename: str) -> List[api.Violation]:
+    return [
+        api.Violation.from_check_result(check_result, filename)
+        for check_result in check()
+    ]
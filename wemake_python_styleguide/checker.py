@@ -33,31 +33,65 @@ Checker API
 
 .. autoclass:: Checker
    :no-undoc-members:
-   :exclude-members: name, version, visitors, _run_checks
+   :exclude-members: name, version, visitors
    :special-members: __init__
 
 """
 
 import ast
+import copy
+import multiprocessing
+import os
+import time
 import tokenize
 import traceback
-from typing import ClassVar, Iterator, Sequence, Type
+from functools import partial
+from typing import (
+    AbstractSet,
+    Callable,
+    ClassVar,
+    Iterator,
+    Optional,
+    Sequence,
+    Type,
+)
 
 from flake8.options.manager import OptionManager
-from typing_extensions import final
+from typing_extensions import Final, final
 
 from wemake_python_styleguide import constants, types
 from wemake_python_styleguide import version as pkg_version
+from wemake_python_styleguide.logic import (
+    comments,
+    diffs,
+    huge_modules,
+    noqa,
+    shards,
+)
+from wemake_python_styleguide.logic.project.index import ProjectIndex
 from wemake_python_styleguide.options.config import Configuration
 from wemake_python_styleguide.options.validation import validate_options
+from wemake_python_styleguide.presets.topics import aggregates
 from wemake_python_styleguide.presets.types import file_tokens as tokens_preset
 from wemake_python_styleguide.presets.types import filename as filename_preset
 from wemake_python_styleguide.presets.types import tree as tree_preset
 from wemake_python_styleguide.transformations.ast_tree import transform
+from wemake_python_styleguide.violations.base import BaseViolation
+from wemake_python_styleguide.violations.complexity import HugeModuleViolation
 from wemake_python_styleguide.visitors import base
 
 VisitorClass = Type[base.BaseVisitor]
 
+#: Single check that can be run separately from other ones.
+Check = Callable[[], Iterator[types.CheckResult]]
+
+#: Visitors that check top-level statements one by one.
+_STATEMENT_VISITORS: Final = frozenset(
+    visitor_class
+    for visitor_class in tree_preset.PRESET
+    if visitor_class not in aggregates.PRESET
+)
+
 
 @final
 class Checker(object):
@@ -76,7 +110,15 @@ class Checker(object):
         options: option structure passed by ``flake8``:
         :class:`wemake_python_styleguide.types.ConfigurationOptions`.
 
-        visitors: :term:`preset` of visitors that are run by this checker.
+        visitors: :term:`preset` of visitors that are run by this checker,
+        ``--wps-mode=fast`` only runs the ``cheap`` cost tier.
+
+        violation_filter: drops violations ignored with ``# noqa``
+        and violations outside of changed lines,
+        when ``--diff-revision`` or ``--diff-file`` is used.
+
+        comments: all classified comments of a module,
+        we collect them once and share them between visitors.
 
     """
 
@@ -92,11 +134,26 @@ class Checker(object):
         *tokens_preset.PRESET,
     )
 
+    #: Visitors are filtered once, not for each module.
+    _fast_visitors: ClassVar[Sequence[VisitorClass]] = tuple(
+        visitor_class
+        for visitor_class in _visitors
+        if visitor_class.cost_tier == 'cheap'
+    )
+
+    #: These ones are replaced in ``parse_options``,
+    #: defaults are used when options are set directly.
+    project_index: ClassVar[Optional[ProjectIndex]] = None
+    _changed_lines: ClassVar[Optional[diffs.ChangedLines]] = None
+    _shards: ClassVar[shards.Shards] = shards.Shards(None, None)
+
     def __init__(
         self,
         tree: ast.AST,
         file_tokens: Sequence[tokenize.TokenInfo],
         filename: str = constants.STDIN,
+        *,
+        changed_lines: Optional[AbstractSet[int]] = None,
     ) -> None:
         """
         Creates new checker instance.
@@ -116,11 +173,45 @@ class Checker(object):
 
             file_tokens: ``tokenize.tokenize`` parsed file tokens.
             filename: module file name, might be empty if piping is used.
+            changed_lines: only checks these lines, like ``--diff-file``.
 
         """
-        self.tree = transform(tree)
+        self._started = time.perf_counter()
         self.filename = filename
         self.file_tokens = file_tokens
+        self.comments = comments.get_comments(file_tokens)
+        self.violation_filter: base.ViolationFilter = self._is_reported
+
+        self._suppressed_codes = noqa.get_suppressed_codes(
+            self.comments, self.options,
+        )
+
+        self._file_changes = changed_lines
+        if changed_lines is None and self._changed_lines is not None:
+            self._file_changes = self._changed_lines.get(
+                os.path.abspath(filename), set(),
+            )
+        if not self._shards.is_checked(filename):
+            self._file_changes = set()  # other shards check this module
+
+        self._huge_module_reason: Optional[str] = None
+        if self._file_changes != set() and self.options.wps_mode != 'full':
+            self._huge_module_reason = huge_modules.get_huge_module_reason(
+                tree, file_tokens, filename, self.options,
+            )
+
+        self._is_skipped = _is_skipped_module(
+            self._file_changes, self._huge_module_reason, self.options,
+        )
+
+        # We only index modules that we check:
+        if self.project_index is not None and not self._is_skipped:
+            self.project_index.update(tree, file_tokens, filename)
+
+        # We do not even transform modules that we skip:
+        self.tree = tree if self._is_skipped else _transform(
+            tree, self.options,
+        )
 
     @classmethod
     def add_options(cls, parser: OptionManager) -> None:
@@ -140,6 +231,21 @@ class Checker(object):
     def parse_options(cls, options: types.ConfigurationOptions) -> None:
         """Parses registered options for providing them to each visitor."""
         cls.options = validate_options(options)
+        cls._changed_lines = diffs.read_changed_lines(  # noqa: WPS601
+            cls.options.diff_revision,
+            cls.options.diff_file,
+        )
+        cls.project_index = ProjectIndex(  # noqa: WPS601
+            cls.options.project_index,
+        ) if cls.options.project_index else None
+        cls._shards = shards.Shards(  # noqa: WPS601
+            cls.options.shard,
+            cls.options.shard_costs,
+        )
+        if not multiprocessing.current_process().daemon:
+            # Pool workers are daemons, the parent has checked costs for them:
+            cls._shards.check_costs()
+            shards.compact_costs(cls.options.shard_costs)
 
     def run(self) -> Iterator[types.CheckResult]:
         """
@@ -152,23 +258,176 @@ class Checker(object):
             Violations that were found by the passed visitors.
 
         """
-        yield from self._run_checks(self._visitors)
+        for check in self.iter_checks():
+            yield from check()
 
-    def _run_checks(
-        self,
-        visitors: Sequence[VisitorClass],
-    ) -> Iterator[types.CheckResult]:
-        """Runs all passed visitors one by one."""
+        if not self._is_skipped:
+            self._shards.record(
+                self.filename, time.perf_counter() - self._started,
+            )
+
+    def iter_checks(self, *, module_checks: bool = True) -> Iterator[Check]:
+        """
+        Returns all checks for this module, they can be run one by one.
+
+        It is useful to run them separately, for example,
+        in an executor with a chance to cancel the rest of the checks.
+
+        Parameters:
+            module_checks: when disabled, only checks of top-level
+                statements are returned, see :meth:`iter_module_checks`.
+
+        Yields:
+            Functions that return violations of a single visitor.
+
+        """
+        if module_checks and self._huge_module_reason:
+            yield partial(_report_huge_module, self, self._huge_module_reason)
+        if self._is_skipped:
+            return
+
+        visitors = self._fast_visitors if _is_fast_check(
+            self._huge_module_reason, self.options,
+        ) else self._visitors
+        if self._file_changes is not None:
+            yield from _iter_changed_checks(
+                self,
+                visitors,
+                self._file_changes,
+                module_checks=module_checks,
+            )
+            return
+
+        for visitor_class in visitors:
+            if module_checks or visitor_class in _STATEMENT_VISITORS:
+                yield partial(_run_visitor, self, visitor_class)
+
+    def iter_module_checks(self) -> Iterator[Check]:
+        """
+        Returns checks that need the whole module, even when lines changed.
+
+        These are token, filename, and module-wide visitors.
+        They report violations on all lines, not only on changed ones.
+        So, editors replace all their old violations on each change
+        and keep statement violations of unchanged lines.
+
+        Yields:
+            Functions that return violations of a single visitor.
+
+        """
+        if self._huge_module_reason:
+            yield partial(_report_huge_module, self, self._huge_module_reason)
+        if self._is_skipped:
+            return
+
+        visitors = self._fast_visitors if _is_fast_check(
+            self._huge_module_reason, self.options,
+        ) else self._visitors
+        module_checker = copy.copy(self)
+        module_checker.violation_filter = partial(
+            self._is_reported, whole_module=True,
+        )
         for visitor_class in visitors:
-            visitor = visitor_class.from_checker(self)
-
-            try:
-                visitor.run()
-            except Exception:
-                # In case we fail misserably, we want users to see at
-                # least something! Full stack trace
-                # and some rules that still work.
-                print(traceback.format_exc())  # noqa: T001
-
-            for error in visitor.violations:
-                yield (*error.node_items(), type(self))
+            if visitor_class not in _STATEMENT_VISITORS:
+                yield partial(_run_visitor, module_checker, visitor_class)
+
+    def _is_reported(
+        self,
+        violation: BaseViolation,
+        *,
+        whole_module: bool = False,
+    ) -> bool:
+        line_number, _ = violation.location()
+        code = violation.full_code()
+        if noqa.is_suppressed(self._suppressed_codes, line_number, code):
+            return False  # `flake8` would ignore it anyway
+        if whole_module or self._file_changes is None:
+            return True
+        if not line_number:
+            return self.options.diff_module_checks == 'always'
+        return line_number in self._file_changes
+
+
+def _is_skipped_module(
+    file_changes: Optional[AbstractSet[int]],
+    huge_module_reason: Optional[str],
+    options: types.ConfigurationOptions,
+) -> bool:
+    return file_changes == set() or bool(
+        huge_module_reason and options.huge_module_policy == 'skip',
+    )
+
+
+def _is_fast_check(
+    huge_module_reason: Optional[str],
+    options: types.ConfigurationOptions,
+) -> bool:
+    return bool(huge_module_reason) or options.wps_mode == 'fast'
+
+
+def _iter_changed_checks(
+    checker: Checker,
+    visitors: Sequence[VisitorClass],
+    file_changes: AbstractSet[int],
+    *,
+    module_checks: bool,
+) -> Iterator[Check]:
+    """
+    Returns checks of top-level definitions with changed lines.
+
+    Visitors that need the whole module to work are executed
+    on the whole module, or skipped completely.
+    """
+    changed_tree = copy.copy(checker.tree)
+    changed_tree.body = diffs.get_changed_statements(  # type: ignore
+        checker.tree, file_changes,
+    )
+    changed_checker = copy.copy(checker)
+    changed_checker.tree = changed_tree
+
+    for visitor_class in visitors:
+        if visitor_class in _STATEMENT_VISITORS:
+            yield partial(_run_visitor, changed_checker, visitor_class)
+        elif visitor_class in aggregates.PRESET:
+            if module_checks and checker.options.diff_module_checks == 'always':
+                yield partial(_run_visitor, checker, visitor_class)
+        elif module_checks:
+            yield partial(_run_visitor, checker, visitor_class)
+
+
+def _transform(
+    tree: ast.AST,
+    options: types.ConfigurationOptions,
+) -> ast.AST:
+    return transform(
+        tree,
+        classmethod_decorators=options.wps_classmethod_decorators,
+        staticmethod_decorators=options.wps_staticmethod_decorators,
+    )
+
+
+def _report_huge_module(
+    checker: Checker,
+    reason: str,
+) -> Iterator[types.CheckResult]:
+    violation = HugeModuleViolation(text=reason)
+    yield (*violation.node_items(), type(checker))
+
+
+def _run_visitor(
+    checker: Checker,
+    visitor_class: VisitorClass,
+) -> Iterator[types.CheckResult]:
+    """Runs a single visitor, its failure does not affect other visitors."""
+    visitor = visitor_class.from_checker(checker)
+
+    try:
+        visitor.run()
+    except Exception:
+        # In case we fail misserably, we want users to see at
+        # least something! Full stack trace
+        # and some rules that still work.
+        print(traceback.format_exc())  # noqa: T001
+
+    for error in visitor.violations:
+        yield (*error.node_items(), type(checker))
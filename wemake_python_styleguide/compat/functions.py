@@ -5,6 +5,21 @@ from typing import List
 
 from wemake_python_styleguide.types import AnyAssign
 
+try:  # pragma: no cover
+    from gc import freeze, unfreeze  # type: ignore  # noqa: WPS433
+except ImportError:  # pragma: no cover
+    def freeze() -> None:  # noqa: WPS440
+        """
+        Fallback for pythons that can not freeze objects.
+
+        In this case all objects are collected as usual.
+
+        Only ``python3.7+`` has ``gc.freeze``.
+        """
+
+    def unfreeze() -> None:  # noqa: WPS440
+        """Fallback for pythons that can not unfreeze objects."""
+
 
 def get_assign_targets(node: AnyAssign) -> List[ast.expr]:
     """Returns list of assign targets without knowing the type of assign."""
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+import ast
+import types
+
+from typing_extensions import Final
+
+from wemake_python_styleguide.compat.nodes import Constant
+
+#: Handlers of constants by their value types, the same ones python3.8 uses.
+_CONSTANT_HANDLERS: Final = types.MappingProxyType({
+    str: 'visit_Str',
+    bytes: 'visit_Bytes',
+    int: 'visit_Num',
+    float: 'visit_Num',
+    complex: 'visit_Num',
+    bool: 'visit_NameConstant',
+    type(None): 'visit_NameConstant',
+    type(...): 'visit_Ellipsis',
+})
+
+_GENERIC_VISIT: Final = 'generic_visit'
+
+
+def route_constant(visitor: ast.NodeVisitor, node: Constant) -> None:
+    """
+    Calls the handler for a constant, based on the type of its value.
+
+    Since python3.8 all constants are parsed as ``ast.Constant``.
+    ``ast.NodeVisitor.visit_Constant`` is then used to call our
+    ``visit_Str``, ``visit_Num``, and other handlers.
+    It is slow and raises a deprecation warning for each constant.
+    So, we dispatch constants to their handlers directly.
+
+    Older versions never create ``ast.Constant`` nodes when parsing,
+    so this function is not called there at all.
+
+    See: https://bugs.python.org/issue32892
+    """
+    handler_name = _CONSTANT_HANDLERS.get(type(node.value), _GENERIC_VISIT)
+    getattr(visitor, handler_name, visitor.generic_visit)(node)
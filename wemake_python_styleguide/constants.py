@@ -210,3 +210,6 @@ NON_MAGIC_MODULO: Final = 10
 # Used to specify a pattern which checks variables and modules for underscored
 # numbers in their names:
 UNDERSCORED_NUMBER_PATTERN: Final = re.compile(r'.+\D\_\d+(\D|$)')
+
+# Maximum number of cached naming verdicts, names repeat a lot in real code:
+NAMING_CACHE_SIZE: Final = 4096
@@ -28,9 +28,10 @@ That's how all ``flake8`` formatters work:
 """
 
 from collections import defaultdict
-from typing import ClassVar, DefaultDict, List
+from typing import ClassVar, DefaultDict, Dict, List, Tuple
 
 from flake8.formatting.base import BaseFormatter
+from flake8.options.manager import OptionManager
 from flake8.statistics import Statistics
 from flake8.style_guide import Violation
 from pygments import highlight
@@ -38,6 +39,7 @@ from pygments.formatters import TerminalFormatter
 from pygments.lexers import PythonLexer
 from typing_extensions import Final
 
+from wemake_python_styleguide.options import defaults
 from wemake_python_styleguide.version import pkg_version
 
 #: That url is generated and hosted by Sphinx.
@@ -45,6 +47,12 @@ DOCS_URL_TEMPLATE: Final = (
     'https://wemake-python-stylegui.de/en/{0}/pages/usage/violations/'
 )
 
+#: Number of violations per each filename.
+_FilenameCounts = List[Tuple[str, int]]
+
+#: Statistic for a single code: code, message, total, and counts per filename.
+_CodeStatistic = Tuple[str, str, int, _FilenameCounts]
+
 
 class WemakeFormatter(BaseFormatter):  # noqa: WPS214
     """
@@ -65,8 +73,46 @@ class WemakeFormatter(BaseFormatter):  # noqa: WPS214
 
     # API:
 
+    @classmethod
+    def add_options(cls, parser: OptionManager) -> None:
+        """
+        ``flake8`` api method to register new formatter options.
+
+        These options are only used together with ``--statistics``:
+
+        - ``sort-statistics`` - how to sort statistics, either by violation
+          ``code`` or by violations ``count``, defaults to
+          :str:`wemake_python_styleguide.options.defaults.SORT_STATISTICS`
+        - ``max-statistics-files`` - maximum number of files shown for each
+          violation code, ``0`` means that all files are shown, defaults to
+          :str:`wemake_python_styleguide.options.defaults.MAX_STATISTICS_FILES`
+
+        """
+        parser.add_option(
+            '--sort-statistics',
+            default=defaults.SORT_STATISTICS,
+            type='choice',
+            choices=('code', 'count'),
+            parse_from_config=True,
+            help='How to sort statistics: by violation code or by count.',
+        )
+        parser.add_option(
+            '--max-statistics-files',
+            default=defaults.MAX_STATISTICS_FILES,
+            type='int',
+            parse_from_config=True,
+            help='Maximum number of files shown per violation in statistics.',
+        )
+
     def after_init(self):
         """Called after the original ``init`` is used to set extra fields."""
+        if self.options.max_statistics_files < 0:
+            raise ValueError(
+                'Option max_statistics_files is out of bounds: {0}'.format(
+                    self.options.max_statistics_files,
+                ),
+            )
+
         self._lexer = PythonLexer()
         self._formatter = TerminalFormatter()
 
@@ -74,6 +120,13 @@ class WemakeFormatter(BaseFormatter):  # noqa: WPS214
         self._proccessed_filenames: List[str] = []
         self._error_count = 0
 
+        # Statistics, collected as we go:
+        self._code_counts: DefaultDict[str, int] = defaultdict(int)
+        self._filename_counts: DefaultDict[str, DefaultDict[str, int]] = (
+            defaultdict(lambda: defaultdict(int))
+        )
+        self._messages: Dict[Tuple[str, str], str] = {}
+
     def handle(self, error: Violation) -> None:  # noqa: WPS110
         """Processes each :term:`violation` to print it and all related."""
         if error.filename not in self._proccessed_filenames:
@@ -82,6 +135,7 @@ class WemakeFormatter(BaseFormatter):  # noqa: WPS214
 
         super().handle(error)
         self._error_count += 1
+        self._record_statistic(error)
 
     def format(self, error: Violation) -> str:  # noqa: A003
         """Called to format each individual :term:`violation`."""
@@ -111,36 +165,39 @@ class WemakeFormatter(BaseFormatter):  # noqa: WPS214
             pointer=' ' * (error.column_number - 1 - adjust),
         )
 
-    def show_statistics(self, statistics: Statistics) -> None:  # noqa: WPS210
-        """Called when ``--statistic`` option is passed."""
-        all_errors = 0
-        for error_code in statistics.error_codes():
-            stats_for_error_code = statistics.statistics_for(error_code)
-            statistic = next(stats_for_error_code)
-
-            count = statistic.count
-            count += sum(stat.count for stat in stats_for_error_code)
-            all_errors += count
-            error_by_file = _count_per_filename(statistics, error_code)
-
+    def show_statistics(  # noqa: WPS210
+        self,
+        statistics: Statistics,
+    ) -> None:
+        """
+        Called when ``--statistic`` option is passed.
+
+        We do not use ``statistics`` passed by ``flake8``,
+        since we count everything ourselves inside ``handle()``.
+        It allows us to render all statistics in a single pass.
+        """
+        statistics_per_code = self._ordered_statistics()
+        for error_code, message, count, error_by_file in statistics_per_code:
             self._write(
                 '{newline}{error_code}: {message}'.format(
                     newline=self.newline,
                     error_code=_bold(error_code),
-                    message=statistic.message,
+                    message=message,
                 ),
             )
-            for filename in error_by_file:
+            for filename, error_count in error_by_file:
                 self._write(
                     '  {error_count:<5} {filename}'.format(
-                        error_count=error_by_file[filename],
+                        error_count=error_count,
                         filename=filename,
                     ),
                 )
             self._write(_underline('Total: {0}'.format(count)))
 
         self._write(self.newline)
-        self._write(_underline(_bold('All errors: {0}'.format(all_errors))))
+        self._write(_underline(_bold('All errors: {0}'.format(
+            self._error_count,
+        ))))
 
     def stop(self) -> None:
         """Runs once per app when the formatting ends."""
@@ -161,6 +218,31 @@ class WemakeFormatter(BaseFormatter):  # noqa: WPS214
     def _should_show_source(self, error: Violation) -> bool:
         return self.options.show_source and error.physical_line is not None
 
+    def _record_statistic(self, error: Violation) -> None:
+        self._code_counts[error.code] += 1
+        self._filename_counts[error.code][error.filename] += 1
+        self._messages.setdefault((error.code, error.filename), error.text)
+
+    def _ordered_statistics(self) -> List[_CodeStatistic]:
+        sort_by_count = self.options.sort_statistics == 'count'
+        ordered = []
+        for error_code in sorted(self._code_counts):
+            error_by_file = sorted(self._filename_counts[error_code].items())
+            message = self._messages[(error_code, error_by_file[0][0])]
+            if sort_by_count:
+                error_by_file.sort(key=_by_count)
+
+            ordered.append((
+                error_code,
+                message,
+                self._code_counts[error_code],
+                error_by_file[:self.options.max_statistics_files or None],
+            ))
+
+        if sort_by_count:
+            ordered.sort(key=lambda code_statistic: -code_statistic[2])
+        return ordered
+
 
 # Formatting text:
 
@@ -188,14 +270,12 @@ def _underline(text: str) -> str:
 
 # Helpers:
 
-def _count_per_filename(
-    statistics: Statistics,
-    error_code: str,
-) -> DefaultDict[str, int]:
-    filenames: DefaultDict[str, int] = defaultdict(int)
-    stats_for_error_code = statistics.statistics_for(error_code)
+def _by_count(filename_count: Tuple[str, int]) -> int:
+    """
+    Used as a sorting key to show the most violated files first.
 
-    for stat in stats_for_error_code:
-        filenames[stat.filename] += stat.count
+    >>> _by_count(('first.py', 3))
+    -3
 
-    return filenames
+    """
+    return -filename_count[1]
@@ -1,9 +1,24 @@
 # -*- coding: utf-8 -*-
 
-from typing import Optional
+import ast
+from typing import Dict, Iterable, Iterator, Mapping, Optional, Tuple
 
+from typing_extensions import Final
+
+from wemake_python_styleguide.compat.aliases import (
+    ForNodes,
+    FunctionNodes,
+    WithNodes,
+)
 from wemake_python_styleguide.constants import ALLOWED_BUILTIN_CLASSES
 from wemake_python_styleguide.logic.naming.builtins import is_builtin_name
+from wemake_python_styleguide.types import AnyFunctionDef
+
+#: Statements inside a class body that can contain methods.
+_METHOD_CONTAINERS: Final = (ast.If, ast.While, ast.Try, *ForNodes, *WithNodes)
+
+#: Methods that are classmethods without any decorators.
+_IMPLICIT_CLASSMETHODS: Final = frozenset(('__new__', '__init_subclass__'))
 
 
 def is_forbidden_super_class(class_name: Optional[str]) -> bool:
@@ -34,3 +49,92 @@ def is_forbidden_super_class(class_name: Optional[str]) -> bool:
     if class_name in ALLOWED_BUILTIN_CLASSES:
         return False
     return is_builtin_name(class_name)
+
+
+def get_method_types(
+    node: ast.ClassDef,
+    method_decorators: Mapping[str, str],
+) -> Iterator[Tuple[AnyFunctionDef, str]]:
+    """
+    Returns all methods of a class with their types.
+
+    ``method_decorators`` maps decorator names to method types.
+    We respect late decoration like ``method = staticmethod(method)``
+    and treat all methods of metaclasses as classmethods.
+
+    >>> tree = ast.parse('''
+    ... class Test(object):
+    ...     def __new__(cls): ...
+    ...     def first(self): ...
+    ...     @staticmethod
+    ...     def second(): ...
+    ... ''')
+    >>> decorators = {'staticmethod': 'staticmethod'}
+    >>> for method, function_type in get_method_types(
+    ...     tree.body[0], decorators,
+    ... ):
+    ...     print(method.name, function_type)
+    __new__ classmethod
+    first method
+    second staticmethod
+
+    """
+    late_decorators = _get_late_decorators(node, method_decorators)
+    default_type = 'classmethod' if _is_metaclass(node) else 'method'
+
+    for method in _get_methods(node.body):
+        function_type = late_decorators.get(method.name) or _get_decorated_type(
+            method, method_decorators,
+        )
+        if not function_type and method.name in _IMPLICIT_CLASSMETHODS:
+            function_type = 'classmethod'
+        yield method, function_type or default_type
+
+
+def _is_metaclass(node: ast.ClassDef) -> bool:
+    return any(
+        isinstance(base, ast.Name) and base.id == 'type'
+        for base in node.bases
+    )
+
+
+def _get_late_decorators(
+    node: ast.ClassDef,
+    method_decorators: Mapping[str, str],
+) -> Dict[str, str]:
+    late_decorators: Dict[str, str] = {}
+    for statement in node.body:
+        if not isinstance(statement, ast.Assign):
+            continue
+        call_names = _get_call_names(statement.value)
+        if call_names and call_names[0] in method_decorators:
+            late_decorators[call_names[1]] = method_decorators[call_names[0]]
+    return late_decorators
+
+
+def _get_call_names(node: ast.AST) -> Optional[Tuple[str, str]]:
+    if not isinstance(node, ast.Call) or len(node.args) != 1:
+        return None
+    function, argument = node.func, node.args[0]
+    if isinstance(function, ast.Name) and isinstance(argument, ast.Name):
+        return function.id, argument.id
+    return None
+
+
+def _get_decorated_type(
+    method: AnyFunctionDef,
+    method_decorators: Mapping[str, str],
+) -> Optional[str]:
+    for decorator in method.decorator_list:
+        if isinstance(decorator, ast.Name):
+            if decorator.id in method_decorators:
+                return method_decorators[decorator.id]
+    return None
+
+
+def _get_methods(statements: Iterable[ast.AST]) -> Iterator[AnyFunctionDef]:
+    for statement in statements:
+        if isinstance(statement, _METHOD_CONTAINERS):
+            yield from _get_methods(ast.iter_child_nodes(statement))
+        elif isinstance(statement, FunctionNodes):
+            yield statement
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+import re
+import tokenize
+import types
+from typing import List, Sequence
+
+import attr
+from typing_extensions import Final, final
+
+from wemake_python_styleguide.logic.tokens import get_comment_text
+
+#: Comment kinds, see :func:`get_comments` for the details.
+NOQA: Final = 'noqa'
+TYPE: Final = 'type'
+NO_COVER: Final = 'no_cover'
+DOC: Final = 'doc'
+PLAIN: Final = 'plain'
+
+#: Kinds are mutually exclusive, since all of them start differently.
+_COMMENT_PATTERN: Final = re.compile(
+    r"""
+    ^(?:
+        (?P<noqa>noqa:?(?P<noqa_argument>$|[A-WPS\d\,\s]+))|
+        (?P<type>type:\s?(?P<type_argument>[\w\d\[\]\'\"\.]+)$)|
+        (?P<no_cover>pragma:\s+no\s+cover)|
+        (?P<doc>:$)
+    )
+    """,
+    re.VERBOSE,
+)
+
+#: Groups with arguments of the comment kinds that have them.
+_ARGUMENT_GROUPS: Final = types.MappingProxyType({
+    NOQA: 'noqa_argument',
+    TYPE: 'type_argument',
+})
+
+
+@final
+@attr.dataclass(frozen=True, slots=True)
+class Comment(object):
+    """Represents a single classified comment token."""
+
+    #: Original ``tokenize`` token.
+    token: tokenize.TokenInfo
+
+    #: Comment text without ``#`` and surrounding whitespace.
+    text: str
+
+    #: One of :data:`NOQA`, :data:`TYPE`, :data:`NO_COVER`,
+    #: :data:`DOC`, or :data:`PLAIN`.
+    kind: str
+
+    #: Listed violation codes for ``noqa``, declared type for ``type:``.
+    argument: str = ''
+
+    @property
+    def line_number(self) -> int:
+        """Returns the line number of a comment."""
+        return self.token.start[0]
+
+
+def get_comments(file_tokens: Sequence[tokenize.TokenInfo]) -> List[Comment]:
+    r"""
+    Returns all comments of a module, classified with a single regex.
+
+    It is done once per module, so visitors and the checker
+    can reuse the comments without scanning all tokens again.
+
+    >>> import io
+    >>> source = 'x = 1  # noqa: WPS111\n# type: int\n#:\n# plain'
+    >>> file_tokens = tokenize.generate_tokens(io.StringIO(source).readline)
+    >>> comments = get_comments(list(file_tokens))
+    >>> [(comment.line_number, comment.kind) for comment in comments]
+    [(1, 'noqa'), (2, 'type'), (3, 'doc'), (4, 'plain')]
+    >>> [comment.argument for comment in comments]
+    ['WPS111', 'int', '', '']
+
+    """
+    return [
+        _classify(token)
+        for token in file_tokens
+        if token.exact_type == tokenize.COMMENT
+    ]
+
+
+def _classify(token: tokenize.TokenInfo) -> Comment:
+    comment_text = get_comment_text(token)
+    match = _COMMENT_PATTERN.match(comment_text)
+    if match is None:
+        return Comment(token=token, text=comment_text, kind=PLAIN)
+
+    kind = match.lastgroup or PLAIN
+    argument_group = _ARGUMENT_GROUPS.get(kind)
+    return Comment(
+        token=token,
+        text=comment_text,
+        kind=kind,
+        argument=match.group(argument_group).strip() if argument_group else '',
+    )
@@ -9,6 +9,8 @@ import astor
 import attr
 from typing_extensions import Final, final
 
+from wemake_python_styleguide.logic.naming.name_nodes import get_dotted_name
+
 
 @final
 @attr.dataclass(frozen=True, slots=True)
@@ -101,7 +103,7 @@ class CompareBounds(object):
             left_operand = right_operand
 
     def _get_operand_name(self, operand: ast.AST) -> str:
-        return astor.to_source(operand)
+        return get_dotted_name(operand) or astor.to_source(operand)
 
     def _mutate(
         self,
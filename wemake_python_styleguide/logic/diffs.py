@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+
+import ast
+import bisect
+import os
+import re
+from collections import defaultdict
+from typing import (
+    AbstractSet,
+    DefaultDict,
+    Dict,
+    Iterator,
+    List,
+    Match,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from typing_extensions import Final, final
+
+from wemake_python_styleguide.logic import git
+
+#: Changed line numbers for each absolute file path, ``None`` for new files.
+ChangedLines = Dict[str, Optional[Set[int]]]
+
+_HUNK_HEADER: Final = re.compile(r'^@@ -\d+(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+_NO_FILE: Final = '/dev/null'
+_GIT_PREFIX: Final = 'b/'
+
+
+def parse_unified_diff(diff: str) -> Dict[str, Set[int]]:
+    r"""
+    Returns changed lines for each file in the given unified diff.
+
+    Lines are counted in the new version of each file.
+    When lines are only removed, we mark the line right before the removal.
+    Deleted files are not listed at all.
+
+    >>> diff = '''
+    ... --- a/some.py
+    ... +++ b/some.py
+    ... @@ -1,3 +1,3 @@
+    ...  first = 1
+    ... -second = 1
+    ... +second = 2
+    ...  third = 3
+    ... @@ -10,2 +9,0 @@
+    ... -removed = 1
+    ... -removed = 2
+    ... @@ -20,3 +19,2 @@
+    ...  context = 1
+    ... -removed = 3
+    ...  context = 2
+    ... --- a/deleted.py
+    ... +++ /dev/null
+    ... @@ -1 +0,0 @@
+    ... -deleted = 1
+    ... --- other.py
+    ... +++ other.py
+    ... @@ -1 +1 @@
+    ... -old = 1
+    ... \\ No newline at end of file
+    ... +new = 1
+    ... '''
+    >>> changed = parse_unified_diff(diff)
+    >>> sorted(changed[os.path.abspath('some.py')])
+    [2, 9, 19]
+    >>> sorted(changed[os.path.abspath('other.py')])
+    [1]
+    >>> len(changed)
+    2
+
+    """
+    changed: DefaultDict[str, Set[int]] = defaultdict(set)
+    file_lines: Set[int] = set()
+    lines = iter(diff.splitlines())
+
+    for line in lines:
+        hunk = _HUNK_HEADER.match(line)
+        if hunk:
+            file_lines.update(_Hunk(hunk).changed_lines(lines))
+        elif line.startswith('+++ '):
+            file_lines = _target_lines(changed, line[4:])
+
+    return dict(changed)
+
+
+def read_changed_lines(
+    revision: Optional[str],
+    diff_file: Optional[str],
+) -> Optional[ChangedLines]:
+    """
+    Returns changed lines from ``git diff`` or from an existing diff file.
+
+    Untracked files are not a part of ``git diff``,
+    so they are marked as changed as a whole.
+    Returns ``None`` when neither source is specified.
+
+    Raises:
+        ValueError: when ``git`` fails, for example, for unknown revisions.
+
+    """
+    changed_lines: ChangedLines = {}
+    if revision:
+        changed_lines.update(parse_unified_diff(git.get_diff(revision)))
+        changed_lines.update(
+            (os.path.abspath(untracked_file), None)
+            for untracked_file in git.get_untracked_files()
+        )
+    elif diff_file:
+        with open(diff_file) as diff_contents:
+            changed_lines.update(parse_unified_diff(diff_contents.read()))
+    else:
+        return None
+    return changed_lines
+
+
+def get_changed_statements(
+    tree: ast.Module,
+    changed_lines: AbstractSet[int],
+) -> List[ast.stmt]:
+    r"""
+    Returns top-level statements that overlap with the changed lines.
+
+    Each statement owns all lines till the next statement starts,
+    so trailing comments and blank lines belong to the previous statement.
+
+    >>> module = ast.parse('first = 1\n\ndef second():\n    return 2\n')
+    >>> [type(node).__name__ for node in get_changed_statements(
+    ...     module, frozenset((4,)),
+    ... )]
+    ['FunctionDef']
+
+    >>> get_changed_statements(module, frozenset((20,)))[0].name
+    'second'
+
+    >>> get_changed_statements(module, frozenset())
+    []
+
+    """
+    sorted_lines = sorted(changed_lines)
+    last_line = sorted_lines[-1] if sorted_lines else 0
+    return [
+        statement
+        for statement, start, end in get_statement_spans(tree, last_line)
+        if _has_line_between(sorted_lines, start, end)
+    ]
+
+
+def get_statement_spans(
+    tree: ast.Module,
+    last_line: int,
+) -> List[Tuple[ast.stmt, int, int]]:
+    r"""
+    Returns top-level statements with their first and last lines.
+
+    Statements start with their decorators.
+    The last statement ends on the given line.
+
+    >>> module = ast.parse('@decorator\ndef first(): ...\nsecond = 2\n')
+    >>> [(type(node).__name__, start, end) for node, start, end in (
+    ...     get_statement_spans(module, 4)
+    ... )]
+    [('FunctionDef', 1, 2), ('Assign', 3, 4)]
+
+    """
+    starts = []
+    for statement in tree.body:
+        decorators = getattr(statement, 'decorator_list', [])
+        starts.append(min(
+            [statement.lineno, *(decorator.lineno for decorator in decorators)],
+        ))
+
+    ends = [next_start - 1 for next_start in starts[1:]]
+    ends.append(last_line)
+    return list(zip(tree.body, starts, ends))
+
+
+@final
+class _Hunk(object):
+    """Reads lines of a single hunk and tracks changed line numbers."""
+
+    def __init__(self, header: Match[str]) -> None:
+        self._old_left = int(header.group(1) or 1)
+        self._new_left = int(header.group(3) or 1)
+        self._line_number = int(header.group(2))
+        self._only_removed = False
+
+        if not self._new_left:
+            # Empty ranges point to the line right before the change:
+            self._line_number += 1
+
+    def changed_lines(self, lines: Iterator[str]) -> Iterator[int]:
+        """Consumes exactly this hunk's lines from the shared iterator."""
+        while self._old_left > 0 or self._new_left > 0:
+            marker = next(lines, ' ')[:1]
+            if marker == '+':
+                yield self._line_number
+                self._move(old=0)
+            elif marker == '-':
+                self._old_left -= 1
+                self._only_removed = True
+            elif marker != '\\':  # means `\ No newline at end of file`
+                yield from self._removed_before()
+                self._move(old=1)
+
+        yield from self._removed_before()
+
+    def _move(self, *, old: int) -> None:
+        self._line_number += 1
+        self._old_left -= old
+        self._new_left -= 1
+        self._only_removed = False
+
+    def _removed_before(self) -> Iterator[int]:
+        if self._only_removed:
+            yield max(self._line_number - 1, 1)
+
+
+def _target_lines(changed: DefaultDict[str, Set[int]], header: str) -> Set[int]:
+    filename = header.split('\t')[0].rstrip()
+    if filename == _NO_FILE:
+        return set()  # deleted files are just ignored
+    if filename.startswith(_GIT_PREFIX):
+        filename = filename[len(_GIT_PREFIX):]
+    return changed[os.path.abspath(filename)]
+
+
+def _has_line_between(
+    sorted_lines: Sequence[int],
+    start: int,
+    end: int,
+) -> bool:
+    index = bisect.bisect_left(sorted_lines, start)
+    return index < len(sorted_lines) and sorted_lines[index] <= end
@@ -3,8 +3,7 @@
 from ast import Call, Yield, YieldFrom, arg
 from typing import Container, List, Optional
 
-import astor
-
+from wemake_python_styleguide.logic.naming.name_nodes import get_dotted_name
 from wemake_python_styleguide.logic.walk import is_contained
 from wemake_python_styleguide.types import (
     AnyFunctionDef,
@@ -24,9 +23,13 @@ def given_function_called(node: Call, to_check: Container[str]) -> str:
     >>> given_function_called(module.body[0].value, ['adjust'])
     ''
 
+    >>> module = ast.parse('sys.exit(1)')
+    >>> given_function_called(module.body[0].value, {'sys.exit'})
+    'sys.exit'
+
     """
-    function_name = astor.to_source(node.func).strip()
-    if function_name in to_check:
+    function_name = get_dotted_name(node.func)
+    if function_name and function_name in to_check:
         return function_name
     return ''
 
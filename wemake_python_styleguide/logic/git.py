@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+import subprocess  # noqa: S404
+from typing import List
+
+
+def get_diff(revision: str) -> str:
+    """
+    Returns ``git diff`` of the working tree and the given revision.
+
+    Paths are relative to the current directory,
+    the same way ``flake8`` reports them.
+
+    Raises:
+        ValueError: when ``git`` fails, for example, for unknown revisions.
+
+    """
+    return _run_git(
+        'diff',
+        '--no-color',
+        '--no-ext-diff',
+        '--relative',
+        '--unified=0',
+        revision,
+        '--',
+    )
+
+
+def get_untracked_files() -> List[str]:
+    """
+    Returns untracked files, that are not ignored, inside current directory.
+
+    They are not a part of any diff, so they are changed as a whole.
+    """
+    untracked_files = _run_git(
+        'ls-files', '--others', '--exclude-standard', '-z',
+    )
+    return list(filter(None, untracked_files.split('\0')))
+
+
+def _run_git(*arguments: str) -> str:
+    try:
+        return subprocess.run(  # noqa: S603, S607
+            ['git', *arguments],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            check=True,
+        ).stdout
+    except subprocess.CalledProcessError as git_error:
+        raise ValueError('Can not read changes with `git {0}`: {1}'.format(
+            ' '.join(arguments), git_error.stderr.strip(),
+        ))
+    except OSError as os_error:
+        raise ValueError('Can not run `git`: {0}'.format(os_error))
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+import ast
+from typing import Iterator, Tuple
+
+from typing_extensions import Final, final
+
+#: We do not care whether the same expression is loaded or stored.
+_IGNORED_FIELDS: Final = frozenset(('ctx',))
+
+
+def get_hash(node: ast.AST) -> int:
+    r"""
+    Returns the structural hash of a node.
+
+    It is a bottom-up hash: each node combines its type,
+    its primitive fields, and the hashes of its child nodes.
+    Positions are not taken into account, so the same expressions
+    written in different places have the same hash.
+
+    Hashes are computed lazily and cached on nodes for the file's lifetime,
+    so we compute each hash only once even for deeply nested expressions.
+
+    >>> first = ast.parse('call(x, y=[1, 2])').body[0].value
+    >>> second = ast.parse('\n\ncall(x,   y=[1, 2])').body[0].value
+    >>> get_hash(first) == get_hash(second)
+    True
+
+    >>> get_hash(ast.parse('1').body[0]) == get_hash(ast.parse('1.0').body[0])
+    False
+
+    """
+    node_hash = getattr(node, 'wps_hash', None)
+    if node_hash is None:
+        node_hash = hash((
+            type(node),
+            *(_hash_value(field) for field in _iter_fields(node)),
+        ))
+        setattr(node, 'wps_hash', node_hash)  # noqa: B010
+    return node_hash
+
+
+def is_same_structure(first: ast.AST, second: ast.AST) -> bool:
+    """
+    Tells whether two nodes represent the same code.
+
+    We use it to resolve hash collisions, so hashes are compared first.
+
+    >>> first = ast.parse('(a, b) = x').body[0].targets[0]
+    >>> second = ast.parse('print((a, b))').body[0].value.args[0]
+    >>> is_same_structure(first, second)
+    True
+
+    >>> first = ast.parse('x + 1').body[0]
+    >>> second = ast.parse('x + 2').body[0]
+    >>> is_same_structure(first, second)
+    False
+
+    >>> is_same_structure(ast.parse('x').body[0], ast.parse('1').body[0].value)
+    False
+
+    """
+    if type(first) is not type(second):
+        return False
+    if get_hash(first) != get_hash(second):
+        return False
+    return get_structure(first) == get_structure(second)
+
+
+def get_structure(node: ast.AST) -> Tuple[object, ...]:
+    """
+    Returns the structure of a node as nested tuples.
+
+    It has the node's type, its primitive fields with their types,
+    and the structures of its child nodes.
+    Structures are cached on nodes just like hashes,
+    so comparing the same node again does not walk its subtree.
+
+    >>> get_structure(ast.parse('x').body[0].value)[0] is ast.Name
+    True
+
+    >>> first = ast.parse('[1]').body[0]
+    >>> second = ast.parse('[1.0]').body[0]
+    >>> get_structure(first) == get_structure(second)
+    False
+
+    """
+    structure = getattr(node, 'wps_structure', None)
+    if structure is None:
+        structure = (
+            type(node),
+            *(_get_value_structure(field) for field in _iter_fields(node)),
+        )
+        setattr(node, 'wps_structure', structure)  # noqa: B010
+    return structure
+
+
+@final
+class NodeKey(object):
+    """
+    Wraps a node to be used as a key in sets, dicts, and counters.
+
+    Keys are equal when nodes have the same structure.
+    When several equal nodes are added to a dict,
+    it keeps the first one as a key.
+
+    >>> first, second, third = ast.parse('[x, x, y]').body[0].value.elts
+    >>> len({NodeKey(first), NodeKey(second), NodeKey(third)})
+    2
+    >>> NodeKey(first) == first
+    False
+
+    """
+
+    __slots__ = ('node', '_hash')
+
+    def __init__(self, node: ast.AST) -> None:
+        """Computes the hash once, we use it for all lookups."""
+        self.node = node
+        self._hash = get_hash(node)
+
+    def __hash__(self) -> int:
+        """Returns the structural hash of the wrapped node."""
+        return self._hash
+
+    def __eq__(self, other) -> bool:
+        """Compares cached structures of the wrapped nodes."""
+        if not isinstance(other, NodeKey):
+            return False
+        return is_same_structure(self.node, other.node)
+
+
+def _iter_fields(node: ast.AST) -> Iterator[object]:
+    for field_name, field in ast.iter_fields(node):
+        if field_name not in _IGNORED_FIELDS:
+            yield field
+
+
+def _hash_value(field) -> int:
+    if isinstance(field, ast.AST):
+        return get_hash(field)
+    elif isinstance(field, list):
+        return hash(tuple(_hash_value(element) for element in field))
+    # `1` and `1.0` are equal, but they are different constants:
+    return hash((type(field), field))
+
+
+def _get_value_structure(field) -> object:
+    if isinstance(field, ast.AST):
+        return get_structure(field)
+    elif isinstance(field, list):
+        return tuple(_get_value_structure(element) for element in field)
+    # `1` and `1.0` are equal, but they are different constants:
+    return (type(field), field)
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+import ast
+import os
+import tokenize
+from itertools import islice
+from typing import Optional, Sequence
+
+from typing_extensions import Final
+
+from wemake_python_styleguide.types import ConfigurationOptions
+
+#: Tokens that can be a part of module's header.
+_HEADER_TOKENS: Final = frozenset((
+    tokenize.ENCODING,
+    tokenize.COMMENT,
+    tokenize.NL,
+    tokenize.NEWLINE,
+))
+
+
+def get_huge_module_reason(
+    tree: ast.AST,
+    file_tokens: Sequence[tokenize.TokenInfo],
+    filename: str,
+    options: ConfigurationOptions,
+) -> Optional[str]:
+    """
+    Tells why a module is too huge or generated to be fully checked.
+
+    All checks here are cheap and do not need ``transform()`` to be called.
+    The most expensive one is ``ast`` nodes counting,
+    we run it last and stop counting as soon as the limit is reached.
+
+    Returns ``None`` for regular modules.
+    """
+    marker = _find_generated_marker(file_tokens, options.generated_markers)
+    if marker is not None:
+        return 'header contains "{0}"'.format(marker)
+
+    lines = _count_lines(file_tokens)
+    if lines > options.max_module_lines:
+        return '{0} lines'.format(lines)
+
+    module_bytes = _count_bytes(filename)
+    if module_bytes > options.max_module_bytes:
+        return '{0} bytes'.format(module_bytes)
+
+    if _has_more_nodes(tree, options.max_module_nodes):
+        return 'more than {0} ast nodes'.format(options.max_module_nodes)
+    return None
+
+
+def _find_generated_marker(
+    file_tokens: Sequence[tokenize.TokenInfo],
+    markers: Sequence[str],
+) -> Optional[str]:
+    for token in file_tokens:
+        if token.exact_type not in _HEADER_TOKENS:
+            break
+        for marker in markers:
+            if marker in token.string:
+                return marker
+    return None
+
+
+def _count_lines(file_tokens: Sequence[tokenize.TokenInfo]) -> int:
+    if not file_tokens:
+        return 0
+    return file_tokens[-1].start[0] - 1  # the last one is `ENDMARKER`
+
+
+def _count_bytes(filename: str) -> int:
+    if not os.path.isfile(filename):
+        return 0  # it can be `stdin` or a module we are not allowed to read
+    return os.path.getsize(filename)
+
+
+def _has_more_nodes(tree: ast.AST, max_nodes: int) -> bool:
+    all_nodes = islice(ast.walk(tree), max_nodes + 1)
+    return sum(1 for _ in all_nodes) > max_nodes
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+import gc
+import multiprocessing
+from contextlib import contextmanager
+from multiprocessing.pool import Pool
+from typing import Callable, Iterator
+
+from typing_extensions import Final
+
+from wemake_python_styleguide.compat.functions import freeze, unfreeze
+from wemake_python_styleguide.types import ConfigurationOptions
+
+#: Allocations between young collections in processes that check modules.
+CHECK_THRESHOLD: Final = 20000
+
+
+def delay_collections() -> None:
+    """
+    Collects young objects less often in the current process.
+
+    ``ast`` nodes are allocated by thousands and live until the module
+    is checked. So, frequent young collections only move them to older
+    generations, and scan long-lived modules, visitors, and options.
+    Older generations keep their thresholds.
+
+    It is only called in workers of :func:`preloaded_pool`,
+    they do nothing but check modules, so the threshold is never restored.
+    Other processes, like editors that run our checks, keep their thresholds.
+    """
+    young_threshold, *older_thresholds = gc.get_threshold()
+    gc.set_threshold(max(CHECK_THRESHOLD, young_threshold), *older_thresholds)
+
+
+@contextmanager
+def preloaded_pool(
+    jobs: int,
+    initializer: Callable[[ConfigurationOptions], object],
+    options: ConfigurationOptions,
+) -> Iterator[Pool]:
+    """
+    Creates a pool of workers, that share the state of the current process.
+
+    When workers are forked, they already have all modules imported
+    and all options validated, so ``initializer`` is not called.
+    We freeze all objects before forking, so the garbage collector
+    in workers does not touch them and their memory pages stay shared.
+
+    Other start methods create new processes, they call ``initializer``.
+    All workers collect young objects less often, see :func:`delay_collections`.
+    """
+    if multiprocessing.get_start_method(allow_none=False) == 'fork':
+        pool = _fork_pool(jobs)
+    else:  # pragma: no cover
+        worker_arguments = (initializer, options)
+        pool = multiprocessing.Pool(jobs, _initialize_worker, worker_arguments)
+
+    with pool:
+        yield pool
+
+
+def _fork_pool(jobs: int) -> Pool:
+    gc.collect()
+    freeze()
+    try:  # noqa: WPS501
+        return multiprocessing.Pool(jobs, delay_collections)
+    finally:
+        unfreeze()  # we collect them as usual
+
+
+def _initialize_worker(
+    initializer: Callable[[ConfigurationOptions], object],
+    options: ConfigurationOptions,
+) -> None:  # pragma: no cover
+    delay_collections()
+    initializer(options)
@@ -1,12 +1,17 @@
 # -*- coding: utf-8 -*-
 
-from typing import Iterable
+from typing import Container
+
+from typing_extensions import Final
 
 from wemake_python_styleguide import constants
 from wemake_python_styleguide.logic.naming import access
 
+#: Prefix and suffix we allow for blacklisted names.
+_UNDERSCORE: Final = '_'
+
 
-def is_wrong_name(name: str, to_check: Iterable[str]) -> bool:
+def is_wrong_name(name: str, to_check: Container[str]) -> bool:
     """
     Checks that name is not prohibited by explicitly listing it's name.
 
@@ -28,16 +33,22 @@ def is_wrong_name(name: str, to_check: Iterable[str]) -> bool:
     >>> is_wrong_name('__wrong', ['wrong'])
     False
 
+    >>> is_wrong_name('__wrong', ['_wrong'])
+    True
+
+    >>> is_wrong_name('_', ['wrong'])
+    False
+
+    We do not build ``_name`` and ``name_`` variants for each listed name.
+    Instead, we strip a single underscore from the checked name
+    and look it up. It is a constant time operation for ``frozenset`` values.
+
     """
-    for name_to_check in to_check:
-        choices_to_check = {
-            name_to_check,
-            '_{0}'.format(name_to_check),
-            '{0}_'.format(name_to_check),
-        }
-        if name in choices_to_check:
-            return True
-    return False
+    if name in to_check:
+        return True
+    if name.startswith(_UNDERSCORE) and name[1:] in to_check:
+        return True
+    return name.endswith(_UNDERSCORE) and name[:-1] in to_check
 
 
 def is_upper_case_name(name: str) -> bool:
@@ -2,6 +2,7 @@
 
 import ast
 import itertools
+import sys
 from typing import Iterable, List, Optional
 
 from wemake_python_styleguide.compat.functions import get_assign_targets
@@ -106,3 +107,39 @@ def extract_name(node: ast.AST) -> Optional[str]:
     if isinstance(node, ast.Name):
         return node.id
     return None
+
+
+def get_dotted_name(node: ast.AST) -> Optional[str]:
+    """
+    Returns dotted names of ``ast.Name`` and ``ast.Attribute`` chains.
+
+    Returns ``None`` for other nodes: calls, subscripts, literals, etc.
+    It is much faster than rendering the source code of a node.
+
+    Names are interned and cached on attribute nodes,
+    so each chain is resolved only once for all visitors.
+
+    >>> import ast
+    >>> get_dotted_name(ast.parse('os.path.join').body[0].value)
+    'os.path.join'
+
+    >>> get_dotted_name(ast.parse('(first).second').body[0].value)
+    'first.second'
+
+    >>> print(get_dotted_name(ast.parse('call().attr').body[0].value))
+    None
+
+    """
+    if isinstance(node, ast.Name):
+        return node.id  # identifiers are already interned by the parser
+    if not isinstance(node, ast.Attribute):
+        return None
+
+    dotted_name = getattr(node, 'wps_dotted_name', None)
+    if dotted_name is None:
+        base_name = get_dotted_name(node.value)
+        dotted_name = sys.intern(
+            '{0}.{1}'.format(base_name, node.attr),
+        ) if base_name else ''
+        setattr(node, 'wps_dotted_name', dotted_name)  # noqa: B010
+    return dotted_name or None
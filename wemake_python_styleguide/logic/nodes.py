@@ -1,8 +1,13 @@
 # -*- coding: utf-8 -*-
 
 import ast
-from typing import Optional
+from typing import Optional, Sequence
 
+from wemake_python_styleguide.logic.safe_eval import (
+    LITERAL_VALUE,
+    NOT_EVALUATED,
+    VALUE_WITH_NAMES,
+)
 from wemake_python_styleguide.types import ContextNodes
 
 
@@ -10,15 +15,39 @@ def is_literal(node: ast.AST) -> bool:
     """
     Checks for nodes that contains only constants.
 
-    If the node contains only literals it will be evaluated.
+    If the node contains only literals it is evaluated in ``transform()``.
     When node relies on some other names, it won't be evaluated.
     """
-    try:
-        ast.literal_eval(node)
-    except ValueError:
-        return False
-    else:
-        return True
+    return getattr(
+        node, LITERAL_VALUE, NOT_EVALUATED,
+    ) is not NOT_EVALUATED
+
+
+def get_literal_value(node: ast.AST):
+    """
+    Returns the evaluated value of a literal node.
+
+    Returns ``None`` when the node is not a literal,
+    use :func:`is_literal` to tell it apart from ``None`` constants.
+    """
+    return getattr(node, LITERAL_VALUE, None)
+
+
+def has_value_with_names(node: ast.AST) -> bool:
+    """Checks for nodes that contain only constants and names."""
+    return getattr(
+        node, VALUE_WITH_NAMES, NOT_EVALUATED,
+    ) is not NOT_EVALUATED
+
+
+def get_value_with_names(node: ast.AST):
+    """
+    Returns the evaluated value of a node with constants and names.
+
+    Names are represented as strings, strings themselves are quoted.
+    Returns ``None`` when the node can not be evaluated.
+    """
+    return getattr(node, VALUE_WITH_NAMES, None)
 
 
 def get_parent(node: ast.AST) -> Optional[ast.AST]:
@@ -29,3 +58,13 @@ def get_parent(node: ast.AST) -> Optional[ast.AST]:
 def get_context(node: ast.AST) -> Optional[ContextNodes]:
     """Returns the context or ``None`` if node has no context."""
     return getattr(node, 'wps_context', None)
+
+
+def get_context_nodes(node: ast.AST) -> Sequence[ast.AST]:
+    """
+    Returns all nodes that have the given node as their context.
+
+    Nested contexts are included, but their own nodes are not.
+    Returns an empty sequence for nodes that are not contexts.
+    """
+    return getattr(node, 'wps_context_nodes', ())
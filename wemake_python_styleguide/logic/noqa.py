@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+import re
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+
+from typing_extensions import Final
+
+from wemake_python_styleguide.logic.comments import Comment
+from wemake_python_styleguide.types import ConfigurationOptions
+
+#: The same regex ``flake8`` uses, see ``flake8.defaults.NOQA_INLINE_REGEXP``.
+_NOQA_PATTERN: Final = re.compile(
+    r'# noqa(?::[\s]?(?P<codes>([A-Z]+[0-9]+(?:[,\s]+)?)+))?',
+    re.IGNORECASE,
+)
+
+#: Separates listed codes, see ``flake8.utils.parse_comma_separated_list``.
+_CODES_SEPARATOR: Final = re.compile(r'[,\s]')
+
+#: Codes listed in ``# noqa``, ``None`` means all codes.
+_Codes = Optional[Tuple[str, ...]]
+
+#: Codes ignored with ``# noqa`` per line.
+SuppressedCodes = Mapping[int, _Codes]
+
+
+def get_suppressed_codes(
+    comments: Iterable[Comment],
+    options: ConfigurationOptions,
+) -> SuppressedCodes:
+    r"""
+    Returns codes that ``flake8`` will ignore on each line.
+
+    We use the same regex on the same physical lines as ``flake8`` does.
+    But we only check lines with comments, so lines where ``# noqa``
+    is a part of a string are left for ``flake8`` to ignore.
+
+    Nothing is ignored when ``--disable-noqa`` is used.
+
+    >>> import io, tokenize, types
+    >>> from wemake_python_styleguide.logic.comments import get_comments
+    >>> source = 'x = 1  # noqa\ny = 2  # noqa: WPS1, E501\nz = 3  # noqa:'
+    >>> file_tokens = tokenize.generate_tokens(io.StringIO(source).readline)
+    >>> comments = get_comments(list(file_tokens))
+    >>> options = types.SimpleNamespace(disable_noqa=False)
+    >>> get_suppressed_codes(comments, options)
+    {1: None, 2: ('WPS1', 'E501'), 3: None}
+    >>> options = types.SimpleNamespace(disable_noqa=True)
+    >>> len(get_suppressed_codes(comments, options))
+    0
+
+    """
+    suppressed_codes: Dict[int, _Codes] = {}
+    if options.disable_noqa:
+        return suppressed_codes
+
+    for comment in comments:
+        match = _NOQA_PATTERN.search(comment.token.line)
+        if match is None:
+            continue
+
+        codes = match.group('codes')  # it is `None` for a blanket `noqa`
+        suppressed_codes[comment.line_number] = tuple(
+            filter(None, _CODES_SEPARATOR.split(codes)),
+        ) if codes else None
+    return suppressed_codes
+
+
+def is_suppressed(
+    suppressed_codes: SuppressedCodes,
+    line_number: int,
+    code: str,
+) -> bool:
+    """
+    Tells whether ``flake8`` will ignore a code on this line.
+
+    Codes listed in ``# noqa`` are also used as prefixes, like in ``flake8``.
+
+    >>> is_suppressed({1: ('WPS1',)}, 1, 'WPS110')
+    True
+    >>> is_suppressed({1: ('WPS1',)}, 1, 'WPS220')
+    False
+    >>> is_suppressed({1: None}, 2, 'WPS220')
+    False
+
+    """
+    if line_number not in suppressed_codes:
+        return False
+    codes = suppressed_codes[line_number]
+    return codes is None or code.startswith(codes)
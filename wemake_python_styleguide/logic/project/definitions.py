@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+import ast
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from typing_extensions import Final
+
+from wemake_python_styleguide.compat.aliases import FunctionNodes
+from wemake_python_styleguide.logic.naming.name_nodes import (
+    flat_variable_names,
+)
+
+_DOT: Final = '.'
+
+#: Defined name and the assigned value, if there is any.
+_Definition = Tuple[str, Optional[ast.AST]]
+
+
+def get_exports(tree: ast.AST) -> Iterator[str]:
+    r"""
+    Returns names from ``__all__`` or all public top-level names.
+
+    >>> sorted(get_exports(ast.parse('import os.path\nx, _y = 1, 2')))
+    ['os', 'x']
+
+    >>> list(get_exports(ast.parse('__all__ = ("x",)\nx: int = 1')))
+    ['x']
+
+    """
+    all_names: Optional[List[str]] = None
+    public_names: List[str] = []
+    for statement in getattr(tree, 'body', []):
+        for target, target_value in _get_definitions(statement):
+            if target == '__all__':
+                all_names = _get_all_names(target_value)
+            elif not target.startswith('_'):
+                public_names.append(target)
+    return iter(public_names if all_names is None else all_names)
+
+
+def get_imported_modules(
+    nodes: Sequence[ast.AST],
+    module_name: str,
+    *,
+    is_package: bool,
+) -> Iterator[str]:
+    r"""
+    Returns absolute names of imported modules.
+
+    Relative imports are resolved with the name of the current module.
+    ``from . import name`` is treated as an import of a submodule.
+
+    >>> tree = ast.parse('import a.b\nfrom .c import d\nfrom .. import e')
+    >>> sorted(get_imported_modules(
+    ...     list(ast.walk(tree)), 'pkg.sub.mod', is_package=False,
+    ... ))
+    ['a.b', 'pkg.e', 'pkg.sub.c']
+
+    """
+    package_parts = module_name.split(_DOT)
+    if not is_package:
+        package_parts = package_parts[:-1]
+
+    for node in nodes:
+        if isinstance(node, ast.Import):
+            yield from (alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            yield from _get_imported_from(node, package_parts)
+
+
+def _get_definitions(statement: ast.AST) -> Iterator[_Definition]:
+    if isinstance(statement, (ast.ClassDef, *FunctionNodes)):
+        yield statement.name, None
+    elif isinstance(statement, (ast.Import, ast.ImportFrom)):
+        for alias in statement.names:
+            yield (alias.asname or alias.name).split(_DOT)[0], None
+    elif isinstance(statement, (ast.Assign, ast.AnnAssign)):
+        for target in flat_variable_names([statement]):
+            yield target, statement.value
+
+
+def _get_all_names(all_value: Optional[ast.AST]) -> List[str]:
+    return [
+        element.s
+        for element in getattr(all_value, 'elts', [])
+        if isinstance(element, ast.Str)
+    ]
+
+
+def _get_imported_from(
+    node: ast.ImportFrom,
+    package_parts: List[str],
+) -> List[str]:
+    base = _resolve_relative(package_parts, node.level)
+    if node.module:
+        return [_DOT.join([*base, node.module])]
+    return [_DOT.join([*base, alias.name]) for alias in node.names]
+
+
+def _resolve_relative(package_parts: List[str], level: int) -> List[str]:
+    if not level:
+        return []
+    return package_parts[:max(len(package_parts) - level + 1, 0)]
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+
+import ast
+import hashlib
+import json
+import os
+import tempfile
+import time
+import tokenize
+from collections import defaultdict
+from typing import (
+    DefaultDict,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+)
+
+import attr
+from typing_extensions import Final, final
+
+from wemake_python_styleguide.logic.project.modules import (
+    ModuleInfo,
+    collect_module_info,
+    get_module_name,
+)
+
+#: Each module is stored in its own file, so parallel processes do not clash.
+_MODULE_SUFFIX: Final = '.json'
+
+#: Modules are written to temporary files first, then they are renamed.
+_TEMP_SUFFIX: Final = '.tmp'
+
+#: Temporary files older than this number of seconds were left by crashes.
+_STALE_TEMP_AGE: Final = 10 * 60
+
+
+@final
+class ProjectIndex(object):
+    """
+    Persistent on-disk index of all checked modules in a project.
+
+    Each module is stored in a separate ``json`` file named after it.
+    So, we can update and read modules one by one
+    without loading the whole index, even for huge projects.
+    Files are replaced atomically, different ``flake8`` jobs
+    can safely work with the same index.
+
+    Modules are updated only when their content hash is changed.
+    Unreadable modules are treated as missing ones, so they are indexed again.
+    Temporary files left by crashed processes are removed.
+    Visitors can use this class to query other modules of the project.
+
+    All modules are read once, on the first query.
+    Then we keep them in memory with the map of their importers.
+    We also check that their files exist only once.
+    """
+
+    def __init__(self, directory: str) -> None:
+        """Creates index in the given directory, reuses existing one."""
+        self._directory = directory
+        self._modules: Dict[str, Optional[ModuleInfo]] = {}
+        self._importers: Optional[_ImportersMap] = None
+        self._files: Dict[str, bool] = {}
+        os.makedirs(directory, exist_ok=True)
+        _remove_stale_files(directory)
+
+    def update(
+        self,
+        tree: ast.AST,
+        file_tokens: Sequence[tokenize.TokenInfo],
+        filename: str,
+    ) -> Optional[ModuleInfo]:
+        """
+        Updates the module in the index, if its contents were changed.
+
+        Returns the current module's info.
+        Returns ``None`` for sources that are not files, like ``stdin``.
+        We hash lines of the given tokens, files are not read again.
+        """
+        name = get_module_name(filename)
+        if not name or not os.path.isfile(filename):
+            return None
+
+        self._files[filename] = True
+        content_hash = _hash_lines(file_tokens)
+        module = self.get_module(name)
+        if module is None or module.content_hash != content_hash:
+            module = collect_module_info(
+                tree, file_tokens, filename, content_hash,
+            )
+            self._write(module)
+        return module
+
+    def get_module(self, name: str) -> Optional[ModuleInfo]:
+        """Returns module by its dotted name or ``None`` if it is unknown."""
+        if name not in self._modules:
+            self._modules[name] = _read_module(self._directory, name)
+        return self._modules[name]
+
+    def iter_modules(self) -> Iterator[ModuleInfo]:
+        """Iterates over all indexed modules that still exist."""
+        self._load_importers()  # it loads all modules
+        yield from _existing(
+            (self._modules[name] for name in sorted(self._modules)),
+            self._files,
+        )
+
+    def get_importers(self, name: str) -> List[ModuleInfo]:
+        """Returns all modules that import the given module."""
+        importers = self._load_importers().get(name)
+        return list(_existing(map(self.get_module, importers), self._files))
+
+    def _load_importers(self) -> '_ImportersMap':
+        if self._importers is None:
+            for index_file in os.listdir(self._directory):
+                if index_file.endswith(_MODULE_SUFFIX):
+                    self.get_module(index_file[:-len(_MODULE_SUFFIX)])
+
+            self._importers = _ImportersMap()
+            for module in self._modules.values():
+                self._importers.link(None, module)
+        return self._importers
+
+    def _write(self, module: ModuleInfo) -> None:
+        file_descriptor, temp_path = tempfile.mkstemp(
+            suffix=_TEMP_SUFFIX, dir=self._directory,
+        )
+        with os.fdopen(file_descriptor, 'w') as index_file:
+            json.dump(attr.asdict(module), index_file)
+        os.replace(
+            temp_path,
+            os.path.join(self._directory, module.name + _MODULE_SUFFIX),
+        )
+        if self._importers is not None:
+            self._importers.link(self._modules.get(module.name), module)
+        self._modules[module.name] = module
+
+
+@final
+class _ImportersMap(object):
+    """Names of modules that import each module, it is the reverse map."""
+
+    def __init__(self) -> None:
+        self._importers: DefaultDict[str, Set[str]] = defaultdict(set)
+
+    def link(
+        self,
+        old_module: Optional[ModuleInfo],
+        new_module: Optional[ModuleInfo],
+    ) -> None:
+        """Replaces imports of the old module with imports of the new one."""
+        if old_module is not None:
+            for old_import in old_module.imports:
+                self._importers[old_import].discard(old_module.name)
+        if new_module is not None:
+            for new_import in new_module.imports:
+                self._importers[new_import].add(new_module.name)
+
+    def get(self, name: str) -> List[str]:
+        """Returns sorted names of modules that import the given one."""
+        return sorted(self._importers.get(name, ()))
+
+
+def _read_module(directory: str, name: str) -> Optional[ModuleInfo]:
+    index_path = os.path.join(directory, name + _MODULE_SUFFIX)
+    try:
+        with open(index_path) as index_file:
+            return ModuleInfo(**json.load(index_file))
+    except (OSError, ValueError, TypeError):
+        return None  # missing, unfinished, or written by an older version
+
+
+def _existing(
+    modules: Iterable[Optional[ModuleInfo]],
+    files: Dict[str, bool],
+) -> Iterator[ModuleInfo]:
+    for module in modules:
+        if module is None:
+            continue
+        if module.filename not in files:
+            files[module.filename] = os.path.isfile(module.filename)
+        if files[module.filename]:
+            yield module
+
+
+def _hash_lines(file_tokens: Sequence[tokenize.TokenInfo]) -> str:
+    content_hash = hashlib.sha256()
+    last_line = 0
+    for token in file_tokens:
+        if token.start[0] > last_line:  # multiline tokens have all lines
+            content_hash.update(token.line.encode('utf-8', 'surrogatepass'))
+            last_line = token.end[0]
+    return content_hash.hexdigest()
+
+
+def _remove_stale_files(directory: str) -> None:
+    stale_time = time.time() - _STALE_TEMP_AGE
+    for index_file in os.scandir(directory):
+        if index_file.name.endswith(_TEMP_SUFFIX):
+            _remove_stale_file(index_file.path, stale_time)
+
+
+def _remove_stale_file(path: str, stale_time: float) -> None:
+    try:
+        if os.stat(path).st_mtime < stale_time:
+            os.remove(path)
+    except OSError:
+        return  # other process has already renamed it
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+import ast
+import os
+import tokenize
+from pathlib import PurePath
+from typing import Iterable, Sequence, Tuple
+
+import attr
+from typing_extensions import final
+
+from wemake_python_styleguide import constants
+from wemake_python_styleguide.compat.aliases import FunctionNodes
+from wemake_python_styleguide.logic.project import definitions
+
+
+def _as_tuple(names: Iterable[str]) -> Tuple[str, ...]:
+    return tuple(names)  # `json` stores tuples as lists
+
+
+@final
+@attr.dataclass(frozen=True, slots=True)
+class ModuleInfo(object):
+    """Represents everything we know about a single module of a project."""
+
+    #: Dotted name, relative to the current directory.
+    name: str
+
+    #: File name as it was passed by ``flake8``.
+    filename: str
+
+    #: Hash of the file's contents, we use it to skip unchanged modules.
+    content_hash: str
+
+    #: Public names that can be imported from this module.
+    exports: Tuple[str, ...] = attr.ib(converter=_as_tuple)
+
+    #: Absolute names of all the modules imported by this module.
+    imports: Tuple[str, ...] = attr.ib(converter=_as_tuple)
+
+    # Metrics:
+    lines: int
+    classes: int
+    functions: int
+
+
+def get_module_name(filename: str) -> str:
+    """
+    Returns dotted module name relative to the current directory.
+
+    >>> get_module_name('package/module.py')
+    'package.module'
+
+    >>> get_module_name('./package/__init__.py')
+    'package'
+
+    >>> get_module_name('module.py')
+    'module'
+
+    """
+    module_path = PurePath(os.path.relpath(filename)).with_suffix('')
+    parts = module_path.parts
+    if parts and parts[-1] == constants.INIT:
+        parts = parts[:-1]
+    return '.'.join(parts)
+
+
+def collect_module_info(
+    tree: ast.AST,
+    file_tokens: Sequence[tokenize.TokenInfo],
+    filename: str,
+    content_hash: str,
+) -> ModuleInfo:
+    """Collects module's exports, imports, and metrics in a single pass."""
+    name = get_module_name(filename)
+    is_package = PurePath(filename).stem == constants.INIT
+    nodes = list(ast.walk(tree))
+    return ModuleInfo(
+        name=name,
+        filename=filename,
+        content_hash=content_hash,
+        exports=sorted(set(definitions.get_exports(tree))),
+        imports=sorted(set(definitions.get_imported_modules(
+            nodes, name, is_package=is_package,
+        ))),
+        lines=file_tokens[-1].start[0] - 1 if file_tokens else 0,
+        classes=sum(isinstance(node, ast.ClassDef) for node in nodes),
+        functions=sum(isinstance(node, FunctionNodes) for node in nodes),
+    )
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import types
 from ast import (
     AST,
     Add,
@@ -18,74 +19,162 @@ from ast import (
     UnaryOp,
     USub,
 )
-from typing import Optional, Union
-
-from wemake_python_styleguide.compat.nodes import Constant
+from typing import Sequence
+from typing import Tuple as TypingTuple
+from typing import Union
 
+from typing_extensions import Final
 
-def _convert_num(node: AST):
-    if isinstance(node, Constant):  # pragma: no cover
-        if isinstance(node.value, (int, float, complex)):
-            return node.value
-    elif isinstance(node, Num):
-        return node.n
-    elif isinstance(node, Name):
-        # We return string names as is, see how we return strings:
-        return node.id
-    raise ValueError('malformed node or string: {0!r}'.format(node))
+from wemake_python_styleguide.compat.nodes import Constant
 
+#: Attribute to store values of nodes that contain only constants.
+LITERAL_VALUE: Final = 'wps_literal_value'
 
-def _convert_signed_num(node: AST):
-    if isinstance(node, UnaryOp) and isinstance(node.op, (UAdd, USub)):
-        operand = _convert_num(node.operand)
-        return +operand if isinstance(node.op, UAdd) else -operand
-    return _convert_num(node)
+#: Attribute to store values of nodes that contain constants and names.
+VALUE_WITH_NAMES: Final = 'wps_value_with_names'
 
+#: Marks nodes that can not be evaluated.
+NOT_EVALUATED: Final = object()
 
-def _convert_complex(node: BinOp) -> Optional[complex]:
-    left = _convert_signed_num(node.left)
-    right = _convert_num(node.right)
-    if isinstance(left, (int, float)) and isinstance(right, complex):
-        if isinstance(node.op, Add):
-            return left + right
-        return left - right
-    return None
+_LEAF_NODES: Final = (Constant, NameConstant, Str, Bytes, Num, Name)
 
+_COLLECTION_NODES: Final = types.MappingProxyType({
+    Tuple: tuple,
+    List: list,
+    Set: set,
+    Dict: dict,
+})
 
-def _convert_iterable(node: Union[Tuple, List, Set, Dict]):
-    if isinstance(node, Tuple):
-        return tuple(map(literal_eval_with_names, node.elts))
-    elif isinstance(node, List):
-        return list(map(literal_eval_with_names, node.elts))
-    elif isinstance(node, Set):
-        return set(map(literal_eval_with_names, node.elts))
-    return dict(zip(
-        map(literal_eval_with_names, node.keys),
-        map(literal_eval_with_names, node.values),
-    ))
+#: Literal value and a value with names, the same order as attributes.
+_Values = TypingTuple[object, object]
+_LeafNode = Union[Constant, NameConstant, Str, Bytes, Num, Name]
+_AnyCollection = Union[Tuple, List, Set, Dict]
 
 
-def literal_eval_with_names(node: AST):
+def evaluate_node(node: AST) -> None:
     """
-    Safely evaluate constants and ``ast.Name`` nodes.
+    Sets evaluated values for nodes that contain constants.
 
-    We need this function to tell
-    that ``[name]`` and ``[name]`` are the same nodes.
+    This function relies on values that are already set on child nodes,
+    so nodes must be evaluated from the bottom to the top.
+    It does not raise any exceptions, we just do not set values for
+    nodes that can not be evaluated.
 
-    Copied from the CPython's source code.
-    Modified to treat ``ast.Name`` nodes as constants.
+    The first value is the same as :py:`ast.literal_eval` returns.
+    The second one treats ``ast.Name`` nodes as constants.
+    We need it to tell that ``[name]`` and ``[name]`` are the same nodes.
+    In this case strings are wrapped to tell the difference
+    between strings and names.
 
+    Copied from the CPython's source code and changed to work bottom-up.
     See: :py:`ast.literal_eval` source.
+
+    >>> import ast
+    >>> tree = ast.parse('(1, -2, 3 + 4j, name, "a")').body[0].value
+    >>> for node in reversed(list(ast.walk(tree))):
+    ...     evaluate_node(node)
+    >>> getattr(tree, LITERAL_VALUE, 'missing')
+    'missing'
+    >>> getattr(tree, VALUE_WITH_NAMES)
+    (1, -2, (3+4j), 'name', '"a"')
+    >>> getattr(tree.elts[4], LITERAL_VALUE)
+    'a'
+
     """
+    if isinstance(node, _LEAF_NODES):
+        node_values = _evaluate_leaf(node)
+    elif isinstance(node, (Tuple, List, Set, Dict)):
+        node_values = _evaluate_collection(node)
+    elif isinstance(node, (UnaryOp, BinOp)):
+        node_values = _evaluate_number(node)
+    else:
+        return
+
+    attributes = (LITERAL_VALUE, VALUE_WITH_NAMES)
+    for attribute, node_value in zip(attributes, node_values):
+        if node_value is not NOT_EVALUATED:
+            setattr(node, attribute, node_value)
+
+
+def _evaluate_leaf(node: _LeafNode) -> _Values:
     if isinstance(node, (Constant, NameConstant)):
-        return node.value
-    elif isinstance(node, (Str, Bytes, Num)):
+        return node.value, node.value
+    elif isinstance(node, Num):
+        return node.n, node.n
+    elif isinstance(node, (Str, Bytes)):
         # We wrap strings to tell the difference between strings and names:
-        return node.n if isinstance(node, Num) else '"{0}"'.format(node.s)
-    elif isinstance(node, (Tuple, List, Set, Dict)):
-        return _convert_iterable(node)
-    elif isinstance(node, BinOp) and isinstance(node.op, (Add, Sub)):
-        maybe_complex = _convert_complex(node)
-        if maybe_complex is not None:
-            return maybe_complex
-    return _convert_signed_num(node)
+        return node.s, '"{0}"'.format(node.s)
+    # We return string names as is, see how we return strings:
+    return NOT_EVALUATED, node.id
+
+
+def _evaluate_collection(node: _AnyCollection) -> _Values:
+    if isinstance(node, Dict):
+        children = [*node.keys, *node.values]
+    else:
+        children = node.elts
+    return (
+        _collection_value(node, children, LITERAL_VALUE),
+        _collection_value(node, children, VALUE_WITH_NAMES),
+    )
+
+
+def _collection_value(
+    node: _AnyCollection,
+    children: Sequence[AST],
+    attribute: str,
+):
+    # Dict keys are `None` for `**kwargs`, these dicts are not evaluated:
+    child_values = [
+        getattr(child, attribute, NOT_EVALUATED) for child in children
+    ]
+    if any(child_value is NOT_EVALUATED for child_value in child_values):
+        return NOT_EVALUATED
+
+    if isinstance(node, Dict):
+        keys_count = len(node.keys)
+        child_values = list(zip(
+            child_values[:keys_count],
+            child_values[keys_count:],
+        ))
+
+    try:
+        return _COLLECTION_NODES[type(node)](child_values)
+    except TypeError:  # unhashable items in sets and dict keys
+        return NOT_EVALUATED
+
+
+def _evaluate_number(node: Union[UnaryOp, BinOp]) -> _Values:
+    if isinstance(node, BinOp):
+        # Since python3.8 `BinOp` only works for complex numbers:
+        left = _signed_number(node.left)
+        right = _number(node.right)
+        is_complex = (
+            isinstance(node.op, (Add, Sub)) and
+            isinstance(left, (int, float)) and
+            isinstance(right, complex)
+        )
+        if not is_complex:
+            return NOT_EVALUATED, NOT_EVALUATED
+        node_value = left + right if isinstance(node.op, Add) else left - right
+    else:
+        node_value = _signed_number(node)
+    return node_value, node_value
+
+
+def _signed_number(node: AST):
+    if isinstance(node, UnaryOp) and isinstance(node.op, (UAdd, USub)):
+        operand = _number(node.operand)
+        if operand is NOT_EVALUATED:
+            return NOT_EVALUATED
+        return +operand if isinstance(node.op, UAdd) else -operand
+    return _number(node)
+
+
+def _number(node: AST):
+    if isinstance(node, Constant):  # pragma: no cover
+        if isinstance(node.value, (int, float, complex)):
+            return node.value
+    elif isinstance(node, Num):
+        return node.n
+    return NOT_EVALUATED
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+import math
+import os
+from typing import Dict, List, Mapping, Optional, Sequence
+
+from typing_extensions import Final
+
+from wemake_python_styleguide.logic.shards import read_costs
+
+#: Each worker gets about this number of tasks, like in ``multiprocessing``.
+TASKS_PER_JOB: Final = 4
+
+
+def estimate_costs(
+    sizes: Mapping[str, int],
+    recorded_costs: Mapping[str, float],
+) -> Dict[str, float]:
+    """
+    Returns costs of modules, file sizes are used for unknown ones.
+
+    Sizes are converted to seconds with the average speed
+    of modules with recorded costs, so all costs are comparable.
+    Recorded costs are stored by normalized paths.
+
+    >>> estimate_costs({'./a.py': 100, 'b.py': 50}, {'a.py': 2.0})
+    {'./a.py': 2.0, 'b.py': 1.0}
+    >>> estimate_costs({'a.py': 100, 'b.py': 50}, dict())
+    {'a.py': 100.0, 'b.py': 50.0}
+
+    """
+    known_costs = {
+        filename: recorded_costs[os.path.normpath(filename)]
+        for filename in sizes
+        if os.path.normpath(filename) in recorded_costs
+    }
+    known_size = sum(sizes[filename] for filename in known_costs)
+    seconds_per_byte = 1.0
+    if known_size:
+        seconds_per_byte = sum(known_costs.values()) / known_size
+
+    return {
+        filename: known_costs.get(filename, size * seconds_per_byte)
+        for filename, size in sizes.items()
+    }
+
+
+def get_tasks(costs: Mapping[str, float], jobs: int) -> List[List[str]]:
+    """
+    Groups modules into tasks, the longest tasks go first.
+
+    Workers take tasks in this order, so the longest modules
+    are never left to be checked when other workers are already idle.
+    Small modules are grouped, so there are about :data:`TASKS_PER_JOB`
+    tasks for each worker. Huge modules are always separate tasks.
+
+    >>> get_tasks({'a.py': 1, 'huge.py': 9, 'b.py': 2, 'c.py': 1}, 1)
+    [['huge.py'], ['b.py', 'a.py'], ['c.py']]
+
+    """
+    task_limit = sum(costs.values()) / (jobs * TASKS_PER_JOB)
+    tasks: List[List[str]] = []
+    task_cost = math.inf  # the first module always starts a new task
+    for filename in sorted(costs, key=lambda path: (-costs[path], path)):
+        if task_cost + costs[filename] > task_limit:
+            tasks.append([])
+            task_cost = 0
+        tasks[-1].append(filename)
+        task_cost += costs[filename]
+    return tasks
+
+
+def get_file_tasks(
+    filenames: Sequence[str],
+    jobs: int,
+    costs_file: Optional[str],
+) -> List[List[str]]:
+    """
+    Groups files into tasks for parallel workers, see :func:`get_tasks`.
+
+    Costs from ``--shard-costs`` file are used, when it is set.
+    Sizes are used for other files, so files are not read here.
+    Files that can not be found are empty.
+    """
+    sizes = {}
+    for filename in filenames:
+        try:
+            sizes[filename] = os.path.getsize(filename)
+        except OSError:
+            sizes[filename] = 0  # workers will report it
+
+    recorded_costs = read_costs(costs_file) if costs_file else {}
+    return get_tasks(estimate_costs(sizes, recorded_costs), jobs)
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import heapq
+import json
+import operator
+import os
+import tempfile
+import zlib
+from typing import Dict, Mapping, Optional, Sequence
+
+from typing_extensions import Final, final
+
+#: Checking costs of modules in seconds by their normalized paths.
+Costs = Dict[str, float]
+
+#: Fields of a single cost record.
+_COST_FIELDS: Final = operator.itemgetter('filename', 'cost')
+
+
+@final
+class Shards(object):
+    """
+    Splits modules between shards, so each shard takes the same time.
+
+    Modules with known costs are balanced between shards.
+    Other modules are assigned by a stable hash of their paths.
+    So, each shard gets the same split on any machine,
+    when paths are relative and costs files are byte-identical,
+    see :meth:`check_costs` to make sure of that.
+
+    New modules are not estimated by their sizes:
+    each process only sees its own modules and in any order,
+    so there is no shared list of new modules to balance.
+    Their costs are balanced from the next run on.
+
+    Costs are stored as ``json`` lines, the last cost of a module wins.
+    New costs are appended, so parallel jobs do not clash,
+    and files from different shards can be simply concatenated.
+    See :func:`compact_costs` to remove outdated costs.
+    """
+
+    def __init__(self, shard: Optional[str], costs_file: Optional[str]) -> None:
+        """Reads costs and splits modules, ``1/1`` is used without shard."""
+        shard_range, _, expected_hash = (shard or '1/1').partition('@')
+        index, total = shard_range.split('/')
+        self._index = int(index) - 1
+        self._total = int(total)
+        self._expected_hash = expected_hash
+        self._costs_file = costs_file
+
+        costs_contents = _read_contents(costs_file)
+        self.costs_hash = hashlib.sha256(costs_contents).hexdigest()
+        self._shards = assign_shards(
+            _load_costs(costs_contents.splitlines()), self._total,
+        )
+
+    def check_costs(self) -> None:
+        """
+        Refuses to split modules by costs that differ from the expected ones.
+
+        Shards are only disjoint, when all of them read the same costs.
+        So, ``--shard=2/8@HASH`` compares the start of the ``sha256`` hash
+        of the costs file with ``HASH``, which is printed by ``sha256sum``
+        before the costs file is copied to all machines.
+
+        Raises:
+            ValueError: when the costs file has a different hash.
+
+        """
+        if not self.costs_hash.startswith(self._expected_hash):
+            raise ValueError(
+                'Costs file {0} has sha256 hash {1}, expected: {2}'.format(
+                    self._costs_file,
+                    self.costs_hash,
+                    self._expected_hash,
+                ),
+            )
+
+    def is_checked(self, filename: str) -> bool:
+        """Tells whether the module belongs to the current shard."""
+        filename = os.path.normpath(filename)
+        shard = self._shards.get(filename)
+        if shard is None:
+            shard = zlib.crc32(filename.encode('utf-8')) % self._total
+        return shard == self._index
+
+    def record(self, filename: str, cost: float) -> None:
+        """Appends the cost of a checked module, if costs are stored."""
+        if self._costs_file:
+            with open(self._costs_file, 'a') as costs_file:
+                costs_file.write(_dump_cost(os.path.normpath(filename), cost))
+
+
+def assign_shards(costs: Mapping[str, float], total: int) -> Dict[str, int]:
+    """
+    Assigns modules to shards, the most expensive modules go first.
+
+    Each module goes to the shard with the lowest total cost so far.
+    Ties are broken by paths and shard numbers, so the result is stable.
+
+    >>> assign_shards({'a.py': 3.0, 'b.py': 2.0, 'c.py': 2.0, 'd.py': 1}, 2)
+    {'a.py': 0, 'b.py': 1, 'c.py': 1, 'd.py': 0}
+
+    """
+    loads = [(0.0, shard) for shard in range(total)]
+    shards = {}
+    for filename in sorted(costs, key=lambda path: (-costs[path], path)):
+        load, shard = heapq.heappop(loads)
+        shards[filename] = shard
+        heapq.heappush(loads, (load + costs[filename], shard))
+    return shards
+
+
+def read_costs(costs_file: str) -> Costs:
+    """
+    Reads the last recorded costs of modules.
+
+    Lines that can not be parsed are skipped,
+    they can be written partially when a job is killed.
+    """
+    return _load_costs(_read_contents(costs_file).splitlines())
+
+
+def compact_costs(costs_file: Optional[str]) -> None:
+    """
+    Rewrites costs without outdated and broken lines, if there are any.
+
+    It must be called before parallel workers are started,
+    otherwise costs appended by them can be lost.
+    """
+    if not costs_file:
+        return
+
+    cost_lines = _read_contents(costs_file).splitlines()
+    costs = _load_costs(cost_lines)
+    if len(cost_lines) == len(costs):
+        return
+
+    file_descriptor, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(costs_file)),
+    )
+    with os.fdopen(file_descriptor, 'w') as compacted_file:
+        compacted_file.writelines(map(_dump_cost, costs.keys(), costs.values()))
+    os.replace(temp_path, costs_file)
+
+
+def _read_contents(costs_file: Optional[str]) -> bytes:
+    if not costs_file or not os.path.isfile(costs_file):
+        return b''
+    with open(costs_file, 'rb') as cost_lines:
+        return cost_lines.read()
+
+
+def _load_costs(cost_lines: Sequence[bytes]) -> Costs:
+    costs: Costs = {}
+    for cost_line in cost_lines:
+        try:
+            filename, cost = _COST_FIELDS(json.loads(cost_line))
+        except (ValueError, LookupError, TypeError):
+            continue
+        if isinstance(filename, str) and isinstance(cost, (int, float)):
+            costs[filename] = cost
+    return costs
+
+
+def _dump_cost(filename: str, cost: float) -> str:
+    return '{0}\n'.format(
+        json.dumps({'filename': filename, 'cost': round(cost, 6)}),
+    )
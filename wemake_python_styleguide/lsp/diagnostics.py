@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+"""Converts violations to diagnostics of the Language Server Protocol."""
+
+import inspect
+from functools import lru_cache
+from typing import Dict, Iterable
+
+from typing_extensions import Final
+
+from wemake_python_styleguide import api
+from wemake_python_styleguide.formatter import DOCS_URL_TEMPLATE
+from wemake_python_styleguide.version import pkg_name, pkg_version
+from wemake_python_styleguide.violations import (
+    best_practices,
+    complexity,
+    consistency,
+    naming,
+    oop,
+    refactoring,
+)
+from wemake_python_styleguide.violations.base import BaseViolation
+
+#: Diagnostic severity, all violations are warnings.
+_WARNING: Final = 2
+
+
+def _is_violation_class(violation_class: object) -> bool:
+    return (
+        inspect.isclass(violation_class) and
+        issubclass(violation_class, BaseViolation) and  # type: ignore
+        getattr(violation_class, 'code', None) is not None
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_docs_urls() -> Dict[str, str]:
+    """
+    Returns links to the docs of the installed version, like the formatter.
+
+    Links are collected on the first diagnostic, not on import.
+    """
+    docs_urls = {}
+    for module in (
+        naming,
+        complexity,
+        consistency,
+        best_practices,
+        refactoring,
+        oop,
+    ):
+        page_url = '{0}{1}.html#'.format(
+            DOCS_URL_TEMPLATE.format(pkg_version),
+            module.__name__.rsplit('.', 1)[-1],
+        )
+        for class_name, violation_class in inspect.getmembers(
+            module, _is_violation_class,
+        ):
+            docs_urls['WPS{0}'.format(str(violation_class.code).zfill(3))] = (
+                page_url + '{0}.{1}'.format(module.__name__, class_name)
+            )
+    return docs_urls
+
+
+def publish_diagnostics(
+    uri: str,
+    violations: Iterable[api.Violation],
+) -> Dict[str, object]:
+    """Returns a notification with all violations of a document."""
+    return {
+        'jsonrpc': '2.0',
+        'method': 'textDocument/publishDiagnostics',
+        'params': {
+            'uri': uri,
+            'diagnostics': [
+                _as_diagnostic(violation) for violation in violations
+            ],
+        },
+    }
+
+
+def _as_diagnostic(violation: api.Violation) -> Dict[str, object]:
+    position = {
+        'line': max(violation.line_number - 1, 0),
+        'character': violation.column_number - 1,
+    }
+    diagnostic: Dict[str, object] = {
+        'range': {'start': position, 'end': position},
+        'severity': _WARNING,
+        'code': violation.code,
+        'source': pkg_name,
+        'message': violation.text,
+    }
+    docs_url = _get_docs_urls().get(violation.code)
+    if docs_url:  # parse errors are not documented by us
+        diagnostic['codeDescription'] = {'href': docs_url}
+    return diagnostic
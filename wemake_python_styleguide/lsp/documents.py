@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+
+"""
+Documents opened in an editor and their incremental checks.
+
+The first check of a document checks the whole module.
+Next checks only run on top-level statements with changed lines.
+Violations of other statements are kept and moved with their lines.
+Module-wide checks, like overuses, always run on the whole module.
+"""
+
+import ast
+import asyncio
+import difflib
+import io
+import tokenize
+from concurrent.futures import Executor
+from typing import (
+    AbstractSet,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+)
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+import attr
+from typing_extensions import final
+
+from wemake_python_styleguide import api, async_api, types
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.constants import STDIN
+from wemake_python_styleguide.logic import diffs
+
+#: New line numbers of unchanged lines by their old line numbers.
+_MovedLines = Dict[int, int]
+
+
+@final
+class Document(object):
+    """Keeps the last checked text of a document and its violations."""
+
+    def __init__(
+        self,
+        uri: str,
+        *,
+        options: Optional[types.ConfigurationOptions] = None,
+    ) -> None:
+        """Creates a document that was not checked yet."""
+        self.uri = uri
+        self.filename = STDIN
+        if uri.startswith('file:'):
+            self.filename = url2pathname(urlparse(uri).path)
+
+        self.violations: List[api.Violation] = []
+        self._statement_violations: List[api.Violation] = []
+        self._lines: Optional[List[str]] = None
+        self._checker_class: Type[Checker] = api.get_checker_class(options)
+
+    async def check(
+        self,
+        text: str,
+        *,
+        executor: Optional[Executor] = None,
+    ) -> List[api.Violation]:
+        """
+        Checks the new text of a document and returns all its violations.
+
+        Nothing is changed, when the check is cancelled or fails.
+
+        Raises:
+            SyntaxError: when the new text can not be parsed.
+            ValueError: when the new text contains null bytes.
+
+        """
+        lines = text.splitlines(keepends=True)
+        if lines == self._lines:
+            return self.violations
+
+        checker, kept_lines = await asyncio.get_event_loop().run_in_executor(
+            executor, self._prepare, text, lines,
+        )
+        statement_violations = await async_api.run_checks(
+            checker.iter_checks(module_checks=False),
+            checker.filename,
+            executor=executor,
+        )
+        module_violations = await async_api.run_checks(
+            checker.iter_module_checks(), checker.filename, executor=executor,
+        )
+
+        self._statement_violations = [
+            *self._move_violations(kept_lines),
+            *statement_violations,
+        ]
+        self.violations = sorted([
+            *self._statement_violations,
+            *module_violations,
+        ])
+        self._lines = lines
+        return self.violations
+
+    def _prepare(
+        self,
+        text: str,
+        lines: Sequence[str],
+    ) -> Tuple[Checker, _MovedLines]:
+        tree = ast.parse(text, self.filename)
+        file_tokens = list(tokenize.generate_tokens(io.StringIO(text).readline))
+        if self._lines is None:
+            return self._checker_class(tree, file_tokens, self.filename), {}
+
+        changed_lines, moved_lines = get_line_changes(self._lines, lines)
+        checked_lines = get_statement_lines(tree, changed_lines, len(lines))
+        return (
+            self._checker_class(
+                tree, file_tokens, self.filename, changed_lines=checked_lines,
+            ),
+            _get_kept_lines(moved_lines, checked_lines),
+        )
+
+    def _move_violations(
+        self,
+        kept_lines: _MovedLines,
+    ) -> List[api.Violation]:
+        return [
+            attr.evolve(
+                violation, line_number=kept_lines[violation.line_number],
+            )
+            for violation in self._statement_violations
+            if violation.line_number in kept_lines
+        ]
+
+
+def get_line_changes(
+    old_lines: Sequence[str],
+    new_lines: Sequence[str],
+) -> Tuple[Set[int], _MovedLines]:
+    r"""
+    Returns changed new lines and new numbers of unchanged old lines.
+
+    Lines around each change are also changed,
+    so removed lines are never missed.
+    Line ``0`` of module-level violations is never moved.
+
+    >>> get_line_changes(['a\n', 'b\n', 'c\n'], ['a\n', 'c\n', 'd\n'])
+    ({1, 2, 3, 4}, {1: 1, 3: 2})
+
+    """
+    matcher = difflib.SequenceMatcher(
+        None, old_lines, new_lines, autojunk=False,
+    )
+    return _get_changed_lines(matcher), _get_moved_lines(matcher)
+
+
+def get_statement_lines(
+    tree: ast.Module,
+    changed_lines: AbstractSet[int],
+    last_line: int,
+) -> Set[int]:
+    r"""
+    Returns all lines of top-level statements with changed lines.
+
+    >>> module = ast.parse('x = 1\ndef y():\n    return 2\n')
+    >>> get_statement_lines(module, {3}, 3)
+    {2, 3}
+
+    """
+    statement_lines = set(changed_lines)
+    for _, start, end in diffs.get_statement_spans(tree, last_line):
+        lines = range(start, end + 1)
+        if not changed_lines.isdisjoint(lines):
+            statement_lines.update(lines)
+    return statement_lines
+
+
+def _get_kept_lines(
+    moved_lines: _MovedLines,
+    checked_lines: AbstractSet[int],
+) -> _MovedLines:
+    return {
+        old_line: new_line
+        for old_line, new_line in moved_lines.items()
+        if new_line not in checked_lines
+    }
+
+
+def _get_changed_lines(
+    matcher: 'difflib.SequenceMatcher[str]',
+) -> Set[int]:
+    return {
+        line_number
+        for tag, _, _, new_start, new_end in matcher.get_opcodes()
+        if tag != 'equal'
+        for line_number in range(max(new_start, 1), new_end + 2)
+    }
+
+
+def _get_moved_lines(
+    matcher: 'difflib.SequenceMatcher[str]',
+) -> _MovedLines:
+    return {
+        old_start + offset: new_start + offset
+        for old_start, new_start, size in matcher.get_matching_blocks()
+        for offset in range(1, size + 1)
+    }
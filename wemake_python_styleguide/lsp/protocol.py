@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+"""
+Minimal ``JSON-RPC`` transport of the Language Server Protocol.
+
+Each message has ``Content-Length`` header and a ``json`` body.
+We only describe the parts of messages that we use.
+
+See also:
+    https://microsoft.github.io/language-server-protocol/specification
+
+"""
+
+import asyncio
+import json
+from typing import BinaryIO, Dict, List, Mapping, Optional, Union
+
+from typing_extensions import Final, TypedDict
+
+_CONTENT_LENGTH: Final = 'content-length'
+
+
+class TextDocument(TypedDict, total=False):
+    """Identifies a document, only opened documents have ``text``."""
+
+    uri: str
+    text: str
+
+
+class ContentChange(TypedDict):
+    """New text of a whole document, we only support full sync."""
+
+    text: str
+
+
+class Params(TypedDict, total=False):
+    """Parameters of document notifications."""
+
+    textDocument: TextDocument  # noqa: N815, WPS115
+    contentChanges: List[ContentChange]  # noqa: N815, WPS115
+
+
+class Message(TypedDict, total=False):
+    """Request or notification sent by a client."""
+
+    id: Union[int, str]  # noqa: WPS125
+    method: str
+    params: Params  # noqa: WPS110
+
+
+async def read_message(reader: asyncio.StreamReader) -> Optional[Message]:
+    """Reads a single message, returns ``None`` when the input is closed."""
+    headers = await _read_headers(reader)
+    if headers is None:
+        return None
+
+    try:
+        body = await reader.readexactly(int(headers[_CONTENT_LENGTH]))
+    except asyncio.IncompleteReadError:
+        return None
+    return json.loads(body.decode('utf-8'))
+
+
+def write_message(output: BinaryIO, message: Mapping[str, object]) -> None:
+    """Writes a single message and flushes the output."""
+    body = json.dumps(message).encode('utf-8')
+    output.write('Content-Length: {0}\r\n\r\n'.format(len(body)).encode())
+    output.write(body)
+    output.flush()
+
+
+async def _read_headers(
+    reader: asyncio.StreamReader,
+) -> Optional[Dict[str, str]]:
+    headers: Dict[str, str] = {}
+    line = await reader.readline()
+    while line.strip():
+        name, _, header_value = line.decode('ascii').partition(':')
+        headers[name.strip().lower()] = header_value.strip()
+        line = await reader.readline()
+    return headers if _CONTENT_LENGTH in headers else None
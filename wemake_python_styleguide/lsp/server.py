@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+"""
+Language server that checks documents while they are edited.
+
+The server speaks the Language Server Protocol over ``stdio``.
+It runs in a single warm process, so nothing is imported twice.
+Checks wait for a pause in typing, outdated checks are cancelled.
+
+Only the full text document synchronization is supported.
+
+.. autoclass:: LanguageServer
+   :members: serve
+
+.. autofunction:: main
+
+"""
+
+import asyncio
+import sys
+from concurrent.futures import Executor
+from functools import partial
+from types import MappingProxyType
+from typing import BinaryIO, Callable, Dict, Mapping, Optional, Union
+
+from typing_extensions import Final, final
+
+from wemake_python_styleguide import api
+from wemake_python_styleguide.lsp.diagnostics import publish_diagnostics
+from wemake_python_styleguide.lsp.documents import Document
+from wemake_python_styleguide.lsp.protocol import (
+    Message,
+    Params,
+    read_message,
+    write_message,
+)
+from wemake_python_styleguide.types import ConfigurationOptions
+from wemake_python_styleguide.version import pkg_name, pkg_version
+
+#: Seconds to wait after the last change before checking a document.
+DEBOUNCE_DELAY: Final = 0.3
+
+#: Results of the requests we support.
+_RESULTS: Final[Mapping[str, object]] = MappingProxyType({
+    'initialize': {
+        'capabilities': {'textDocumentSync': 1},  # means full sync
+        'serverInfo': {'name': pkg_name, 'version': pkg_version},
+    },
+    'shutdown': None,
+})
+
+#: Error code of the unknown requests.
+_METHOD_NOT_FOUND: Final = -32601
+
+
+@final
+class LanguageServer(object):
+    """Keeps opened documents and their pending checks."""
+
+    def __init__(
+        self,
+        output: BinaryIO,
+        *,
+        options: Optional[ConfigurationOptions] = None,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        """
+        Creates new server, it writes all messages to the output.
+
+        Parameters:
+            output: binary stream for responses and notifications.
+            options: options from :func:`~.api.make_options`, defaults if not.
+            executor: runs all the checks, the loop's default one is used.
+
+        """
+        self._options = api.get_checker_class(options).options
+        self._output = output
+        self._executor = executor
+        self._documents: Dict[str, Document] = {}
+        self._checks: Dict[str, 'asyncio.Future[None]'] = {}
+        self._notifications: Mapping[str, Callable[[Params], None]] = {
+            'textDocument/didOpen': self._did_change,
+            'textDocument/didChange': self._did_change,
+            'textDocument/didClose': self._did_close,
+        }
+
+    async def serve(self, reader: asyncio.StreamReader) -> None:
+        """Handles messages till the ``exit`` or the end of the input."""
+        message = await read_message(reader)
+        while message is not None and message.get('method') != 'exit':
+            await self._receive(message)
+            message = await read_message(reader)
+
+        for check in self._checks.values():
+            check.cancel()
+        await asyncio.gather(*self._checks.values(), return_exceptions=True)
+
+    async def _receive(self, message: Message) -> None:
+        method = message.get('method', '')
+        if method in self._notifications:
+            self._notifications[method](message['params'])
+        elif 'id' in message:
+            await self._respond(message['id'], method)
+
+    async def _respond(self, request_id: Union[int, str], method: str) -> None:
+        response: Dict[str, object] = {'jsonrpc': '2.0', 'id': request_id}
+        if method == 'shutdown':
+            await asyncio.gather(
+                *self._checks.values(), return_exceptions=True,
+            )
+
+        if method in _RESULTS:
+            response['result'] = _RESULTS[method]
+        else:
+            response['error'] = {
+                'code': _METHOD_NOT_FOUND,
+                'message': 'Unknown method: {0}'.format(method),
+            }
+        write_message(self._output, response)
+
+    def _did_change(self, document_params: Params) -> None:
+        text_document = document_params['textDocument']
+        uri = text_document['uri']
+        if 'text' in text_document:  # the document is just opened
+            self._documents[uri] = Document(uri, options=self._options)
+            text, delay = text_document['text'], 0.0
+        else:
+            text = document_params['contentChanges'][-1]['text']
+            delay = DEBOUNCE_DELAY
+
+        if uri in self._checks:
+            self._checks[uri].cancel()
+        self._checks[uri] = asyncio.ensure_future(self._check(
+            self._documents.setdefault(
+                uri, Document(uri, options=self._options),
+            ),
+            text,
+            delay,
+        ))
+
+    def _did_close(self, document_params: Params) -> None:
+        uri = document_params['textDocument']['uri']
+        if uri in self._checks:
+            self._checks.pop(uri).cancel()
+        self._documents.pop(uri, None)
+        write_message(self._output, publish_diagnostics(uri, []))
+
+    async def _check(self, document: Document, text: str, delay: float) -> None:
+        await asyncio.sleep(delay)
+        try:
+            violations = await document.check(text, executor=self._executor)
+        except (SyntaxError, ValueError) as parse_error:
+            # We keep old diagnostics, until the code is fixed:
+            violations = [
+                *document.violations,
+                _get_parse_violation(parse_error, document.filename),
+            ]
+        write_message(
+            self._output, publish_diagnostics(document.uri, violations),
+        )
+
+
+def _get_parse_violation(
+    parse_error: Union[SyntaxError, ValueError],
+    filename: str,
+) -> api.Violation:
+    if isinstance(parse_error, SyntaxError):
+        return api.Violation.from_syntax_error(parse_error, filename)
+    return api.Violation(  # null bytes are reported without a location
+        filename=filename,
+        line_number=1,
+        column_number=1,
+        code='E999',
+        text='{0}: {1}'.format(type(parse_error).__name__, parse_error),
+    )
+
+
+def main() -> None:  # pragma: no cover
+    """Runs the language server over ``stdio``, used as ``wps-lsp``."""
+    loop = asyncio.get_event_loop()
+    reader = asyncio.StreamReader()
+    loop.run_until_complete(loop.connect_read_pipe(
+        partial(asyncio.StreamReaderProtocol, reader), sys.stdin,
+    ))
+    server = LanguageServer(sys.stdout.buffer)
+    loop.run_until_complete(server.serve(reader))
@@ -4,13 +4,19 @@ from typing import ClassVar, Mapping, Optional, Sequence, Union
 
 import attr
 from flake8.options.manager import OptionManager
-from typing_extensions import final
+from typing_extensions import Final, final
 
 from wemake_python_styleguide.options import defaults
 
 #: Immutable config values passed from `flake8`.
 ConfigValues = Mapping[str, Union[str, int, bool]]
 
+#: Default values of our options.
+_OptionDefault = Optional[Union[int, str, Sequence[str]]]
+
+#: Type of options with free-form string values.
+_STRING: Final = 'string'
+
 
 @final
 @attr.dataclass(frozen=True, slots=True)
@@ -18,11 +24,13 @@ class _Option(object):
     """Represents ``flake8`` option object."""
 
     long_option_name: str
-    default: int
+    default: _OptionDefault
     help: str
     type: Optional[str] = 'int'  # noqa: A003
     parse_from_config: bool = True
     action: str = 'store'
+    choices: Optional[Sequence[str]] = None
+    comma_separated_list: bool = False
 
     def __attrs_post_init__(self):
         """Is called after regular init is done."""
@@ -114,6 +122,67 @@ class Configuration(object):
       default to
       :str:`wemake_python_styleguide.options.defaults.MAX_ASSERTS`
 
+    Options for huge and generated modules:
+
+    - ``max-module-lines`` - maximum number of lines in a module
+      to be fully checked, defaults to
+      :str:`wemake_python_styleguide.options.defaults.MAX_MODULE_LINES`
+    - ``max-module-bytes`` - maximum size of a module in bytes
+      to be fully checked, defaults to
+      :str:`wemake_python_styleguide.options.defaults.MAX_MODULE_BYTES`
+    - ``max-module-nodes`` - maximum number of ``ast`` nodes in a module
+      to be fully checked, defaults to
+      :str:`wemake_python_styleguide.options.defaults.MAX_MODULE_NODES`
+    - ``generated-markers`` - comma separated markers that we look for
+      in module's header comments to find generated modules, defaults to
+      :str:`wemake_python_styleguide.options.defaults.GENERATED_MARKERS`
+    - ``huge-module-policy`` - what to do with huge and generated modules:
+      ``reduce`` runs only cheap checks, ``skip`` does not check them at all,
+      defaults to
+      :str:`wemake_python_styleguide.options.defaults.HUGE_MODULE_POLICY`
+
+    Options for running checks, they do not change any rules:
+
+    - ``diff-revision`` - git revision to compare the working tree with,
+      only top-level definitions that overlap changed lines are checked
+      and only violations on changed lines are reported, defaults to
+      :str:`wemake_python_styleguide.options.defaults.DIFF_REVISION`
+    - ``diff-file`` - unified diff file to read changed lines from,
+      works the same way as ``diff-revision``, defaults to
+      :str:`wemake_python_styleguide.options.defaults.DIFF_FILE`
+    - ``diff-module-checks`` - whether to run module-level checks
+      (like module names, members count, and overuses) for changed files:
+      ``always`` or ``skip``, defaults to
+      :str:`wemake_python_styleguide.options.defaults.DIFF_MODULE_CHECKS`
+    - ``wps-mode`` - which checks to run: ``fast`` skips checks
+      with the ``expensive`` cost tier and is useful for editors,
+      ``full`` runs everything and is useful for CI,
+      ``default`` runs everything except for huge and generated modules,
+      defaults to
+      :str:`wemake_python_styleguide.options.defaults.WPS_MODE`
+    - ``project-index`` - directory to store the project-wide index
+      of modules in, it is updated only for changed modules
+      and is used by checks that need to know about other modules,
+      defaults to
+      :str:`wemake_python_styleguide.options.defaults.PROJECT_INDEX`
+    - ``wps-classmethod-decorators`` - comma separated decorators
+      that make methods classmethods, defaults to
+      :str:`wemake_python_styleguide.options.defaults.CLASSMETHOD_DECORATORS`
+    - ``wps-staticmethod-decorators`` - comma separated decorators
+      that make methods staticmethods, defaults to
+      :str:`wemake_python_styleguide.options.defaults.STATICMETHOD_DECORATORS`
+    - ``shard`` - which part of modules to check as ``INDEX/TOTAL``,
+      like ``--shard=2/8``, modules are split by their costs
+      and the same split is used on all machines with the same costs,
+      ``--shard=2/8@HASH`` refuses to run when the ``sha256`` hash
+      of the costs file does not start with ``HASH``,
+      only our checks are split, so combine it with ``--select=WPS``,
+      other plugins still check all modules, defaults to
+      :str:`wemake_python_styleguide.options.defaults.SHARD`
+    - ``shard-costs`` - file to read costs of modules from,
+      costs of checked modules are recorded into it, defaults to
+      :str:`wemake_python_styleguide.options.defaults.SHARD_COSTS`
+
     All options are configurable via ``flake8`` CLI.
 
     Example::
@@ -264,9 +333,114 @@ class Configuration(object):
             action='store_true',
             type=None,
         ),
+
+        # Huge modules:
+
+        _Option(
+            '--max-module-lines',
+            defaults.MAX_MODULE_LINES,
+            'Maximum number of lines in a fully checked module.',
+        ),
+
+        _Option(
+            '--max-module-bytes',
+            defaults.MAX_MODULE_BYTES,
+            'Maximum size in bytes of a fully checked module.',
+        ),
+
+        _Option(
+            '--max-module-nodes',
+            defaults.MAX_MODULE_NODES,
+            'Maximum number of ast nodes in a fully checked module.',
+        ),
+
+        _Option(
+            '--generated-markers',
+            defaults.GENERATED_MARKERS,
+            'Header comment markers of generated modules.',
+            type=_STRING,
+            comma_separated_list=True,
+        ),
+
+        _Option(
+            '--huge-module-policy',
+            defaults.HUGE_MODULE_POLICY,
+            'What to do with huge and generated modules: reduce or skip.',
+            type='choice',
+            choices=('reduce', 'skip'),
+        ),
+    ]
+
+    run_options: ClassVar[Sequence[_Option]] = [
+        _Option(
+            '--diff-revision',
+            defaults.DIFF_REVISION,
+            'Only check lines changed since this git revision.',
+            type=_STRING,
+        ),
+
+        _Option(
+            '--diff-file',
+            defaults.DIFF_FILE,
+            'Only check lines changed in this unified diff file.',
+            type=_STRING,
+        ),
+
+        _Option(
+            '--diff-module-checks',
+            defaults.DIFF_MODULE_CHECKS,
+            'Whether to run module-level checks for changed files.',
+            type='choice',
+            choices=('always', 'skip'),
+        ),
+
+        _Option(
+            '--wps-mode',
+            defaults.WPS_MODE,
+            'Which checks to run: fast, default, or full.',
+            type='choice',
+            choices=('fast', 'default', 'full'),
+        ),
+
+        _Option(
+            '--project-index',
+            defaults.PROJECT_INDEX,
+            'Directory to store the project-wide index of modules in.',
+            type=_STRING,
+        ),
+
+        _Option(
+            '--wps-classmethod-decorators',
+            defaults.CLASSMETHOD_DECORATORS,
+            'Decorators that make methods classmethods.',
+            type=_STRING,
+            comma_separated_list=True,
+        ),
+
+        _Option(
+            '--wps-staticmethod-decorators',
+            defaults.STATICMETHOD_DECORATORS,
+            'Decorators that make methods staticmethods.',
+            type=_STRING,
+            comma_separated_list=True,
+        ),
+
+        _Option(
+            '--shard',
+            defaults.SHARD,
+            'Which part of modules to check as INDEX/TOTAL[@HASH].',
+            type=_STRING,
+        ),
+
+        _Option(
+            '--shard-costs',
+            defaults.SHARD_COSTS,
+            'File to read and to record checking costs of modules in.',
+            type=_STRING,
+        ),
     ]
 
     def register_options(self, parser: OptionManager) -> None:
         """Registers options for our plugin."""
-        for option in self.options:
+        for option in (*self.options, *self.run_options):
             parser.add_option(**attr.asdict(option))
@@ -83,3 +83,60 @@ MAX_FUNCTION_EXPRESSIONS: Final = 4
 
 #: Maximum number of ``assert`` statements in a function.
 MAX_ASSERTS: Final = 5
+
+
+# Huge modules:
+
+#: Maximum number of lines in a module to run all checks.
+MAX_MODULE_LINES: Final = 10000
+
+#: Maximum size of a module in bytes to run all checks.
+MAX_MODULE_BYTES: Final = 1024 * 1024  # 1 MiB
+
+#: Maximum number of ``ast`` nodes in a module to run all checks.
+MAX_MODULE_NODES: Final = 150000
+
+#: Header comment markers of generated modules.
+GENERATED_MARKERS: Final = ('Generated by', 'DO NOT EDIT')
+
+#: What to do with huge and generated modules: ``reduce`` or ``skip``.
+HUGE_MODULE_POLICY: Final = 'reduce'
+
+
+# Running:
+
+#: Git revision to compare with, when only changed lines are checked.
+DIFF_REVISION: Final = None
+
+#: Unified diff file to read, when only changed lines are checked.
+DIFF_FILE: Final = None
+
+#: Whether to run module-level checks, when only changed lines are checked.
+DIFF_MODULE_CHECKS: Final = 'always'
+
+#: Which checks to run: ``fast``, ``default``, or ``full``.
+WPS_MODE: Final = 'default'
+
+#: Directory to store the project-wide index of modules in.
+PROJECT_INDEX: Final = None
+
+#: Decorators that make methods classmethods.
+CLASSMETHOD_DECORATORS: Final = ('classmethod',)
+
+#: Decorators that make methods staticmethods.
+STATICMETHOD_DECORATORS: Final = ('staticmethod',)
+
+#: Which part of modules to check as ``INDEX/TOTAL[@HASH]``, all by default.
+SHARD: Final = None
+
+#: File to read and to record checking costs of modules in.
+SHARD_COSTS: Final = None
+
+
+# Formatter:
+
+#: How to sort statistics: by violation ``code`` or by ``count``.
+SORT_STATISTICS: Final = 'code'
+
+#: Maximum number of files shown per violation in statistics, 0 means all.
+MAX_STATISTICS_FILES: Final = 0
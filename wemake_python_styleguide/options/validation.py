@@ -1,12 +1,16 @@
 # -*- coding: utf-8 -*-
 
-from typing import Optional
+import re
+from typing import Optional, Sequence
 
 import attr
-from typing_extensions import final
+from typing_extensions import Final, final
 
 from wemake_python_styleguide.types import ConfigurationOptions
 
+#: Shard with an optional start of the ``sha256`` hash of its costs file.
+_SHARD_FORMAT: Final = re.compile('([0-9]+)/([0-9]+)(?:@[0-9a-f]+)?')
+
 
 def _min_max(
     min: Optional[int] = None,  # noqa: A002
@@ -24,6 +28,32 @@ def _min_max(
     return factory
 
 
+def _mutually_exclusive(other: str):
+    """Validator to check that only one of two options is set."""
+    def factory(instance, attribute, field_value):
+        if field_value and getattr(instance, other):
+            raise ValueError(
+                'Options {0} and {1} are mutually exclusive'.format(
+                    attribute.name,
+                    other,
+                ),
+            )
+    return factory
+
+
+def _shard_format(instance, attribute, field_value):
+    """Validator to check that shard is written as ``INDEX/TOTAL[@HASH]``."""
+    shard = _SHARD_FORMAT.fullmatch(field_value or '1/1')
+    index, total = 0, 0
+    if shard:
+        index, total = map(int, shard.groups())
+    if index not in range(1, total + 1):
+        raise ValueError('Option {0} is not INDEX/TOTAL[@HASH]: {1}'.format(
+            attribute.name,
+            field_value,
+        ))
+
+
 @final
 @attr.dataclass(slots=True)
 class _ValidatedOptions(object):
@@ -58,6 +88,29 @@ class _ValidatedOptions(object):
     max_function_expressions: int = attr.ib(validator=[_min_max(min=1)])
     max_asserts: int = attr.ib(validator=[_min_max(min=1)])
 
+    # Huge modules:
+    max_module_lines: int = attr.ib(validator=[_min_max(min=1)])
+    max_module_bytes: int = attr.ib(validator=[_min_max(min=1)])
+    max_module_nodes: int = attr.ib(validator=[_min_max(min=1)])
+    generated_markers: Sequence[str]
+    huge_module_policy: str
+
+    # Running:
+    diff_revision: Optional[str]
+    diff_file: Optional[str] = attr.ib(
+        validator=[_mutually_exclusive('diff_revision')],
+    )
+    diff_module_checks: str
+    wps_mode: str
+    project_index: Optional[str]
+    wps_classmethod_decorators: Sequence[str]
+    wps_staticmethod_decorators: Sequence[str]
+    shard: Optional[str] = attr.ib(validator=[_shard_format])
+    shard_costs: Optional[str]
+
+    # Provided by `flake8`:
+    disable_noqa: Optional[bool]
+
 
 def validate_options(options: ConfigurationOptions) -> _ValidatedOptions:
     """Validates all options from ``flake8``, uses a subset of them."""
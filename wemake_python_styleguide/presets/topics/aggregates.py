@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+
+from typing_extensions import Final
+
+from wemake_python_styleguide.presets.types import filename
+from wemake_python_styleguide.visitors.ast import modules
+from wemake_python_styleguide.visitors.ast.complexity import (
+    counts,
+    jones,
+    overuses,
+)
+
+#: Visitors that need the whole module to find violations:
+PRESET: Final = (
+    *filename.PRESET,
+
+    modules.EmptyModuleContentsVisitor,
+
+    jones.JonesComplexityVisitor,
+
+    counts.ImportMembersVisitor,
+    counts.ModuleMembersVisitor,
+
+    overuses.StringOveruseVisitor,
+    overuses.ExpressionOveruseVisitor,
+)
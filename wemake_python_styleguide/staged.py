@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+
+"""
+Checks staged contents of modules, the working tree is not touched.
+
+It is useful for ``pre-commit`` hooks:
+nothing is stashed and no temporary files are written.
+
+.. code:: bash
+
+    wps-staged --max-line-complexity 20
+
+It takes the same options and configuration as ``flake8`` does.
+Excluded files are not checked, selected and ignored codes are respected,
+including ``per-file-ignores``.
+All staged blobs are read with a single ``git cat-file --batch`` process
+and are checked in the same process with :mod:`~.api`.
+Violations are reported with original paths in the default ``flake8`` format.
+
+.. autofunction:: check_staged
+
+.. autofunction:: main
+
+"""
+
+import subprocess  # noqa: S404
+import sys
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import attr
+from flake8.main.application import Application
+from flake8.style_guide import Decision, StyleGuideManager
+from typing_extensions import Final
+
+from wemake_python_styleguide import api
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.types import ConfigurationOptions
+
+#: The same format as the default one of ``flake8``.
+_OUTPUT_FORMAT: Final = '{0}:{1}:{2}: {3} {4}\n'
+
+#: Regular files are checked, symlinks and submodules are skipped.
+_FILE_MODE_PREFIX: Final = '100'
+
+#: Tells whether a path is excluded from checks.
+_PathFilter = Callable[[str], bool]
+
+#: Path of a staged file and its contents, if its blob is not missing.
+_StagedFile = Tuple[str, Optional[bytes]]
+
+
+def check_staged(
+    *,
+    options: Optional[ConfigurationOptions] = None,
+    is_excluded: Optional[_PathFilter] = None,
+) -> List[api.Violation]:
+    """
+    Checks staged contents of added and modified python files.
+
+    Paths are relative to the current directory,
+    files outside of it are not checked.
+    Files with syntax errors are reported with ``E999`` code,
+    files with missing staged blobs are reported with ``E902`` code.
+
+    Parameters:
+        options: options from :func:`~.api.make_options`.
+        is_excluded: files, that it returns ``True`` for, are not checked.
+
+    """
+    violations = []
+    for filename, source in _read_staged_files(is_excluded):
+        violations.extend(_check_blob(filename, source, options))
+    return violations
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Prints violations of staged files, used as ``wps-staged``."""
+    arguments = sys.argv[1:] if argv is None else argv
+    app = Application()
+    app.initialize(list(arguments))
+
+    # `flake8` has parsed and validated our options with the configuration:
+    violations = [
+        violation
+        for violation in check_staged(
+            options=Checker.options,
+            is_excluded=app.file_checker_manager.is_path_excluded,
+        )
+        if _is_selected(app.guide, violation)
+    ]
+    for violation in violations:
+        sys.stdout.write(_OUTPUT_FORMAT.format(*attr.astuple(violation)))
+    return 1 if violations else 0
+
+
+def _is_selected(guide: StyleGuideManager, violation: api.Violation) -> bool:
+    """Decides on each code just like ``flake8`` does, per file."""
+    style_guide = guide.style_guide_for(violation.filename)
+    decision = style_guide.should_report_error(violation.code)
+    return decision is Decision.Selected
+
+
+def _check_blob(
+    filename: str,
+    source: Optional[bytes],
+    options: Optional[ConfigurationOptions],
+) -> List[api.Violation]:
+    if source is None:
+        missing_blob = FileNotFoundError('Staged blob is missing')
+        return [api.Violation.from_os_error(missing_blob, filename)]
+
+    try:
+        return api.check_source(source, filename, options=options)
+    except SyntaxError as error:
+        return [api.Violation.from_syntax_error(error, filename)]
+
+
+def _get_staged_blobs() -> Dict[str, str]:
+    raw_diff = subprocess.run(  # noqa: S603, S607
+        [
+            'git',
+            'diff',
+            '--cached',
+            '--raw',
+            '-z',
+            '--no-abbrev',
+            '--no-renames',
+            '--diff-filter=AM',
+            '--relative',
+            '--',
+            '*.py',
+        ],
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    ).stdout.split('\0')
+
+    # Each file is described as `:old_mode new_mode old_id new_id status`:
+    return {
+        filename: blob_info.split()[3]
+        for blob_info, filename in zip(raw_diff[::2], raw_diff[1::2])
+        if blob_info.split()[1].startswith(_FILE_MODE_PREFIX)
+    }
+
+
+def _read_staged_files(
+    is_excluded: Optional[_PathFilter],
+) -> Iterator[_StagedFile]:
+    staged_blobs = {
+        filename: blob_id
+        for filename, blob_id in _get_staged_blobs().items()
+        if is_excluded is None or not is_excluded(filename)
+    }
+    blob_ids = ''.join(
+        '{0}\n'.format(blob_id) for blob_id in staged_blobs.values()
+    )
+    output = subprocess.run(  # noqa: S603, S607
+        ['git', 'cat-file', '--batch'],
+        input=blob_ids.encode('ascii'),
+        stdout=subprocess.PIPE,
+        check=True,
+    ).stdout
+    return zip(staged_blobs.keys(), _split_blobs(output))
+
+
+def _split_blobs(output: bytes) -> List[Optional[bytes]]:
+    # Each blob is written as `blob_id blob size\ncontents\n`,
+    # missing ones are written as `blob_id missing\n`:
+    blobs: List[Optional[bytes]] = []
+    position = 0
+    while position < len(output):
+        contents_start = output.index(b'\n', position) + 1
+        blob_info = output[position:contents_start].split()
+        if blob_info[1] == b'missing':
+            blobs.append(None)
+            position = contents_start
+        else:
+            size = int(blob_info[2])
+            blobs.append(output[contents_start:contents_start + size])
+            position = contents_start + size + 1
+    return blobs
@@ -1,11 +1,17 @@
 # -*- coding: utf-8 -*-
 
 import ast
-from typing import Optional, Tuple, Type
+from typing import DefaultDict, List, Mapping, Optional, Tuple, Type
+
+from typing_extensions import Final
 
 from wemake_python_styleguide.compat.aliases import FunctionNodes
-from wemake_python_styleguide.logic.nodes import get_parent
-from wemake_python_styleguide.types import ContextNodes
+from wemake_python_styleguide.logic.classes import get_method_types
+from wemake_python_styleguide.logic.nodes import get_context, get_parent
+from wemake_python_styleguide.logic.safe_eval import evaluate_node
+
+#: Nodes that can be contexts for other nodes.
+_CONTEXTS: Final = (ast.Module, ast.ClassDef, *FunctionNodes)
 
 
 def set_if_chain(tree: ast.AST) -> ast.AST:
@@ -39,9 +45,12 @@ def set_if_chain(tree: ast.AST) -> ast.AST:
     return tree
 
 
-def set_node_context(tree: ast.AST) -> ast.AST:
+def set_node_context(
+    node: ast.AST,
+    context_nodes: DefaultDict[ast.AST, List[ast.AST]],
+) -> None:
     """
-    Used to set proper context to all nodes.
+    Used to set proper context to a node.
 
     What we call "a context"?
     Context is where exactly this node belongs on a global level.
@@ -55,24 +64,70 @@ def set_node_context(tree: ast.AST) -> ast.AST:
     Despite the fact ``test`` variable has ``Assign`` as it parent
     it will have ``Module`` as a context.
 
+    We also store all nodes that belong to each context
+    in the same order as :py:func:`ast.walk` yields them.
+    So, checks for a single context do not have to walk its subtree
+    and filter nodes from the nested contexts.
+    Call :py:func:`set_context_nodes` when all nodes are collected.
+
     What contexts do we respect?
 
     - :py:class:`ast.Module`
     - :py:class:`ast.ClassDef`
     - :py:class:`ast.FunctionDef` and :py:class:`ast.AsyncFunctionDef`
 
+    The parent of the node must be already set.
+
     .. versionchanged:: 0.8.1
 
     """
-    contexts: Tuple[Type[ContextNodes], ...] = (
-        ast.Module,
-        ast.ClassDef,
-        *FunctionNodes,
-    )
+    current_context = _find_context(node, _CONTEXTS)
+    setattr(node, 'wps_context', current_context)  # noqa: B010
+    if current_context is not None:
+        context_nodes[current_context].append(node)
 
-    for statement in ast.walk(tree):
-        current_context = _find_context(statement, contexts)
-        setattr(statement, 'wps_context', current_context)  # noqa: B010
+
+def set_context_nodes(
+    context_nodes: DefaultDict[ast.AST, List[ast.AST]],
+) -> None:
+    """Stores collected nodes on their contexts."""
+    for context, own_nodes in context_nodes.items():
+        setattr(context, 'wps_context_nodes', own_nodes)  # noqa: B010
+
+
+def set_method_types(
+    node: ast.ClassDef,
+    method_decorators: Mapping[str, str],
+) -> None:
+    """
+    Used to set ``wps_function_type`` for methods of a class.
+
+    Can set: ``method``, ``classmethod``, ``staticmethod``.
+    ``method_decorators`` maps decorator names to these types.
+
+    .. versionchanged:: 0.12.0
+
+    """
+    for method, function_type in get_method_types(node, method_decorators):
+        setattr(method, 'wps_function_type', function_type)  # noqa: B010
+
+
+def set_constant_values(tree: ast.AST) -> ast.AST:
+    """
+    Used to evaluate all nodes that contain only constants.
+
+    We evaluate each node once, from the bottom to the top.
+    So, parent nodes reuse values that are already set on their children.
+    Later visitors just look these values up
+    instead of calling :py:`ast.literal_eval` again and again
+    and catching exceptions for nodes that are not constants.
+
+    Nodes that contain only literals get ``wps_literal_value`` set.
+    Nodes that contain literals and names get ``wps_value_with_names`` set.
+    """
+    # `ast.walk` yields parents before their children:
+    for node in reversed(list(ast.walk(tree))):
+        evaluate_node(node)
     return tree
 
 
@@ -85,11 +140,13 @@ def _find_context(
 
     It happened because of the bug #520
     See: https://github.com/wemake-services/wemake-python-styleguide/issues/520
+
+    :py:func:`ast.walk` yields parents before their children,
+    so the parent's context is already set and we just reuse it.
     """
     parent = get_parent(node)
     if parent is None:
         return None
     elif isinstance(parent, contexts):
         return parent
-    else:
-        return _find_context(parent, contexts)
+    return get_context(parent)
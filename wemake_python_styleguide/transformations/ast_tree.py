@@ -1,73 +1,71 @@
 # -*- coding: utf-8 -*-
 
 import ast
+from collections import defaultdict
+from typing import DefaultDict, List, Mapping, Sequence
 
-from pep8ext_naming import NamingChecker
-from typing_extensions import final
-
+from wemake_python_styleguide.options import defaults
 from wemake_python_styleguide.transformations.ast.bugfixes import (
     fix_async_offset,
     fix_line_number,
 )
 from wemake_python_styleguide.transformations.ast.enhancements import (
+    set_constant_values,
+    set_context_nodes,
     set_if_chain,
+    set_method_types,
     set_node_context,
 )
 
 
-@final
-class _ClassVisitor(ast.NodeVisitor):
-    """Used to set method types inside classes."""
-
-    def __init__(self, transformer: NamingChecker) -> None:
-        super().__init__()
-        self.transformer = transformer
-
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:  # noqa: N802
-        self.transformer.tag_class_functions(node)
-        self.generic_visit(node)
-
-
-def _set_parent(tree: ast.AST) -> ast.AST:
+def _set_parent_context_and_method_types(
+    tree: ast.AST,
+    method_decorators: Mapping[str, str],
+) -> ast.AST:
     """
-    Sets parents for all nodes that do not have this prop.
+    Sets parents, contexts, and method types in a single walk.
 
-    This step is required due to how `flake8` works.
+    Parents are required due to how `flake8` works.
     It does not set the same properties as `ast` module.
 
     This function was the cause of `issue-112`. Twice.
     Since the ``0.6.1`` we use ``'wps_parent'`` with a prefix.
     This should fix the issue with conflicting plugins.
 
+    :py:func:`ast.walk` yields parents before their children,
+    so each node already has its parent when we set its context.
+
+    Method types are set on methods as ``'wps_function_type'``.
+    We used ``pep8-naming`` to set them before ``0.12.0``.
+
     .. versionchanged:: 0.0.11
     .. versionchanged:: 0.6.1
+    .. versionchanged:: 0.12.0
 
     """
+    context_nodes: DefaultDict[ast.AST, List[ast.AST]] = defaultdict(list)
     for statement in ast.walk(tree):
+        set_node_context(statement, context_nodes)
         for child in ast.iter_child_nodes(statement):
             setattr(child, 'wps_parent', statement)  # noqa: B010
-    return tree
-
+        if isinstance(statement, ast.ClassDef):
+            set_method_types(statement, method_decorators)
 
-def _set_function_type(tree: ast.AST) -> ast.AST:
-    """
-    Sets the function type for methods.
-
-    Can set: `method`, `classmethod`, `staticmethod`.
-
-    .. versionchanged:: 0.3.0
-
-    """
-    transformer = _ClassVisitor(NamingChecker(tree, 'stdin'))
-    transformer.visit(tree)
+    set_context_nodes(context_nodes)
     return tree
 
 
-def transform(tree: ast.AST) -> ast.AST:
+def transform(
+    tree: ast.AST,
+    *,
+    classmethod_decorators: Sequence[str] = defaults.CLASSMETHOD_DECORATORS,
+    staticmethod_decorators: Sequence[str] = defaults.STATICMETHOD_DECORATORS,
+) -> ast.AST:
     """
     Mutates the given ``ast`` tree.
 
     Applies all possible tranformations.
+    Decorators are used to tell ``classmethod`` and ``staticmethod`` apart.
 
     Ordering:
     - initial ones
@@ -75,18 +73,22 @@ def transform(tree: ast.AST) -> ast.AST:
     - enhancements
 
     """
-    pipeline = (
-        # Initial, should be the first ones, ordering inside is important:
-        _set_parent,
-        _set_function_type,
+    method_decorators = dict.fromkeys(classmethod_decorators, 'classmethod')
+    method_decorators.update(
+        dict.fromkeys(staticmethod_decorators, 'staticmethod'),
+    )
 
+    # Initial, should be the first one:
+    tree = _set_parent_context_and_method_types(tree, method_decorators)
+
+    pipeline = (
         # Bugfixes, order is not important:
         fix_async_offset,
         fix_line_number,
 
         # Enhancements, order is not important:
-        set_node_context,
         set_if_chain,
+        set_constant_values,
     )
 
     for tranformation in pipeline:
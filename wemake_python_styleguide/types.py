@@ -38,7 +38,7 @@ Reference
 """
 
 import ast
-from typing import Tuple, Type, Union
+from typing import Optional, Sequence, Tuple, Type, Union
 
 from typing_extensions import Protocol, final
 
@@ -115,3 +115,24 @@ class ConfigurationOptions(Protocol):
     max_module_expressions: int
     max_function_expressions: int
     max_asserts: int
+
+    # Huge modules:
+    max_module_lines: int
+    max_module_bytes: int
+    max_module_nodes: int
+    generated_markers: Sequence[str]
+    huge_module_policy: str
+
+    # Running:
+    diff_revision: Optional[str]
+    diff_file: Optional[str]
+    diff_module_checks: str
+    wps_mode: str
+    project_index: Optional[str]
+    wps_classmethod_decorators: Sequence[str]
+    wps_staticmethod_decorators: Sequence[str]
+    shard: Optional[str]
+    shard_costs: Optional[str]
+
+    # Provided by `flake8`:
+    disable_noqa: Optional[bool]
@@ -1,13 +1,24 @@
 # -*- coding: utf-8 -*-
 
-import pkg_resources
+try:  # pragma: no cover
+    from importlib import (  # type: ignore  # noqa: WPS433
+        metadata as importlib_metadata,
+    )
+except ImportError:  # pragma: no cover
+    import importlib_metadata  # noqa: WPS433, WPS440
 
 
 def _get_version(dist_name: str) -> str:  # pragma: no cover
-    """Fetches distribution name. Contains a fix for Sphinx."""
+    """
+    Fetches distribution name. Contains a fix for Sphinx.
+
+    We use ``importlib.metadata`` and its backport for older pythons,
+    since ``pkg_resources`` scans all installed distributions on import.
+    It takes more time than importing all our visitors and violations.
+    """
     try:
-        return pkg_resources.get_distribution(dist_name).version
-    except pkg_resources.DistributionNotFound:
+        return importlib_metadata.version(dist_name)
+    except importlib_metadata.PackageNotFoundError:
         return ''  # readthedocs can not install `poetry` projects
 
 
@@ -93,7 +93,7 @@ class BaseViolation(object):
         Conditionally formats the ``error_template`` if it is required.
         """
         return '{0} {1}'.format(
-            self._full_code(), self.error_template.format(self._text),
+            self.full_code(), self.error_template.format(self._text),
         )
 
     @final
@@ -102,7 +102,12 @@ class BaseViolation(object):
         return (*self._location(), self.message())
 
     @final
-    def _full_code(self) -> str:
+    def location(self) -> Tuple[int, int]:
+        """Returns line number and column offset, message is not formatted."""
+        return self._location()
+
+    @final
+    def full_code(self) -> str:
         """
         Returns fully formatted code.
 
@@ -48,6 +48,7 @@ Summary
    TooLongYieldTupleViolation
    TooLongCompareViolation
    TooLongTryBodyViolation
+   HugeModuleViolation
 
 
 Module complexity
@@ -85,9 +86,12 @@ Structures complexity
 .. autoclass:: TooLongYieldTupleViolation
 .. autoclass:: TooLongCompareViolation
 .. autoclass:: TooLongTryBodyViolation
+.. autoclass:: HugeModuleViolation
 
 """
 
+from typing import Tuple
+
 from typing_extensions import final
 
 from wemake_python_styleguide.violations.base import (
@@ -847,3 +851,49 @@ class TooLongTryBodyViolation(ASTViolation):
 
     error_template = 'Found too long ``try`` body length: {0}'
     code = 229
+
+
+@final
+class HugeModuleViolation(SimpleViolation):
+    """
+    Reports huge and generated modules that are not fully checked.
+
+    We find huge modules by the number of lines, bytes, and ``ast`` nodes.
+    We find generated modules by markers in their header comments,
+    like ``# Generated by`` or ``DO NOT EDIT``.
+    All these checks are cheap and run before anything else.
+
+    Reasoning:
+        Generated modules, migrations, and vendored code can be really huge.
+        They take most of the time to check,
+        while nobody reads or fixes their violations.
+
+    Solution:
+        Exclude these modules from linting or split them into smaller ones.
+        Or use ``--wps-mode=full`` to check them anyway.
+
+    This is the only violation we report when ``skip`` policy is used.
+    With ``reduce`` policy we still run our cheap checks.
+    It is reported on the first line, so ``# noqa: WPS230`` there hides it,
+    but the module is still not fully checked.
+
+    Configuration:
+        This rule is configurable with ``--max-module-lines``,
+        ``--max-module-bytes``, ``--max-module-nodes``,
+        ``--generated-markers``, and ``--huge-module-policy``.
+        Default:
+        :str:`wemake_python_styleguide.options.defaults.MAX_MODULE_LINES`,
+        :str:`wemake_python_styleguide.options.defaults.MAX_MODULE_BYTES`,
+        :str:`wemake_python_styleguide.options.defaults.MAX_MODULE_NODES`,
+        :str:`wemake_python_styleguide.options.defaults.GENERATED_MARKERS`,
+        :str:`wemake_python_styleguide.options.defaults.HUGE_MODULE_POLICY`
+
+    .. versionadded:: 0.12.0
+
+    """
+
+    error_template = 'Found huge or generated module: {0}'
+    code = 230
+
+    def _location(self) -> Tuple[int, int]:
+        return 1, 0  # `flake8` can not find `noqa` comments for line `0`
@@ -73,6 +73,9 @@ class BlockVariableVisitor(base.BaseNodeVisitor):
 
     """
 
+    #: Compares each block variable with all names of its scope.
+    cost_tier: ClassVar[str] = 'expensive'
+
     # Blocks:
 
     def visit_named_nodes(self, node: AnyFunctionDef) -> None:
@@ -2,7 +2,6 @@
 
 import ast
 from collections import Counter, Hashable, defaultdict
-from contextlib import suppress
 from typing import ClassVar, DefaultDict, Iterable, List, Sequence, Union
 
 import astor
@@ -10,7 +9,7 @@ from typing_extensions import final
 
 from wemake_python_styleguide import constants
 from wemake_python_styleguide.compat.aliases import FunctionNodes
-from wemake_python_styleguide.logic import safe_eval
+from wemake_python_styleguide.logic import nodes
 from wemake_python_styleguide.logic.naming.name_nodes import extract_name
 from wemake_python_styleguide.logic.operators import (
     get_parent_ignoring_unary,
@@ -261,17 +260,14 @@ class WrongCollectionVisitor(base.BaseNodeVisitor):
                 elements.append(source.strip().strip('(').strip(')'))
 
             real_item = unwrap_starred_node(real_item)
-
-            # Non-constant nodes raise ValueError,
-            # unhashables raise TypeError:
-            with suppress(ValueError, TypeError):
-                # Similar value:
-                real_item = safe_eval.literal_eval_with_names(
-                    real_item,
-                ) if isinstance(
-                    real_item, self._elements_to_eval,
-                ) else set_item
-                element_values.append(real_item)
+            if isinstance(real_item, self._elements_to_eval):
+                # Similar value, non-constant and unhashable are skipped:
+                if nodes.has_value_with_names(real_item):
+                    element_values.append(
+                        nodes.get_value_with_names(real_item),
+                    )
+            else:
+                element_values.append(set_item)
         self._report_set_elements(node, elements, element_values)
 
     def _report_set_elements(
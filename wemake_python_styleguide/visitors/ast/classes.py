@@ -325,6 +325,9 @@ class WrongSlotsVisitor(base.BaseNodeVisitor):
 class ClassAttributeVisitor(base.BaseNodeVisitor):
     """Finds incorrect class attributes."""
 
+    #: Compares all class attributes with all instance attributes.
+    cost_tier: ClassVar[str] = 'expensive'
+
     def visit_ClassDef(self, node: ast.ClassDef) -> None:
         """
         Checks that class attributes are correct.
@@ -386,12 +389,11 @@ class ClassMethodOrderVisitor(base.BaseNodeVisitor):
         self.generic_visit(node)
 
     def _check_method_order(self, node: ast.ClassDef) -> None:
-        method_nodes: List[str] = []
-
-        for subnode in ast.walk(node):
-            if isinstance(subnode, FunctionNodes):
-                if nodes.get_context(subnode) == node:
-                    method_nodes.append(subnode.name)
+        method_nodes = [
+            subnode.name
+            for subnode in nodes.get_context_nodes(node)
+            if isinstance(subnode, FunctionNodes)
+        ]
 
         ideal = sorted(method_nodes, key=self._ideal_order, reverse=True)
         for existing_order, ideal_order in zip(method_nodes, ideal):
@@ -14,7 +14,10 @@ from wemake_python_styleguide.logic import (
     nodes,
     operators,
 )
-from wemake_python_styleguide.logic.naming.name_nodes import is_same_variable
+from wemake_python_styleguide.logic.naming.name_nodes import (
+    get_dotted_name,
+    is_same_variable,
+)
 from wemake_python_styleguide.types import AnyIf, AnyNodes
 from wemake_python_styleguide.violations.best_practices import (
     HeterogenousCompareViolation,
@@ -41,7 +44,7 @@ from wemake_python_styleguide.visitors.decorators import alias
 def _is_correct_len(sign: ast.cmpop, comparator: ast.AST) -> bool:
     """This is a helper function to tell what calls to ``len()`` are valid."""
     if isinstance(comparator, (ast.Num, ast.UnaryOp)):
-        numeric_value = ast.literal_eval(comparator)
+        numeric_value = nodes.get_literal_value(comparator)
         if numeric_value == 0:
             return False
         if numeric_value == 1:
@@ -298,7 +301,9 @@ class WrongConditionalVisitor(BaseNodeVisitor):
         if len(targets) != 1:
             return None
 
-        return astor.to_source(targets[0]).strip()
+        return (
+            get_dotted_name(targets[0]) or astor.to_source(targets[0]).strip()
+        )
 
     def _check_constant_condition(self, node: AnyIf) -> None:
         real_node = operators.unwrap_unary_node(node.test)
@@ -58,7 +58,7 @@ class ModuleMembersVisitor(BaseNodeVisitor):
 
     def _check_members_count(self, node: ModuleMembers) -> None:
         """This method increases the number of module members."""
-        is_real_method = is_method(getattr(node, 'function_type', None))
+        is_real_method = is_method(getattr(node, 'wps_function_type', None))
 
         if isinstance(get_parent(node), ast.Module) and not is_real_method:
             self._public_items_count += 1
@@ -2,19 +2,20 @@
 
 import ast
 from collections import defaultdict
-from typing import ClassVar, DefaultDict, List, Union
+from typing import ClassVar, DefaultDict, Union
 
 import astor
 from typing_extensions import final
 
 from wemake_python_styleguide.compat.aliases import FunctionNodes
 from wemake_python_styleguide.constants import SPECIAL_ARGUMENT_NAMES_WHITELIST
-from wemake_python_styleguide.logic import nodes, walk
+from wemake_python_styleguide.logic import hashing, nodes, walk
 from wemake_python_styleguide.types import AnyNodes
 from wemake_python_styleguide.violations import complexity
 from wemake_python_styleguide.visitors import base
 
-_Expressions = DefaultDict[str, List[ast.AST]]
+#: Usage counts, keys hold the first node of each expression.
+_Expressions = DefaultDict[hashing.NodeKey, int]
 _FunctionExpressions = DefaultDict[ast.AST, _Expressions]
 _Annotated = Union[ast.arg, ast.AnnAssign]
 
@@ -63,6 +64,9 @@ class StringOveruseVisitor(base.BaseNodeVisitor):
 class ExpressionOveruseVisitor(base.BaseNodeVisitor):
     """Finds overused expressions."""
 
+    #: Hashes and counts every expression of a module and of each function.
+    cost_tier: ClassVar[str] = 'expensive'
+
     _expressions: ClassVar[AnyNodes] = (
         # We do not treat `ast.Attribute`s as expressions
         # because they are too widely used. That's a compromise.
@@ -91,9 +95,9 @@ class ExpressionOveruseVisitor(base.BaseNodeVisitor):
     def __init__(self, *args, **kwargs) -> None:
         """We need to track expression usage in functions and modules."""
         super().__init__(*args, **kwargs)
-        self._module_expressions: _Expressions = defaultdict(list)
+        self._module_expressions: _Expressions = defaultdict(int)
         self._function_expressions: _FunctionExpressions = defaultdict(
-            lambda: defaultdict(list),
+            lambda: defaultdict(int),
         )
 
     def visit(self, node: ast.AST) -> None:
@@ -122,14 +126,12 @@ class ExpressionOveruseVisitor(base.BaseNodeVisitor):
         if any(ignore(node) for ignore in ignore_predicates):
             return
 
-        source_code = astor.to_source(node).strip()
-        self._module_expressions[source_code].append(node)
+        expression = hashing.NodeKey(node)
+        self._module_expressions[expression] += 1
 
         maybe_function = walk.get_closest_parent(node, FunctionNodes)
         if maybe_function is not None:
-            self._function_expressions[maybe_function][source_code].append(
-                node,
-            )
+            self._function_expressions[maybe_function][expression] += 1
 
     def _is_decorator(
         self,
@@ -165,25 +167,30 @@ class ExpressionOveruseVisitor(base.BaseNodeVisitor):
         return False
 
     def _post_visit(self) -> None:
-        for mod_source, module_nodes in self._module_expressions.items():
-            if len(module_nodes) > self.options.max_module_expressions:
+        all_expressions = [
+            (self._module_expressions, self.options.max_module_expressions),
+            *(
+                (function_expressions, self.options.max_function_expressions)
+                for function_expressions in self._function_expressions.values()
+            ),
+        ]
+
+        for expressions, max_usages in all_expressions:
+            for expression, usages in expressions.items():
+                if usages <= max_usages:
+                    continue
+
+                # We render source code only for the reported expressions:
                 self.add_violation(
                     complexity.OverusedExpressionViolation(
-                        module_nodes[0],
-                        text=self._msg.format(mod_source, len(module_nodes)),
+                        expression.node,
+                        text=self._msg.format(
+                            astor.to_source(expression.node).strip(),
+                            usages,
+                        ),
                     ),
                 )
 
-        for function_contexts in self._function_expressions.values():
-            for source, function_nodes in function_contexts.items():
-                if len(function_nodes) > self.options.max_function_expressions:
-                    self.add_violation(
-                        complexity.OverusedExpressionViolation(
-                            function_nodes[0],
-                            text=self._msg.format(source, len(function_nodes)),
-                        ),
-                    )
-
 
 def _is_class_context(node: ast.AST) -> bool:
     return isinstance(nodes.get_context(node), ast.ClassDef)
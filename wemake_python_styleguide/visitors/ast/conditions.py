@@ -8,9 +8,10 @@ from typing import ClassVar, DefaultDict, Dict, List, Set, Type
 import astor
 from typing_extensions import final
 
+from wemake_python_styleguide.logic import hashing, nodes
 from wemake_python_styleguide.logic.compares import CompareBounds
 from wemake_python_styleguide.logic.functions import given_function_called
-from wemake_python_styleguide.logic.nodes import get_parent
+from wemake_python_styleguide.logic.naming.name_nodes import get_dotted_name
 from wemake_python_styleguide.types import AnyIf, AnyNodes
 from wemake_python_styleguide.violations.best_practices import (
     SameElementsInConditionViolation,
@@ -40,7 +41,10 @@ def _duplicated_isinstance_call(node: ast.BoolOp) -> List[str]:
         if not given_function_called(call, {'isinstance'}):
             continue
 
-        isinstance_object = astor.to_source(call.args[0]).strip()
+        isinstance_object = (
+            get_dotted_name(call.args[0]) or
+            astor.to_source(call.args[0]).strip()
+        )
         counter[isinstance_object] += 1
 
     return [
@@ -161,7 +165,7 @@ class BooleanConditionVisitor(BaseNodeVisitor):
     def _get_all_names(
         self,
         node: ast.BoolOp,
-    ) -> List[str]:
+    ) -> List[hashing.NodeKey]:
         # We need to make sure that we do not visit
         # one chained `BoolOp` elements twice:
         self._same_nodes.append(node)
@@ -171,7 +175,7 @@ class BooleanConditionVisitor(BaseNodeVisitor):
             if isinstance(operand, ast.BoolOp):
                 names.extend(self._get_all_names(operand))
             else:
-                names.append(astor.to_source(operand))
+                names.append(hashing.NodeKey(operand))
         return names
 
     def _check_same_elements(self, node: ast.BoolOp) -> None:
@@ -226,7 +230,10 @@ class ImplicitBoolPatternsVisitor(BaseNodeVisitor):
             if not isinstance(compare.ops[0], allowed_ops[node.op.__class__]):
                 return
 
-            variables.append({astor.to_source(compare.left)})
+            variables.append({
+                get_dotted_name(compare.left) or
+                astor.to_source(compare.left),
+            })
 
         for duplicate in _get_duplicate_names(variables):
             self.add_violation(
@@ -234,7 +241,7 @@ class ImplicitBoolPatternsVisitor(BaseNodeVisitor):
             )
 
     def _check_implicit_ternary(self, node: ast.BoolOp) -> None:
-        if isinstance(get_parent(node), ast.BoolOp):
+        if isinstance(nodes.get_parent(node), ast.BoolOp):
             return
 
         if not isinstance(node.op, ast.Or):
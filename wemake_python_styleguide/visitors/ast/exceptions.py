@@ -7,6 +7,7 @@ from typing import ClassVar, List, Tuple
 import astor
 from typing_extensions import final
 
+from wemake_python_styleguide.logic import hashing
 from wemake_python_styleguide.logic.walk import is_contained
 from wemake_python_styleguide.types import AnyNodes
 from wemake_python_styleguide.violations.best_practices import (
@@ -100,20 +101,21 @@ class WrongTryExceptVisitor(BaseNodeVisitor):
             self.add_violation(BaseExceptionViolation(node))
 
     def _check_duplicate_exceptions(self, node: ast.Try) -> None:
-        exceptions: List[str] = []
+        exceptions: List[hashing.NodeKey] = []
         for exc_handler in node.handlers:
             # There might be complex things hidden inside an exception type,
-            # so we want to get the string representation of it:
+            # so we compare their structures:
             if isinstance(exc_handler.type, ast.Name):
-                exceptions.append(astor.to_source(exc_handler.type).strip())
+                exceptions.append(hashing.NodeKey(exc_handler.type))
             elif isinstance(exc_handler.type, ast.Tuple):
                 exceptions.extend([
-                    astor.to_source(node).strip()
+                    hashing.NodeKey(node)
                     for node in exc_handler.type.elts
                 ])
 
-        for exc_name, count in Counter(exceptions).items():
+        for exception, count in Counter(exceptions).items():
             if count > 1:
+                exc_name = astor.to_source(exception.node).strip()
                 self.add_violation(
                     DuplicateExceptionViolation(node, text=exc_name),
                 )
@@ -8,7 +8,7 @@ from typing_extensions import final
 
 from wemake_python_styleguide.compat.aliases import FunctionNodes
 from wemake_python_styleguide.logic.exceptions import get_exception_name
-from wemake_python_styleguide.logic.nodes import get_context, get_parent
+from wemake_python_styleguide.logic.nodes import get_context_nodes, get_parent
 from wemake_python_styleguide.logic.variables import (
     is_valid_block_variable_definition,
 )
@@ -212,6 +212,9 @@ class WrongContextManagerVisitor(BaseNodeVisitor):
 class ConsistentReturningVariableVisitor(BaseNodeVisitor):
     """Finds variables that are only used in `return` statements."""
 
+    #: Compares each ``return`` with all assigns and names of a function.
+    cost_tier: ClassVar[str] = 'expensive'
+
     _checking_nodes: ClassVar[AnyNodes] = (
         ast.Assign,
         ast.AnnAssign,
@@ -271,22 +274,12 @@ class ConsistentReturningVariableVisitor(BaseNodeVisitor):
                     return_sub_nodes[variable_name] = sub_node
         return returns, return_sub_nodes
 
-    def _is_correct_return_node(
-        self,
-        node: AnyFunctionDef,
-        sub_node: ast.AST,
-    ) -> bool:
-        if get_context(sub_node) != node:
-            return False
-        return isinstance(sub_node, self._checking_nodes)
-
     def _check_variables_for_return(self, node: AnyFunctionDef) -> None:
-        nodes = list(
-            filter(
-                lambda sub: self._is_correct_return_node(node, sub),
-                ast.walk(node),
-            ),
-        )
+        nodes = [
+            sub_node
+            for sub_node in get_context_nodes(node)
+            if isinstance(sub_node, self._checking_nodes)
+        ]
         assign = self._get_assign_node_variables(nodes)
         names = self._get_name_nodes_variable(nodes)
         returns, return_sub_nodes = self._get_return_node_variables(nodes)
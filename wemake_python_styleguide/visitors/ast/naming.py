@@ -3,7 +3,18 @@
 import ast
 import itertools
 from collections import Counter
-from typing import Callable, Iterable, List, Optional, Tuple, Union, cast
+from functools import lru_cache
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from typing_extensions import final
 
@@ -11,6 +22,7 @@ from wemake_python_styleguide.compat.aliases import AssignNodes
 from wemake_python_styleguide.compat.functions import get_assign_targets
 from wemake_python_styleguide.constants import (
     MODULE_METADATA_VARIABLES_BLACKLIST,
+    NAMING_CACHE_SIZE,
     SPECIAL_ARGUMENT_NAMES_WHITELIST,
     VARIABLE_NAMES_BLACKLIST,
 )
@@ -28,17 +40,14 @@ from wemake_python_styleguide.types import (
     AnyImport,
     ConfigurationOptions,
 )
-from wemake_python_styleguide.violations import base, naming
-from wemake_python_styleguide.violations.best_practices import (
-    ReassigningVariableToItselfViolation,
-    WrongModuleMetadataViolation,
-)
+from wemake_python_styleguide.violations import base, best_practices, naming
 from wemake_python_styleguide.visitors.base import BaseNodeVisitor
 from wemake_python_styleguide.visitors.decorators import alias
 
 VariableDef = Union[ast.Name, ast.Attribute, ast.ExceptHandler]
 AssignTargets = List[ast.expr]
 AssignTargetsNameList = List[Union[str, Tuple[str]]]
+_NamingVerdicts = Tuple[Type[base.BaseViolation], ...]
 
 
 @final
@@ -61,22 +70,14 @@ class _NameValidator(object):
         *,
         is_first_argument: bool = False,
     ) -> None:
-        if logical.is_wrong_name(name, VARIABLE_NAMES_BLACKLIST):
-            self._error_callback(
-                naming.WrongVariableNameViolation(node, text=name),
-            )
-
-        if not is_first_argument:
-            if logical.is_wrong_name(name, SPECIAL_ARGUMENT_NAMES_WHITELIST):
-                self._error_callback(
-                    naming.ReservedArgumentNameViolation(node, text=name),
-                )
-
-        if logical.does_contain_unicode(name):
-            self._error_callback(naming.UnicodeNameViolation(node, text=name))
-
-        self._ensure_length(node, name)
-        self._ensure_underscores(node, name)
+        verdicts = self._get_verdicts(
+            name,
+            is_first_argument=is_first_argument,
+            min_length=self._options.min_name_length,
+            max_length=self._options.max_name_length,
+        )
+        for violation_class in verdicts:
+            self._error_callback(violation_class(node, text=name))
 
     def check_function_signature(self, node: AnyFunctionDefAndLambda) -> None:
         arguments = functions.get_all_arguments(node)
@@ -109,42 +110,64 @@ class _NameValidator(object):
                     naming.UpperCaseAttributeViolation(target, text=target.id),
                 )
 
-    def _ensure_underscores(self, node: ast.AST, name: str):
+    @classmethod
+    @lru_cache(maxsize=NAMING_CACHE_SIZE)
+    def _get_verdicts(
+        cls,
+        name: str,
+        *,
+        is_first_argument: bool,
+        min_length: int,
+        max_length: int,
+    ) -> _NamingVerdicts:
+        """
+        Returns violation classes for a given name.
+
+        The same names are used again and again: ``self``, ``result``, ``i``.
+        So, we cache verdicts by the name and the options we use.
+        This cache is shared between all modules checked in a process.
+        """
+        verdicts: List[Type[base.BaseViolation]] = []
+        if logical.is_wrong_name(name, VARIABLE_NAMES_BLACKLIST):
+            verdicts.append(naming.WrongVariableNameViolation)
+
+        is_reserved = logical.is_wrong_name(
+            name, SPECIAL_ARGUMENT_NAMES_WHITELIST,
+        )
+        if is_reserved and not is_first_argument:
+            verdicts.append(naming.ReservedArgumentNameViolation)
+
+        if logical.does_contain_unicode(name):
+            verdicts.append(naming.UnicodeNameViolation)
+
+        if logical.is_too_short_name(name, min_length=min_length):
+            verdicts.append(naming.TooShortNameViolation)
+
+        if logical.is_too_long_name(name, max_length=max_length):
+            verdicts.append(naming.TooLongNameViolation)
+
+        verdicts.extend(cls._get_pattern_verdicts(name))
+        return tuple(verdicts)
+
+    @classmethod
+    def _get_pattern_verdicts(
+        cls,
+        name: str,
+    ) -> Iterator[Type[base.BaseViolation]]:
         if access.is_private(name):
-            self._error_callback(
-                naming.PrivateNameViolation(node, text=name),
-            )
+            yield naming.PrivateNameViolation
 
         if logical.does_contain_underscored_number(name):
-            self._error_callback(
-                naming.UnderscoredNumberNameViolation(node, text=name),
-            )
+            yield naming.UnderscoredNumberNameViolation
 
         if logical.does_contain_consecutive_underscores(name):
-            self._error_callback(
-                naming.ConsecutiveUnderscoresInNameViolation(
-                    node, text=name,
-                ),
-            )
+            yield naming.ConsecutiveUnderscoresInNameViolation
 
         if builtins.is_wrong_alias(name):
-            self._error_callback(
-                naming.TrailingUnderscoreViolation(node, text=name),
-            )
+            yield naming.TrailingUnderscoreViolation
 
         if access.is_unused(name) and len(name) > 1:
-            self._error_callback(
-                naming.WrongUnusedVariableNameViolation(node, text=name),
-            )
-
-    def _ensure_length(self, node: ast.AST, name: str) -> None:
-        min_length = self._options.min_name_length
-        if logical.is_too_short_name(name, min_length=min_length):
-            self._error_callback(naming.TooShortNameViolation(node, text=name))
-
-        max_length = self._options.max_name_length
-        if logical.is_too_long_name(name, max_length=max_length):
-            self._error_callback(naming.TooLongNameViolation(node, text=name))
+            yield naming.WrongUnusedVariableNameViolation
 
 
 @final
@@ -283,7 +306,9 @@ class WrongModuleMetadataVisitor(BaseNodeVisitor):
 
             if target_node.id in MODULE_METADATA_VARIABLES_BLACKLIST:
                 self.add_violation(
-                    WrongModuleMetadataViolation(node, text=target_node.id),
+                    best_practices.WrongModuleMetadataViolation(
+                        node, text=target_node.id,
+                    ),
                 )
 
 
@@ -321,7 +346,9 @@ class WrongVariableAssignmentVisitor(BaseNodeVisitor):
         for var_name, var_value in itertools.zip_longest(names, var_values):
             if var_name == var_value:
                 self.add_violation(
-                    ReassigningVariableToItselfViolation(node, text=var_name),
+                    best_practices.ReassigningVariableToItselfViolation(
+                        node, text=var_name,
+                    ),
                 )
 
     def _check_unique_assignment(
@@ -332,7 +359,9 @@ class WrongVariableAssignmentVisitor(BaseNodeVisitor):
         for used_name, count in Counter(names).items():
             if count > 1:
                 self.add_violation(
-                    ReassigningVariableToItselfViolation(node, text=used_name),
+                    best_practices.ReassigningVariableToItselfViolation(
+                        node, text=used_name,
+                    ),
                 )
 
 
@@ -63,16 +63,25 @@ Reference
 """
 
 import ast
+import inspect
 import tokenize
-from typing import List, Sequence, Type
+from typing import Callable, ClassVar, List, Optional, Sequence, Type
 
 from typing_extensions import final
 
 from wemake_python_styleguide import constants
+from wemake_python_styleguide.compat.constants import PY38
+from wemake_python_styleguide.compat.nodes import Constant
+from wemake_python_styleguide.compat.routing import route_constant
+from wemake_python_styleguide.logic.comments import Comment, get_comments
 from wemake_python_styleguide.logic.filenames import get_stem
+from wemake_python_styleguide.logic.project.index import ProjectIndex
 from wemake_python_styleguide.types import ConfigurationOptions
 from wemake_python_styleguide.violations.base import BaseViolation
 
+#: Tells whether a violation should be reported or silently dropped.
+ViolationFilter = Callable[[BaseViolation], bool]
+
 
 class BaseVisitor(object):
     """
@@ -83,18 +92,30 @@ class BaseVisitor(object):
         filename: filename passed by ``flake8``, each visitor has a file name.
         violations: list of :term:`violations <violation>`
         for the specific visitor.
+        project_index: index of all modules in a project,
+        it is ``None`` unless ``--project-index`` is used.
+        cost_tier: how much time the visitor takes, ``cheap`` visitors
+        take about the same time as a single traversal,
+        ``expensive`` ones grow faster than the module does.
+        ``--wps-mode=fast`` only runs ``cheap`` visitors.
 
     """
 
+    cost_tier: ClassVar[str] = 'cheap'
+
     def __init__(
         self,
         options: ConfigurationOptions,
         filename: str = constants.STDIN,
+        violation_filter: Optional[ViolationFilter] = None,
+        project_index: Optional[ProjectIndex] = None,
     ) -> None:
         """Creates base visitor instance."""
         self.options = options
         self.filename = filename
         self.violations: List[BaseViolation] = []
+        self.project_index = project_index
+        self._violation_filter = violation_filter
 
     @classmethod
     def from_checker(
@@ -111,12 +132,23 @@ class BaseVisitor(object):
         parameters from checker and then run
         its constructor with these parameters.
         """
-        return cls(options=checker.options, filename=checker.filename)
+        return cls(
+            options=checker.options,
+            filename=checker.filename,
+            violation_filter=checker.violation_filter,
+            project_index=checker.project_index,
+        )
 
     @final
     def add_violation(self, violation: BaseViolation) -> None:
-        """Adds violation to the visitor."""
-        self.violations.append(violation)
+        """
+        Adds violation to the visitor.
+
+        Violations rejected by ``violation_filter`` are dropped right away.
+        So, we never format messages for violations nobody will see.
+        """
+        if self._violation_filter is None or self._violation_filter(violation):
+            self.violations.append(violation)
 
     def run(self) -> None:
         """
@@ -169,9 +201,21 @@ class BaseNodeVisitor(ast.NodeVisitor, BaseVisitor):
         return cls(
             options=checker.options,
             filename=checker.filename,
+            violation_filter=checker.violation_filter,
+            project_index=checker.project_index,
             tree=checker.tree,
         )
 
+    if PY38:  # pragma: no cover  # noqa: WPS604
+        def visit_Constant(self, node: Constant) -> None:  # noqa: N802
+            """
+            Routes python3.8+ constants to their specific handlers.
+
+            So, visitors can still use ``visit_Str``, ``visit_Num``,
+            and other handlers for constants without any slow fallbacks.
+            """
+            route_constant(self, node)
+
     @final
     def run(self) -> None:
         """Recursively visits all ``ast`` nodes. Then executes post hook."""
@@ -221,18 +265,37 @@ class BaseTokenVisitor(BaseVisitor):
 
     Attributes:
         file_tokens: ``tokenize.TokenInfo`` sequence to be checked.
+        comments: classified comments from the same tokens,
+        they are collected once per module by the checker.
 
     """
 
+    #: Visitors without token handlers only check comments.
+    _visits_tokens: ClassVar[bool] = False
+
     def __init__(
         self,
         options: ConfigurationOptions,
         file_tokens: Sequence[tokenize.TokenInfo],
+        comments: Optional[Sequence[Comment]] = None,
         **kwargs,
     ) -> None:
         """Creates new ``tokenize`` based visitor instance."""
         super().__init__(options, **kwargs)
         self.file_tokens = file_tokens
+        self.comments = (
+            get_comments(file_tokens) if comments is None else comments
+        )
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Finds out whether the new visitor has any token handlers."""
+        super().__init_subclass__(**kwargs)  # type: ignore
+        cls._visits_tokens = (  # noqa: WPS601
+            cls.visit is not BaseTokenVisitor.visit or any(
+                member_name.startswith('visit_')
+                for member_name, _ in inspect.getmembers(cls)
+            )
+        )
 
     @final
     @classmethod
@@ -244,7 +307,10 @@ class BaseTokenVisitor(BaseVisitor):
         return cls(
             options=checker.options,
             filename=checker.filename,
+            violation_filter=checker.violation_filter,
+            project_index=checker.project_index,
             file_tokens=checker.file_tokens,
+            comments=checker.comments,
         )
 
     def visit(self, token: tokenize.TokenInfo) -> None:
@@ -271,7 +337,13 @@ class BaseTokenVisitor(BaseVisitor):
 
     @final
     def run(self) -> None:
-        """Visits all token types that have a handler method."""
-        for token in self.file_tokens:
-            self.visit(token)
+        """
+        Visits all token types that have a handler method.
+
+        We do not iterate over tokens for visitors without handlers,
+        they only check ``comments`` in ``_post_visit()``.
+        """
+        if self._visits_tokens:
+            for token in self.file_tokens:
+                self.visit(token)
         self._post_visit()
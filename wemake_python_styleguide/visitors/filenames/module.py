@@ -1,9 +1,16 @@
 # -*- coding: utf-8 -*-
 
+from functools import lru_cache
+from typing import Iterator, Tuple, Type, Union
+
 from typing_extensions import final
 
 from wemake_python_styleguide import constants
 from wemake_python_styleguide.logic.naming import access, logical
+from wemake_python_styleguide.violations.base import (
+    MaybeASTViolation,
+    SimpleViolation,
+)
 from wemake_python_styleguide.violations.naming import (
     ConsecutiveUnderscoresInNameViolation,
     PrivateNameViolation,
@@ -17,6 +24,8 @@ from wemake_python_styleguide.violations.naming import (
 )
 from wemake_python_styleguide.visitors.base import BaseFilenameVisitor
 
+_ModuleNameVerdict = Type[Union[SimpleViolation, MaybeASTViolation]]
+
 
 @final
 class WrongModuleNameVisitor(BaseFilenameVisitor):
@@ -36,40 +45,72 @@ class WrongModuleNameVisitor(BaseFilenameVisitor):
             TooLongNameViolation
 
         """
-        self._check_module_name()
-        self._check_module_name_length()
-        self._check_module_name_pattern()
-
-    def _check_module_name(self) -> None:
-        if logical.is_wrong_name(self.stem, constants.MODULE_NAMES_BLACKLIST):
-            self.add_violation(WrongModuleNameViolation())
-
-        if access.is_magic(self.stem):
-            if self.stem not in constants.MAGIC_MODULE_NAMES_WHITELIST:
-                self.add_violation(WrongModuleMagicNameViolation())
-
-        if access.is_private(self.stem):
-            self.add_violation(PrivateNameViolation(text=self.stem))
-
-        if logical.does_contain_unicode(self.stem):
-            self.add_violation(UnicodeNameViolation(text=self.stem))
-
-    def _check_module_name_length(self) -> None:
-        min_length = self.options.min_name_length
-        if logical.is_too_short_name(self.stem, min_length=min_length):
-            self.add_violation(TooShortNameViolation(text=self.stem))
-        elif not constants.MODULE_NAME_PATTERN.match(self.stem):
-            self.add_violation(WrongModuleNamePatternViolation())
-
-        max_length = self.options.max_name_length
-        if logical.is_too_long_name(self.stem, max_length=max_length):
-            self.add_violation(TooLongNameViolation(text=self.stem))
-
-    def _check_module_name_pattern(self) -> None:
-        if logical.does_contain_consecutive_underscores(self.stem):
-            self.add_violation(
-                ConsecutiveUnderscoresInNameViolation(text=self.stem),
-            )
-
-        if logical.does_contain_underscored_number(self.stem):
-            self.add_violation(UnderscoredNumberNameViolation(text=self.stem))
+        verdicts = self._get_verdicts(
+            self.stem,
+            min_length=self.options.min_name_length,
+            max_length=self.options.max_name_length,
+        )
+        for violation_class in verdicts:
+            self.add_violation(violation_class(text=self.stem))
+
+    @classmethod
+    @lru_cache(maxsize=constants.NAMING_CACHE_SIZE)
+    def _get_verdicts(
+        cls,
+        stem: str,
+        *,
+        min_length: int,
+        max_length: int,
+    ) -> Tuple[_ModuleNameVerdict, ...]:
+        """
+        Returns violation classes for a given module name.
+
+        Module names like ``__init__`` or ``models`` repeat a lot.
+        So, we cache verdicts by the name and the options we use.
+        """
+        return (
+            *cls._check_module_name(stem),
+            *cls._check_module_name_length(stem, min_length, max_length),
+            *cls._check_module_name_pattern(stem),
+        )
+
+    @classmethod
+    def _check_module_name(cls, stem: str) -> Iterator[_ModuleNameVerdict]:
+        if logical.is_wrong_name(stem, constants.MODULE_NAMES_BLACKLIST):
+            yield WrongModuleNameViolation
+
+        if access.is_magic(stem):
+            if stem not in constants.MAGIC_MODULE_NAMES_WHITELIST:
+                yield WrongModuleMagicNameViolation
+
+        if access.is_private(stem):
+            yield PrivateNameViolation
+
+        if logical.does_contain_unicode(stem):
+            yield UnicodeNameViolation
+
+    @classmethod
+    def _check_module_name_length(
+        cls,
+        stem: str,
+        min_length: int,
+        max_length: int,
+    ) -> Iterator[_ModuleNameVerdict]:
+        if logical.is_too_short_name(stem, min_length=min_length):
+            yield TooShortNameViolation
+        elif not constants.MODULE_NAME_PATTERN.match(stem):
+            yield WrongModuleNamePatternViolation
+
+        if logical.is_too_long_name(stem, max_length=max_length):
+            yield TooLongNameViolation
+
+    @classmethod
+    def _check_module_name_pattern(
+        cls,
+        stem: str,
+    ) -> Iterator[_ModuleNameVerdict]:
+        if logical.does_contain_consecutive_underscores(stem):
+            yield ConsecutiveUnderscoresInNameViolation
+
+        if logical.does_contain_underscored_number(stem):
+            yield UnderscoredNumberNameViolation
@@ -18,10 +18,9 @@ That's how a basic ``comment`` type token looks like:
 All comments have the same type.
 """
 
-import re
 import tokenize
-from typing import ClassVar, FrozenSet
-from typing.re import Pattern
+from collections import defaultdict
+from typing import ClassVar, DefaultDict, FrozenSet
 
 from typing_extensions import final
 
@@ -29,7 +28,7 @@ from wemake_python_styleguide.constants import (
     MAX_NO_COVER_COMMENTS,
     MAX_NOQA_COMMENTS,
 )
-from wemake_python_styleguide.logic.tokens import get_comment_text
+from wemake_python_styleguide.logic import comments
 from wemake_python_styleguide.violations.best_practices import (
     OveruseOfNoCoverCommentViolation,
     OveruseOfNoqaCommentViolation,
@@ -46,82 +45,45 @@ from wemake_python_styleguide.visitors.base import BaseTokenVisitor
 class WrongCommentVisitor(BaseTokenVisitor):
     """Checks comment tokens."""
 
-    _no_cover: ClassVar[Pattern] = re.compile(r'^pragma:\s+no\s+cover')
-    _noqa_check: ClassVar[Pattern] = re.compile(r'^noqa:?($|[A-WPS\d\,\s]+)')
-    _type_check: ClassVar[Pattern] = re.compile(
-        r'^type:\s?([\w\d\[\]\'\"\.]+)$',
-    )
-
-    def __init__(self, *args, **kwargs) -> None:
-        """Initializes a counter."""
-        super().__init__(*args, **kwargs)
-        self._noqa_count = 0
-        self._no_cover_count = 0
-
-    def visit_comment(self, token: tokenize.TokenInfo) -> None:
+    def _post_visit(self) -> None:
         """
-        Performs comment checks.
+        Performs comment checks, comments are already classified.
 
         Raises:
             OveruseOfNoqaCommentViolation
+            OveruseOfNoCoverCommentViolation
             WrongDocCommentViolation
             WrongMagicCommentViolation
 
         """
-        self._check_noqa(token)
-        self._check_typed_ast(token)
-        self._check_empty_doc_comment(token)
-        self._check_cover_comments(token)
-
-    def _check_noqa(self, token: tokenize.TokenInfo) -> None:
-        comment_text = get_comment_text(token)
-        match = self._noqa_check.match(comment_text)
-        if not match:
-            return
-
-        self._noqa_count += 1
-        excludes = match.groups()[0].strip()
-        if not excludes:
-            # We can not pass the actual line here,
-            # since it will be ignored due to `# noqa` comment:
-            self.add_violation(WrongMagicCommentViolation(text=comment_text))
+        kinds: DefaultDict[str, int] = defaultdict(int)
+        for comment in self.comments:
+            kinds[comment.kind] += 1
+            self._check_comment(comment)
 
-    def _check_typed_ast(self, token: tokenize.TokenInfo) -> None:
-        comment_text = get_comment_text(token)
-        match = self._type_check.match(comment_text)
-        if not match:
-            return
-
-        declared_type = match.groups()[0].strip()
-        if declared_type != 'ignore':
+        if kinds[comments.NOQA] > MAX_NOQA_COMMENTS:
             self.add_violation(
-                WrongMagicCommentViolation(token, text=comment_text),
+                OveruseOfNoqaCommentViolation(text=str(kinds[comments.NOQA])),
             )
-
-    def _check_empty_doc_comment(self, token: tokenize.TokenInfo) -> None:
-        if get_comment_text(token) == ':':
-            self.add_violation(WrongDocCommentViolation(token))
-
-    def _check_cover_comments(self, token: tokenize.TokenInfo) -> None:
-        comment_text = get_comment_text(token)
-        match = self._no_cover.match(comment_text)
-        if not match:
-            return
-
-        self._no_cover_count += 1
-
-    def _post_visit(self) -> None:
-        if self._noqa_count > MAX_NOQA_COMMENTS:
-            self.add_violation(
-                OveruseOfNoqaCommentViolation(text=str(self._noqa_count)),
-            )
-        if self._no_cover_count > MAX_NO_COVER_COMMENTS:
+        if kinds[comments.NO_COVER] > MAX_NO_COVER_COMMENTS:
             self.add_violation(
                 OveruseOfNoCoverCommentViolation(
-                    text=str(self._no_cover_count),
+                    text=str(kinds[comments.NO_COVER]),
                 ),
             )
 
+    def _check_comment(self, comment: comments.Comment) -> None:
+        if comment.kind == comments.NOQA and not comment.argument:
+            # We can not pass the actual line here,
+            # since it will be ignored due to `# noqa` comment:
+            self.add_violation(WrongMagicCommentViolation(text=comment.text))
+        elif comment.kind == comments.TYPE and comment.argument != 'ignore':
+            self.add_violation(
+                WrongMagicCommentViolation(comment.token, text=comment.text),
+            )
+        elif comment.kind == comments.DOC:
+            self.add_violation(WrongDocCommentViolation(comment.token))
+
 
 @final
 class FileMagicCommentsVisitor(BaseTokenVisitor):
@@ -133,15 +95,18 @@ class FileMagicCommentsVisitor(BaseTokenVisitor):
         tokenize.ENDMARKER,
     ))
 
-    def visit_comment(self, token: tokenize.TokenInfo) -> None:
+    def _post_visit(self) -> None:
         """
         Checks special comments that are magic per each file.
 
+        Only the first comment can be magic, so we do not scan all tokens.
+
         Raises:
             EmptyLineAfterCoddingViolation
 
         """
-        self._check_empty_line_after_codding(token)
+        if self.comments:
+            self._check_empty_line_after_codding(self.comments[0].token)
 
     def _offset_for_comment_line(self, token: tokenize.TokenInfo) -> int:
         if token.exact_type == tokenize.COMMENT:
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+"""
+Watch mode that checks modified files in a single warm process.
+
+.. code:: bash
+
+    wps-watch --select WPS wemake_python_styleguide tests
+
+It takes the same arguments and configuration as ``flake8`` does.
+Options and plugins are loaded once.
+
+Files are polled for changes of their modification time and size
+every :data:`POLL_INTERVAL` seconds.
+Only changed files are checked again, results of other files are reused.
+Each report is written from scratch with
+:class:`~wemake_python_styleguide.formatter.WemakeFormatter`,
+so violations are grouped per file.
+
+.. autoclass:: Watcher
+   :members:
+
+.. autofunction:: main
+
+"""
+
+import os
+import sys
+import time
+from operator import itemgetter
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from flake8 import utils
+from flake8.checker import FileChecker
+from flake8.main.application import Application
+from flake8.style_guide import StyleGuideManager
+from typing_extensions import Final, final
+
+from wemake_python_styleguide.formatter import WemakeFormatter
+
+#: Seconds to wait between checks of files for changes.
+POLL_INTERVAL: Final = 1.0
+
+#: Clears the terminal and moves the cursor to the top.
+_CLEAR_SCREEN: Final = '\x1b[2J\x1b[H'
+
+#: Modification time and size of a file.
+_FileState = Tuple[int, int]
+
+#: Results of ``flake8``: code, line, column, text, and physical line.
+_Result = Tuple[str, int, int, str, Optional[str]]
+
+
+@final
+class Watcher(object):
+    """Keeps results of all files and checks the changed ones."""
+
+    def __init__(self, argv: Sequence[str]) -> None:
+        """Parses ``flake8`` arguments and configuration, loads plugins."""
+        self._app = Application()
+        self._app.initialize(list(argv))
+        self._states: Dict[str, _FileState] = {}
+        self._file_results: Dict[str, List[_Result]] = {}
+
+    def check(self) -> List[str]:
+        """Checks changed and new files, returns them with removed ones."""
+        states = dict(self._find_files())
+        changed_files = sorted(
+            filename
+            for filename in states.keys() | self._states.keys()
+            if states.get(filename) != self._states.get(filename)
+        )
+
+        self._states = states
+        for filename in changed_files:
+            if filename in states:
+                self._file_results[filename] = self._check_file(filename)
+            else:
+                self._file_results.pop(filename)
+        return changed_files
+
+    def report(self) -> None:
+        """Reports results of all files from scratch."""
+        formatter = WemakeFormatter(self._app.options)
+        guide = StyleGuideManager(self._app.options, formatter)
+
+        formatter.start()
+        for filename in sorted(self._file_results):
+            self._report_file(guide, filename)
+        if self._app.options.statistics:
+            formatter.show_statistics(guide.stats)
+        formatter.stop()
+
+    def _find_files(self) -> Iterator[Tuple[str, _FileState]]:
+        is_excluded = self._app.file_checker_manager.is_path_excluded
+        for argument in self._app.args or ['.']:
+            for filename in utils.filenames_from(argument, is_excluded):
+                is_matched = filename == argument or utils.fnmatch(
+                    filename, self._app.options.filename,
+                )
+                file_state = _get_state(filename)
+                if is_matched and file_state is not None:
+                    yield filename, file_state
+
+    def _check_file(self, filename: str) -> List[_Result]:
+        file_checker = FileChecker(
+            filename,
+            self._app.check_plugins.to_dictionary(),
+            self._app.options,
+        )
+        file_results = file_checker.run_checks()[1]
+        return sorted(file_results, key=itemgetter(1, 2))
+
+    def _report_file(self, guide: StyleGuideManager, filename: str) -> None:
+        with guide.processing_file(filename):
+            for file_result in self._file_results[filename]:
+                guide.handle_error(
+                    file_result[0], filename, *file_result[1:],
+                )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Checks files till it is interrupted, used as ``wps-watch``."""
+    watcher = Watcher(sys.argv[1:] if argv is None else argv)
+    try:
+        while True:
+            if watcher.check():
+                _clear_screen()
+                watcher.report()
+            time.sleep(POLL_INTERVAL)
+    except KeyboardInterrupt:
+        return
+
+
+def _get_state(filename: str) -> Optional[_FileState]:
+    try:
+        file_stat = os.stat(filename)
+    except OSError:  # it was removed after we have found it
+        return None
+    return file_stat.st_mtime_ns, file_stat.st_size
+
+
+def _clear_screen() -> None:
+    if sys.stdout.isatty():
+        sys.stdout.write(_CLEAR_SCREEN)
+        sys.stdout.flush()